@@ -0,0 +1,94 @@
+"""
+Access log - mỗi request một dòng JSON có request_id, lấy mẫu theo ACCESS_LOG_SAMPLE_RATE
+
+- Request id: lấy từ header X-Request-ID (nếu hợp lệ) hoặc sinh mới, trả lại trong response header
+- Sampling quyết định ở before_request; request lỗi (>= 500) luôn được log
+- Không log header (Authorization...); body chỉ đọc khi record được ghi, level DEBUG và ACCESS_LOG_BODY_MAX_BYTES > 0:
+  body JSON đã được view parse (cache) -> không đọc lại stream, field nhạy cảm bị che, tối đa ACCESS_LOG_BODY_MAX_BYTES
+- Ghi qua logger ACCESS_LOGGER_NAME (QueueHandler, xem app_logging.py) -> request thread không chờ I/O
+- duration_ms tính đến lúc response được trả về WSGI server (response streaming không gồm thời gian gửi body)
+"""
+import logging
+import random
+import re
+import time
+import uuid
+from flask import g, request
+from config import Config
+from app_logging import ACCESS_LOGGER_NAME
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+_REQUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+_SENSITIVE_KEYS = ('password', 'token', 'secret')
+
+access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+
+
+def start_access_log():
+    """before_request: request id + quyết định sampling"""
+    incoming = request.headers.get(REQUEST_ID_HEADER, '')
+    g.request_id = incoming if _REQUEST_ID_PATTERN.match(incoming) else uuid.uuid4().hex
+    g.request_started = time.perf_counter()
+    g.access_log_sampled = Config.ACCESS_LOG_ENABLED and random.random() < Config.ACCESS_LOG_SAMPLE_RATE
+
+
+def _redact(value):
+    if isinstance(value, dict):
+        return {key: '***' if any(word in str(key).lower() for word in _SENSITIVE_KEYS) else _redact(item)
+                for key, item in value.items()}
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
+
+
+def _request_body():
+    """Body đã cắt theo ACCESS_LOG_BODY_MAX_BYTES, None nếu không có"""
+    limit = Config.ACCESS_LOG_BODY_MAX_BYTES
+    length = request.content_length
+    if not length:
+        return None
+    if length > limit:
+        return f'<{length} bytes, not captured>'
+    if request.is_json:
+        data = request.get_json(silent=True)  # Cache của view, không đọc lại stream
+        if data is not None:
+            return _redact(data)
+    if request.mimetype.startswith('text/'):
+        return request.get_data(cache=True)[:limit].decode('utf-8', errors='replace')
+    return f'<{length} bytes {request.mimetype}>'
+
+
+def access_log_response(response):
+    """after_request: gắn X-Request-ID, ghi access log nếu request được lấy mẫu hoặc lỗi"""
+    request_id = g.get('request_id')
+    if request_id is None:
+        return response
+    response.headers[REQUEST_ID_HEADER] = request_id
+    if not Config.ACCESS_LOG_ENABLED:
+        return response
+    if not g.get('access_log_sampled') and response.status_code < 500:
+        return response
+    if not access_logger.isEnabledFor(logging.INFO):
+        return response
+
+    fields = {
+        'request_id': request_id,
+        'method': request.method,
+        'path': request.path,
+        'query': request.query_string.decode('latin-1') or None,
+        'status': response.status_code,
+        'duration_ms': round((time.perf_counter() - g.request_started) * 1000, 2),
+        'bytes': response.calculate_content_length() if not response.is_streamed else None,
+        'remote_addr': request.remote_addr,
+        'user_agent': request.user_agent.string or None,
+        'user_id': g.get('user_id'),
+        'household_id': g.get('household_id'),
+    }
+    query_stats = g.get('query_stats')  # query_stats_response (middleware)
+    if query_stats is not None:
+        fields['db_queries'] = query_stats.count
+        fields['db_ms'] = round(query_stats.duration * 1000, 2)
+    if Config.ACCESS_LOG_BODY_MAX_BYTES > 0 and access_logger.isEnabledFor(logging.DEBUG):
+        fields['body'] = _request_body()
+    access_logger.info('access', extra={'access': fields})
+    return response
@@ -0,0 +1,182 @@
+"""
+Response compression - gzip/brotli theo Accept-Encoding cho response JSON/text
+
+- Chọn encoding theo Accept-Encoding (br ưu tiên nếu đã cài brotli, sau đó gzip), không hỗ trợ -> giữ nguyên
+- Response thường: chỉ nén khi body >= COMPRESSION_MIN_SIZE và nén xong nhỏ hơn
+- Response streaming (api/serialization.stream_response): nén từng chunk + flush, client nhận dữ liệu dần
+- Bỏ qua: đã có Content-Encoding, mimetype không nén được (ảnh, file nén...), Cache-Control: no-transform,
+  HEAD, 204/304, file trả thẳng (direct_passthrough)
+- ETag strong -> weak khi nén (body khác byte nhưng cùng nội dung), Vary: Accept-Encoding
+- Metrics bytes trước/sau nén qua GET /metrics
+"""
+import threading
+import zlib
+from flask import request
+from config import Config
+from infrastructure.metrics import Sample, metrics_registry
+
+try:
+    import brotli
+except ImportError:  # brotli là dependency tùy chọn, không có thì chỉ dùng gzip
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/x-ndjson', 'application/javascript', 'application/xml',
+    'image/svg+xml', 'text/html', 'text/plain', 'text/css', 'text/csv', 'text/javascript', 'text/xml',
+}
+
+
+class CompressionStats:
+    """Counter cộng dồn theo encoding (thread-safe)"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses = {}   # encoding -> số response đã nén
+        self.bytes_in = {}    # encoding -> byte trước khi nén
+        self.bytes_out = {}   # encoding -> byte sau khi nén
+        self.skipped_small = 0
+
+    def record(self, encoding, bytes_in, bytes_out, response=True):
+        with self._lock:
+            if response:
+                self.responses[encoding] = self.responses.get(encoding, 0) + 1
+            self.bytes_in[encoding] = self.bytes_in.get(encoding, 0) + bytes_in
+            self.bytes_out[encoding] = self.bytes_out.get(encoding, 0) + bytes_out
+
+    def record_skipped_small(self):
+        with self._lock:
+            self.skipped_small += 1
+
+    def samples(self):
+        with self._lock:
+            samples = [Sample('http_compression_skipped_small_total', self.skipped_small, None,
+                              'Compressible responses below COMPRESSION_MIN_SIZE sent uncompressed', 'counter')]
+            for encoding in sorted(self.bytes_in):
+                labels = {'encoding': encoding}
+                samples.append(Sample('http_compression_responses_total', self.responses.get(encoding, 0), labels,
+                                      'Responses sent compressed', 'counter'))
+                samples.append(Sample('http_compression_bytes_in_total', self.bytes_in[encoding], labels,
+                                      'Response bytes before compression', 'counter'))
+                samples.append(Sample('http_compression_bytes_out_total', self.bytes_out[encoding], labels,
+                                      'Response bytes after compression', 'counter'))
+                samples.append(Sample('http_compression_bytes_saved_total',
+                                      self.bytes_in[encoding] - self.bytes_out[encoding], labels,
+                                      'Bytes saved by response compression', 'counter'))
+            return samples
+
+
+compression_stats = CompressionStats()
+metrics_registry.register(compression_stats.samples)
+
+
+class _GzipCompressor:
+    def __init__(self):
+        self._compressor = zlib.compressobj(Config.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Đẩy dữ liệu đã nén ra ngay (streaming), vẫn nén tiếp được"""
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=Config.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+_COMPRESSORS = {'gzip': _GzipCompressor}
+if brotli is not None:
+    _COMPRESSORS['br'] = _BrotliCompressor
+
+
+def choose_encoding(accept_encodings):
+    """Encoding tốt nhất client chấp nhận (q > 0), None nếu không có"""
+    best, best_quality = None, 0
+    for encoding in ('br', 'gzip'):
+        if encoding not in _COMPRESSORS:
+            continue
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _compressible(response) -> bool:
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if response.direct_passthrough or 'Content-Encoding' in response.headers:
+        return False
+    if 'no-transform' in (response.headers.get('Cache-Control') or ''):
+        return False
+    return response.mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def _weaken_etag(response):
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+
+def _compress_stream(iterable, compressor, encoding):
+    """Nén từng chunk của response streaming, flush sau mỗi chunk để client nhận dữ liệu ngay"""
+    bytes_in = bytes_out = 0
+    try:
+        for chunk in iterable:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            if not chunk:
+                continue
+            bytes_in += len(chunk)
+            data = compressor.compress(chunk) + compressor.flush()
+            bytes_out += len(data)
+            yield data
+        data = compressor.finish()
+        bytes_out += len(data)
+        yield data
+    finally:
+        close = getattr(iterable, 'close', None)
+        if close is not None:
+            close()
+        compression_stats.record(encoding, bytes_in, bytes_out)
+
+
+def compress_response(response):
+    """after_request: nén response theo Accept-Encoding của request"""
+    if not Config.COMPRESSION_ENABLED or request.method == 'HEAD' or not _compressible(response):
+        return response
+    # Response có thể khác nhau theo Accept-Encoding -> cache trung gian phải tách theo header này
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = _compress_stream(response.response, _COMPRESSORS[encoding](), encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < Config.COMPRESSION_MIN_SIZE:
+            compression_stats.record_skipped_small()
+            return response
+        compressor = _COMPRESSORS[encoding]()
+        compressed = compressor.compress(data) + compressor.finish()
+        if len(compressed) >= len(data):
+            return response
+        response.set_data(compressed)
+        compression_stats.record(encoding, len(data), len(compressed))
+    response.headers['Content-Encoding'] = encoding
+    _weaken_etag(response)
+    return response
@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from services.auth_service import AuthService
 from infrastructure.databases.mssql import session
+from api.utils.auth_utils import get_verified_claims
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 auth_service = AuthService(session)
@@ -142,8 +143,8 @@ def get_current_user():
     try:
         token = auth_header.split(' ')[1]
         
-        # Business logic được xử lý ở Application Layer (AuthService)
-        payload = auth_service.decode_token(token)
+        # Dùng lại claims đã verify trong request (middleware đã decode token)
+        payload = get_verified_claims(token)
         user_id = payload['user_id']
         
         user = auth_service.get_user_by_id(user_id)
@@ -2,6 +2,10 @@ from flask import Blueprint, request, g, jsonify
 from services.category_service import CategoryService
 from infrastructure.repositories.category_repository import CategoryRepository
 from api.decorators.auth_decorators import require_permission
+from api.decorators.query_decorators import query_budget
+from api.decorators.cache_decorators import conditional_list
+from api.serialization import Encoder
+from api.utils.pagination import page_request_from_args, paginated_response, sparse_items
 
 # =====================================================
 # BLUEPRINTS
@@ -26,16 +30,12 @@ category_service = CategoryService(CategoryRepository())
 # HELPER
 # =====================================================
 
-def category_to_dict(c):
-    return {
-        "id": c.id,
-        "household_id": c.household_id,
-        "name": c.name,
-        "description": c.description,
-        "status": c.status,
-        "created_at": c.created_at.isoformat() if c.created_at else None,
-        "updated_at": c.updated_at.isoformat() if c.updated_at else None
-    }
+# Encoder biên dịch sẵn (api/serialization.py), gọi như hàm: category_to_dict(category)
+category_to_dict = Encoder(
+    ("id", "household_id", "name", "description", "status",
+     "created_at", "updated_at"),
+    datetimes=("created_at", "updated_at")
+)
 
 def get_json_or_415():
     if not request.is_json:
@@ -50,6 +50,8 @@ def get_json_or_415():
 
 @owner_bp.route("", methods=["GET"])
 @require_permission("F103", ["GET"])
+@query_budget(5)
+@conditional_list(category_service.categories_version)
 def owner_list_categories():
     """
     List categories (Owner)
@@ -58,12 +60,26 @@ def owner_list_categories():
       summary: List categories
       tags: [Owner Categories]
       security: [{Bearer: []}]
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      description: "Filters: status. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of categories
+        304:
+          description: Not modified (If-None-Match matches ETag)
     """
-    categories = category_service.list_categories(g.household_id)
-    return jsonify([category_to_dict(c) for c in categories]), 200
+    try:
+        page_request = page_request_from_args()
+        page = category_service.list_categories_page(g.household_id, page_request)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return paginated_response(sparse_items(page.items, page_request.fields, category_to_dict), page)
 
 @owner_bp.route("", methods=["POST"])
 @require_permission("F103", ["POST"])
@@ -219,6 +235,8 @@ def owner_delete_category(category_id):
 
 @employee_bp.route("", methods=["GET"])
 @require_permission("F202", ["GET"])
+@query_budget(5)
+@conditional_list(category_service.categories_version)
 def employee_list_categories():
     """
     List categories (Employee – read only)
@@ -227,9 +245,23 @@ def employee_list_categories():
       summary: List categories
       tags: [Employee Categories]
       security: [{Bearer: []}]
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      description: "Filters: status. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of categories
+        304:
+          description: Not modified (If-None-Match matches ETag)
     """
-    categories = category_service.list_categories(g.household_id)
-    return jsonify([category_to_dict(c) for c in categories]), 200
+    try:
+        page_request = page_request_from_args()
+        page = category_service.list_categories_page(g.household_id, page_request)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return paginated_response(sparse_items(page.items, page_request.fields, category_to_dict), page)
@@ -4,6 +4,7 @@ from infrastructure.repositories.function_repository import FunctionRepository
 from api.schemas.function import FunctionRequestSchema, FunctionResponseSchema, FunctionUpdateSchema
 from infrastructure.databases.mssql import session
 from api.decorators.auth_decorators import require_permission
+from api.utils.pagination import page_request_from_args, paginated_response
 
 bp = Blueprint('admin_functions', __name__, url_prefix='/api/admin/functions')
 function_service = FunctionService(FunctionRepository(session))
@@ -21,12 +22,22 @@ def list_functions():
       summary: List all functions
       tags:
         - Admin Functions
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+      description: "Filters: resource_type. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of functions
     """
-    functions = function_service.list_functions()
-    return jsonify(response_schema.dump(functions, many=True)), 200
+    try:
+        page = function_service.list_functions_page(page_request_from_args())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return paginated_response(response_schema.dump(page.items, many=True), page)
 
 @bp.route('/', methods=['POST'])
 @require_permission(function_code="F003", methods=["POST"])
@@ -0,0 +1,73 @@
+import logging
+import time
+from flask import Blueprint, jsonify, Response
+from sqlalchemy import text
+from infrastructure.databases.mssql import get_engine, get_replica_engines, DATABASE_REPLICA_URIS
+from infrastructure.databases.pool_metrics import get_pool_status, pool_metrics_collector
+from infrastructure.metrics import metrics_registry
+from api.decorators.auth_decorators import require_internal_access
+
+bp = Blueprint('health', __name__)
+logger = logging.getLogger(__name__)
+
+metrics_registry.register(pool_metrics_collector(get_engine))
+for index in range(len(DATABASE_REPLICA_URIS)):
+    metrics_registry.register(pool_metrics_collector(
+        lambda index=index: get_replica_engines()[index], name=f'replica{index}'
+    ))
+
+
+def check_engine(engine):
+    """SELECT 1 trên engine, trả về dict status/latency/pool"""
+    start = time.perf_counter()
+    result = {'status': 'ok'}
+    try:
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+    except Exception:
+        # Chi tiết lỗi (driver, DSN) chỉ ghi log, endpoint không cần đăng nhập
+        logger.exception('Database health check failed')
+        result = {'status': 'error'}
+    result['latency_ms'] = round((time.perf_counter() - start) * 1000, 3)
+    result['pool'] = get_pool_status(engine)
+    return result
+
+
+@bp.route('/health/db', methods=['GET'])
+@require_internal_access
+def health_db():
+    """
+    Database health + connection pool status
+    ---
+    get:
+      summary: Database health check (SELECT 1) kèm trạng thái connection pool của worker hiện tại (primary + replicas)
+      tags:
+        - Health
+      responses:
+        200:
+          description: Database reachable
+        503:
+          description: Database unreachable
+    """
+    body = check_engine(get_engine())
+    replicas = [check_engine(engine) for engine in get_replica_engines()]
+    if replicas:
+        body['replicas'] = replicas
+    return jsonify(body), 200 if body['status'] == 'ok' else 503
+
+
+@bp.route('/metrics', methods=['GET'])
+@require_internal_access
+def metrics():
+    """
+    Metrics dạng Prometheus text
+    ---
+    get:
+      summary: Export metrics (connection pool, ...) của worker hiện tại
+      tags:
+        - Health
+      responses:
+        200:
+          description: Prometheus text format
+    """
+    return Response(metrics_registry.render_prometheus(), mimetype='text/plain; version=0.0.4')
@@ -193,8 +193,11 @@ def update_own_household():
             updated_by=data.get('updated_by'),
             updated_at=datetime.now(timezone.utc)
         )
+        # HouseholdRepository.update chỉ flush -> controller commit
+        session.commit()
         return jsonify(response_schema.dump(household)), 200
     except ValueError as e:
+        session.rollback()
         # Business rule violation hoặc household not found từ service
         if 'not found' in str(e).lower():
             return jsonify({'error': str(e)}), 404
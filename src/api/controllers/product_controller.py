@@ -2,6 +2,12 @@ from flask import Blueprint, request, g, jsonify
 from services.product_service import ProductService
 from infrastructure.repositories.product_repository import ProductRepository
 from api.decorators.auth_decorators import require_permission
+from api.decorators.query_decorators import query_budget
+from api.decorators.cache_decorators import conditional_list
+from api.serialization import Encoder, json_response, stream_response
+from api.utils.pagination import fields_from_args, page_request_from_args, paginated_response, sparse_items
+from services.product_search_service import IndexedProduct
+from domain.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 # =====================================================
 # BLUEPRINTS
@@ -26,18 +32,34 @@ product_service = ProductService(ProductRepository())
 # HELPER
 # =====================================================
 
-def product_to_dict(p):
-    return {
-        "id": p.id,
-        "household_id": p.household_id,
-        "category_id": p.category_id,
-        "name": p.name,
-        "image_url": p.image_url,
-        "description": p.description,
-        "status": p.status,
-        "created_at": p.created_at.isoformat() if p.created_at else None,
-        "updated_at": p.updated_at.isoformat() if p.updated_at else None,
-    }
+# Encoder biên dịch sẵn (api/serialization.py), gọi như hàm: product_to_dict(product)
+product_to_dict = Encoder(
+    ("id", "household_id", "category_id", "name", "image_url", "description", "status",
+     "created_at", "updated_at"),
+    datetimes=("created_at", "updated_at")
+)
+
+
+def search_products():
+    """Tìm sản phẩm của household hiện tại theo ?q= (dùng chung cho Owner/Employee)"""
+    query = (request.args.get("q") or "").strip()
+    if not query:
+        return jsonify({"error": "q is required"}), 400
+    try:
+        limit = min(int(request.args.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        category_id = request.args.get("category_id", type=int)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    try:
+        fields = fields_from_args(allowed=IndexedProduct.__slots__)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    products = product_service.search_products(
+        g.household_id, query, limit,
+        status=request.args.get("status") or None,
+        category_id=category_id
+    )
+    return json_response(sparse_items(products, fields, product_to_dict))
 
 
 # =====================================================
@@ -46,6 +68,8 @@ def product_to_dict(p):
 
 @owner_bp.route("", methods=["GET"])
 @require_permission("F104", ["GET"])
+@query_budget(5)
+@conditional_list(product_service.products_version)
 def owner_list_products():
     """
     List products (Owner)
@@ -54,12 +78,81 @@ def owner_list_products():
       summary: List products
       tags: [Owner Products]
       security: [{Bearer: []}]
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      description: "Filters: status, category_id. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of products
+        304:
+          description: Not modified (If-None-Match matches ETag)
+    """
+    try:
+        page_request = page_request_from_args()
+        page = product_service.list_products_page(g.household_id, page_request)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return paginated_response(sparse_items(page.items, page_request.fields, product_to_dict), page)
+
+
+# Không đặt @query_budget: query chính (yield_per) chạy lúc stream body, sau after_request
+@owner_bp.route("/export", methods=["GET"])
+@require_permission("F104", ["GET"])
+def owner_export_products():
+    """
+    Export all products (Owner) - streaming, bộ nhớ cố định với catalog lớn
+    ---
+    get:
+      summary: Stream all products as a JSON array or NDJSON
+      tags: [Owner Products]
+      security: [{Bearer: []}]
+      parameters:
+        - {name: format, in: query, type: string, enum: [json, ndjson], description: "ndjson: một product mỗi dòng (hoặc Accept: application/x-ndjson)"}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+        - {name: search, in: query, type: string}
+      description: "Filters: status, category_id. Sort theo id, không phân trang."
+      responses:
+        200:
+          description: All products of the household
+    """
+    try:
+        page_request = page_request_from_args(ignore=("format",))
+        rows = product_service.iter_products(g.household_id, page_request)
+        encoder = product_to_dict.project(page_request.fields)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return stream_response(rows, encoder)
+
+
+@owner_bp.route("/search", methods=["GET"])
+@require_permission("F104", ["GET"])
+@query_budget(3)
+def owner_search_products():
     """
-    products = product_service.list_products(g.household_id)
-    return jsonify([product_to_dict(p) for p in products]), 200
+    Search products (Owner)
+    ---
+    get:
+      summary: Search products by name/description (accent-insensitive, prefix match)
+      tags: [Owner Products]
+      security: [{Bearer: []}]
+      parameters:
+        - {name: q, in: query, type: string, required: true, description: "vd: xi mang -> Xi măng"}
+        - {name: limit, in: query, type: integer, description: Max results (default 20, max 100)}
+        - {name: status, in: query, type: string}
+        - {name: category_id, in: query, type: integer}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      responses:
+        200:
+          description: Matching products, most relevant first
+        400:
+          description: Missing q
+    """
+    return search_products()
 
 
 @owner_bp.route("", methods=["POST"])
@@ -224,6 +317,8 @@ def owner_delete_product(product_id):
 
 @employee_bp.route("", methods=["GET"])
 @require_permission("F201", ["GET"])
+@query_budget(5)
+@conditional_list(product_service.products_version)
 def employee_list_products():
     """
     List products (Employee – read only)
@@ -232,12 +327,52 @@ def employee_list_products():
       summary: List products
       tags: [Employee Products]
       security: [{Bearer: []}]
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      description: "Filters: status, category_id. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of products
+        304:
+          description: Not modified (If-None-Match matches ETag)
+    """
+    try:
+        page_request = page_request_from_args()
+        page = product_service.list_products_page(g.household_id, page_request)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return paginated_response(sparse_items(page.items, page_request.fields, product_to_dict), page)
+
+
+@employee_bp.route("/search", methods=["GET"])
+@require_permission("F201", ["GET"])
+@query_budget(3)
+def employee_search_products():
+    """
+    Search products (Employee – read only)
+    ---
+    get:
+      summary: Search products by name/description (accent-insensitive, prefix match)
+      tags: [Employee Products]
+      security: [{Bearer: []}]
+      parameters:
+        - {name: q, in: query, type: string, required: true, description: "vd: xi mang -> Xi măng"}
+        - {name: limit, in: query, type: integer, description: Max results (default 20, max 100)}
+        - {name: status, in: query, type: string}
+        - {name: category_id, in: query, type: integer}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      responses:
+        200:
+          description: Matching products, most relevant first
+        400:
+          description: Missing q
     """
-    products = product_service.list_products(g.household_id)
-    return jsonify([product_to_dict(p) for p in products]), 200
+    return search_products()
 
 
 @employee_bp.route("/<int:product_id>", methods=["GET"])
@@ -7,7 +7,7 @@ from infrastructure.repositories.household_repository import HouseholdRepository
 from infrastructure.repositories.user_repository import UserRepository
 from infrastructure.repositories.subscription_plan_repository import SubscriptionPlanRepository
 from infrastructure.databases.mssql import session
-from infrastructure.models import Role
+from services.role_registry_service import role_registry
 from datetime import datetime, timezone, timedelta
 bp = Blueprint('public_registration', __name__, url_prefix='/api/public')
 
@@ -144,15 +144,11 @@ def register_owner():
         if hasattr(plan, 'status') and getattr(plan, 'status', '').lower() != 'active':
             return jsonify({'error': f'Subscription plan with ID {plan_id} is not active'}), 400
         
-        # Bước 2: Lấy Owner role (trong cùng session với transaction)
-        # Query Owner role trong cùng session để tránh "not bound to Session" error
-        owner_role = session.query(Role).filter_by(role_name='Owner').first()
+        # Bước 2: Lấy Owner role từ role registry (case-insensitive, không query database mỗi request)
+        # RoleEntry không phải ORM object nên không bị "not bound to Session" error
+        owner_role = role_registry.get_by_name('Owner')
         if not owner_role:
-            # Try case-insensitive
-            all_roles = session.query(Role).all()
-            owner_role = next((r for r in all_roles if r.role_name.upper() == 'OWNER'), None)
-            if not owner_role:
-                return jsonify({'error': 'Owner role not found in database'}), 500
+            return jsonify({'error': 'Owner role not found in database'}), 500
         
         # Lấy role_id ngay lập tức (trước khi có bất kỳ operation nào khác) để tránh "not bound to Session"
         owner_role_id = owner_role.id
@@ -4,6 +4,7 @@ from infrastructure.repositories.role_repository import RoleRepository
 from api.schemas.role import RoleRequestSchema, RoleResponseSchema, RoleUpdateSchema
 from infrastructure.databases.mssql import session
 from api.decorators.auth_decorators import require_permission
+from api.utils.pagination import page_request_from_args, paginated_response
 
 bp = Blueprint('admin_roles', __name__, url_prefix='/api/admin/roles')
 role_service = RoleService(RoleRepository(session))
@@ -23,12 +24,21 @@ def list_roles():
         - Bearer: []
       tags:
         - Admin Roles
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
       responses:
         200:
           description: List of roles
     """
-    roles = role_service.list_roles()
-    return jsonify(response_schema.dump(roles, many=True)), 200
+    try:
+        page = role_service.list_roles_page(page_request_from_args())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return paginated_response(response_schema.dump(page.items, many=True), page)
 
 @bp.route('/', methods=['POST'])
 @require_permission(function_code="F002", methods=["POST"])
@@ -4,6 +4,7 @@ from infrastructure.repositories.role_function_repository import RoleFunctionRep
 from api.schemas.role_function import RoleFunctionRequestSchema, RoleFunctionResponseSchema
 from infrastructure.databases.mssql import session
 from api.decorators.auth_decorators import require_permission
+from api.utils.pagination import page_request_from_args, paginated_response
 
 bp = Blueprint('admin_role_functions', __name__, url_prefix='/api/admin/roles')
 role_function_service = RoleFunctionService(RoleFunctionRepository(session))
@@ -26,12 +27,19 @@ def get_role_functions(role_id):
             type: integer
       tags:
         - Admin Role Functions
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: include_total, in: query, type: boolean}
       responses:
         200:
           description: List of functions
     """
-    role_functions = role_function_service.get_functions_by_role(role_id)
-    return jsonify(response_schema.dump(role_functions, many=True)), 200
+    try:
+        page = role_function_service.get_functions_by_role_page(role_id, page_request_from_args())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return paginated_response(response_schema.dump(page.items, many=True), page)
 
 @bp.route('/<int:role_id>/functions', methods=['POST'])
 @require_permission(function_code="F002", methods=["POST"])
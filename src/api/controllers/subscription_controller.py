@@ -3,6 +3,7 @@ from services.subscription_service import SubscriptionService
 from infrastructure.repositories.subscription_repository import SubscriptionRepository
 from api.schemas.subscription import SubscriptionRequestSchema, SubscriptionResponseSchema
 from api.decorators.auth_decorators import require_permission
+from api.utils.pagination import page_request_from_args, paginated_response
 from api.utils.auth_utils import get_current_household_id
 from infrastructure.databases.mssql import session
 from datetime import datetime, timezone, timedelta
@@ -201,6 +202,12 @@ def list_subscriptions():
         - Bearer: []
       tags:
         - Admin Subscriptions
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: include_total, in: query, type: boolean}
+      description: "Filters: household_id, plan_id, is_active. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of subscriptions
@@ -236,8 +243,11 @@ def list_subscriptions():
                       type: string
                       example: "2026-01-09T17:00:00Z"
     """
-    subs = service.list_subscriptions()
-    return jsonify(response_schema.dump(subs, many=True)), 200
+    try:
+        page = service.list_subscriptions_page(page_request_from_args())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return paginated_response(response_schema.dump(page.items, many=True), page)
 
 
 @admin_bp.route('/<int:id>', methods=['PUT'])
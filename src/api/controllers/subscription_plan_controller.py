@@ -1,9 +1,15 @@
-from flask import Blueprint, request, jsonify
-from services.subscription_plan_service import SubscriptionPlanService
+from functools import partial
+from urllib.parse import urlencode
+from flask import Blueprint, Response, request, jsonify
+from werkzeug.datastructures import MultiDict
+from services.subscription_plan_service import SubscriptionPlanService, public_plan_catalog
 from infrastructure.repositories.subscription_plan_repository import SubscriptionPlanRepository
 from api.schemas.subscription_plan import SubscriptionPlanRequestSchema, SubscriptionPlanResponseSchema
 from api.decorators.auth_decorators import require_permission
-from infrastructure.databases.mssql import session
+from api.utils.pagination import page_headers, page_request_from_args, paginated_response
+from api.serialization import JSON_MIMETYPE, dumps
+from config import Config
+from infrastructure.databases.mssql import session, primary_reads
 from datetime import datetime, timezone
 
 # Admin endpoints (F002: manage_subscription_plans)
@@ -16,6 +22,9 @@ service = SubscriptionPlanService(SubscriptionPlanRepository(session=session))
 request_schema = SubscriptionPlanRequestSchema()
 response_schema = SubscriptionPlanResponseSchema()
 
+# Query params public catalog dùng khi render; param khác (cache-buster ?_=...) bị bỏ qua, không vào cache key
+PUBLIC_PLAN_PARAMS = ('billing_cycle', 'cursor', 'include_total', 'limit', 'search', 'sort')
+
 # ---------------- PUBLIC ENDPOINT (No auth required) ----------------
 @public_bp.route('', methods=['GET'])
 def list_plans_public():
@@ -27,7 +36,16 @@ def list_plans_public():
       summary: Get all subscription plans (Public)
       tags:
         - Public SubscriptionPlans
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+      description: "Filters: billing_cycle. Next page cursor in X-Next-Cursor / Link headers. Cached (Cache-Control public, ETag)."
       responses:
+        304:
+          description: Not modified (If-None-Match matches ETag)
         200:
           description: List of subscription plans
           content:
@@ -62,10 +80,30 @@ def list_plans_public():
                       type: string
                       example: "2026-01-09T17:00:00Z"
     """
-    plans = service.list_plans()
-    # Chỉ trả về plans có status = "active"
-    active_plans = [plan for plan in plans if getattr(plan, 'status', '').lower() == 'active']
-    return jsonify(response_schema.dump(active_plans, many=True)), 200
+    # Catalog đã serialize sẵn theo query params đã chuẩn hóa: hit -> không query DB (invalidate khi admin ghi plan)
+    args = _public_plan_args()
+    try:
+        entry = public_plan_catalog.get(f'{request.path}?{urlencode(args)}', partial(_render_public_plans, args))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    response = Response(entry.body, headers=entry.headers, mimetype=JSON_MIMETYPE)
+    response.set_etag(entry.etag)
+    response.headers['Cache-Control'] = f'public, max-age={Config.PUBLIC_PLAN_MAX_AGE}'
+    return response.make_conditional(request)
+
+
+def _public_plan_args():
+    """Query params thuộc PUBLIC_PLAN_PARAMS (theo thứ tự tên, giá trị đầu tiên, bỏ giá trị rỗng)"""
+    return MultiDict([(name, request.args.get(name)) for name in PUBLIC_PLAN_PARAMS if request.args.get(name)])
+
+
+def _render_public_plans(args):
+    """Trang plan active theo query params đã chuẩn hóa -> (body bytes, headers) để cache"""
+    # Đọc primary: render ngay sau khi admin sửa plan được cache TTL + max-age, replica có thể còn bản cũ
+    with primary_reads(session):
+        # Chỉ trả về plans có status = "active" (filter trong query)
+        page = service.list_plans_page(page_request_from_args(args), active_only=True)
+    return dumps(response_schema.dump(page.items, many=True)), page_headers(page, args)
 
 # ---------------- OWNER ENDPOINTS (F102: view_own_household - Read subscription plans để upgrade) ----------------
 owner_bp = Blueprint('owner_subscription_plan', __name__, url_prefix='/api/owner/subscription-plans')
@@ -83,6 +121,13 @@ def list_plans_owner():
         - Bearer: []
       tags:
         - Owner SubscriptionPlans
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+      description: "Filters: billing_cycle. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of active subscription plans (để Owner chọn khi upgrade)
@@ -119,9 +164,11 @@ def list_plans_owner():
                       example: "2026-01-09T17:00:00Z"
     """
     # Owner xem subscription plans để upgrade - chỉ trả về active plans
-    plans = service.list_plans()
-    active_plans = [plan for plan in plans if getattr(plan, 'status', '').lower() == 'active']
-    return jsonify(response_schema.dump(active_plans, many=True)), 200
+    try:
+        page = service.list_plans_page(page_request_from_args(ignore=('status',)), active_only=True)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return paginated_response(response_schema.dump(page.items, many=True), page)
 
 # ---------------- ADMIN ENDPOINTS (F002: manage_subscription_plans) ----------------
 @admin_bp.route('', methods=['GET'])
@@ -134,6 +181,13 @@ def list_plans():
       summary: Get all subscription plans
       tags:
         - SubscriptionPlans
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+      description: "Filters: status, billing_cycle. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of subscription plans
@@ -160,8 +214,11 @@ def list_plans():
                       type: string
                       example: "2026-01-09T17:00:00Z"
     """
-    plans = service.list_plans()
-    return jsonify(response_schema.dump(plans, many=True)), 200
+    try:
+        page = service.list_plans_page(page_request_from_args())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return paginated_response(response_schema.dump(page.items, many=True), page)
 
 # ---------------- CREATE ----------------
 @admin_bp.route('', methods=['POST'])
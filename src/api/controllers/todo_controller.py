@@ -4,6 +4,7 @@ from infrastructure.repositories.todo_repository import TodoRepository
 from api.schemas.todo import TodoRequestSchema, TodoResponseSchema
 from datetime import datetime
 from infrastructure.databases.mssql import session
+from api.utils.pagination import page_request_from_args, paginated_response
 bp = Blueprint('todo', __name__, url_prefix='/todos')
 
 todo_service = TodoService(TodoRepository(session))
@@ -20,6 +21,13 @@ def list_todos():
       summary: Get all todos
       tags:
         - Todos
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+      description: "Filters: status. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of todos
@@ -30,8 +38,11 @@ def list_todos():
                 items:
                   $ref: '#/components/schemas/TodoResponse'
     """
-    todos = todo_service.list_todos()
-    return jsonify(response_schema.dump(todos, many=True)), 200
+    try:
+        page = todo_service.list_todos_page(page_request_from_args())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return paginated_response(response_schema.dump(page.items, many=True), page)
 
 @bp.route('/<int:todo_id>', methods=['GET'])
 def get_todo(todo_id):
@@ -2,6 +2,10 @@ from flask import Blueprint, request, g, jsonify
 from services.unit_service import UnitService
 from infrastructure.repositories.unit_repository import UnitRepository
 from api.decorators.auth_decorators import require_permission
+from api.decorators.query_decorators import query_budget
+from api.decorators.cache_decorators import conditional_list
+from api.serialization import Encoder
+from api.utils.pagination import page_request_from_args, paginated_response, sparse_items
 
 # ================= OWNER – F105 =================
 
@@ -23,16 +27,12 @@ unit_service = UnitService(UnitRepository())
 
 # ================= HELPER =================
 
-def unit_to_dict(u):
-    return {
-        "id": u.id,
-        "household_id": u.household_id,
-        "name": u.name,
-        "description": u.description,
-        "status": u.status,
-        "created_at": u.created_at.isoformat() if u.created_at else None,
-        "updated_at": u.updated_at.isoformat() if u.updated_at else None,
-    }
+# Encoder biên dịch sẵn (api/serialization.py), gọi như hàm: unit_to_dict(unit)
+unit_to_dict = Encoder(
+    ("id", "household_id", "name", "description", "status",
+     "created_at", "updated_at"),
+    datetimes=("created_at", "updated_at")
+)
 
 # =====================================================
 # OWNER
@@ -40,6 +40,8 @@ def unit_to_dict(u):
 
 @owner_bp.route("", methods=["GET"])
 @require_permission("F105", ["GET"])
+@query_budget(5)
+@conditional_list(unit_service.units_version)
 def owner_list_units():
     """
     List units (Owner only)
@@ -49,12 +51,26 @@ def owner_list_units():
       tags: [Owner Units]
       security:
         - Bearer: []
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      description: "Filters: status. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of units
+        304:
+          description: Not modified (If-None-Match matches ETag)
     """
-    units = unit_service.list_units(g.household_id)
-    return jsonify([unit_to_dict(u) for u in units]), 200
+    try:
+        page_request = page_request_from_args()
+        page = unit_service.list_units_page(g.household_id, page_request)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return paginated_response(sparse_items(page.items, page_request.fields, unit_to_dict), page)
 
 
 @owner_bp.route("", methods=["POST"])
@@ -207,6 +223,8 @@ def owner_delete_unit(unit_id):
 
 @employee_bp.route("", methods=["GET"])
 @require_permission("F204", ["GET"])
+@query_budget(5)
+@conditional_list(unit_service.units_version)
 def employee_list_units():
     """
     List units (Employee – read only)
@@ -216,12 +234,26 @@ def employee_list_units():
       tags: [Employee Units]
       security:
         - Bearer: []
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      description: "Filters: status. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of units
+        304:
+          description: Not modified (If-None-Match matches ETag)
     """
-    units = unit_service.list_units(g.household_id)
-    return jsonify([unit_to_dict(u) for u in units]), 200
+    try:
+        page_request = page_request_from_args()
+        page = unit_service.list_units_page(g.household_id, page_request)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return paginated_response(sparse_items(page.items, page_request.fields, unit_to_dict), page)
 
 
 @employee_bp.route("/<int:unit_id>", methods=["GET"])
@@ -4,7 +4,9 @@ from infrastructure.repositories.user_repository import UserRepository
 from api.schemas.user import UserRequestSchema, UserResponseSchema, UserUpdateSchema
 from infrastructure.databases.mssql import session
 from api.decorators.auth_decorators import require_permission
+from api.utils.pagination import page_request_from_args, paginated_response
 from api.utils.auth_utils import get_current_household_id
+from domain.models.page import InvalidPageRequest
 
 # Admin endpoints
 admin_bp = Blueprint('admin_users', __name__, url_prefix='/api/admin/users')
@@ -47,7 +49,11 @@ def list_users():
           in: query
           schema:
             type: string
-          description: Search by user_name or email (case-insensitive, partial match) - để search Owner accounts
+          description: Search by user_name or email (không dấu, mọi từ phải khớp đầu từ hoặc nằm trong user_name/email)
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column (user_name, status, created_at, updated_at), '-' prefix = descending"}
+        - {name: include_total, in: query, type: boolean}
       responses:
         200:
           description: List of users (Admin and Owner only) với search và filter
@@ -97,18 +103,58 @@ def list_users():
     
     # Business rule được xử lý ở Application Layer (UserService)
     try:
-        users = user_service.list_users(
+        page = user_service.list_users(
             exclude_employee=True,  # Admin chỉ quản lý Admin và Owner, KHÔNG Employee
             role_id=role_id,  # Filter by role (e.g., chỉ Owner accounts)
             status=status,  # Filter by status (Active/Inactive) - để activate/deactivate
             household_id=household_id,  # Filter by household_id
-            search_term=search_term  # Search by user_name or email
+            search_term=search_term,  # Search by user_name or email
+            page_request=page_request_from_args(ignore=('role_id', 'status', 'household_id', 'search'))
         )
-        return jsonify(response_schema.dump(users, many=True)), 200
+        return paginated_response(response_schema.dump(page.items, many=True), page)
+    except InvalidPageRequest as e:
+        return jsonify({'error': str(e)}), 400
     except ValueError as e:
         # Business rule violation: Admin không được filter Employee role
         return jsonify({'error': str(e)}), 403
 
+@admin_bp.route('/facets', methods=['GET'])
+@require_permission(function_code="F005", methods=["GET"])
+def user_facets():
+    """
+    Count users by role_id and status (Admin only) - cùng filter/search với list users
+    ---
+    get:
+      summary: Facet counts for admin user search
+      security:
+        - Bearer: []
+      tags:
+        - Admin Users
+      parameters:
+        - {name: role_id, in: query, type: integer}
+        - {name: status, in: query, type: string}
+        - {name: household_id, in: query, type: integer}
+        - {name: search, in: query, type: string}
+      description: "Mỗi facet bỏ qua filter của chính nó (role_id facet không lọc theo role_id)."
+      responses:
+        200:
+          description: "{role_id: {<role_id>: count}, status: {<status>: count}}"
+    """
+    try:
+        facets = user_service.user_facets(
+            exclude_employee=True,  # Admin chỉ quản lý Admin và Owner, KHÔNG Employee
+            role_id=request.args.get('role_id', type=int),
+            status=request.args.get('status', type=str),
+            household_id=request.args.get('household_id', type=int),
+            search_term=request.args.get('search', type=str)
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 403
+    return jsonify({
+        'role_id': {str(role_id): count for role_id, count in facets['role_id'].items()},
+        'status': facets['status']
+    }), 200
+
 @admin_bp.route('/', methods=['POST'])
 @require_permission(function_code="F005", methods=["POST"])
 def create_user():
@@ -147,8 +193,11 @@ def create_user():
             created_by=data.get('created_by'),
             is_admin_creating=True  # Flag để service check business rule
         )
+        # UserRepository.add chỉ flush -> controller commit (session theo request, không commit là mất)
+        session.commit()
         return jsonify(response_schema.dump(user)), 201
     except ValueError as e:
+        session.rollback()
         # Business rule violation từ service
         return jsonify({'error': str(e)}), 403
 
@@ -353,6 +402,13 @@ def list_employees():
         - Bearer: []
       tags:
         - Owner Employees
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+      description: "Filters: role_id, status. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of employees
@@ -363,8 +419,11 @@ def list_employees():
         return jsonify({'error': 'Household ID is required'}), 400
     
     # Filter theo household_id - Data Isolation
-    users = user_service.get_users_by_household(household_id)
-    return jsonify(response_schema.dump(users, many=True)), 200
+    try:
+        page = user_service.get_users_by_household_page(household_id, page_request_from_args())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return paginated_response(response_schema.dump(page.items, many=True), page)
 
 @owner_bp.route('/', methods=['POST'])
 @require_permission(function_code="F101", methods=["POST"])
@@ -396,16 +455,22 @@ def create_employee():
     if not household_id:
         return jsonify({'error': 'Household ID is required'}), 400
     
-    user = user_service.create_user(
-        household_id=household_id,
-        role_id=data['role_id'],
-        user_name=data['user_name'],
-        password=data['password'],
-        email=data.get('email'),
-        description=data.get('description'),
-        status=data['status'],
-        created_by=data.get('created_by')
-    )
+    try:
+        user = user_service.create_user(
+            household_id=household_id,
+            role_id=data['role_id'],
+            user_name=data['user_name'],
+            password=data['password'],
+            email=data.get('email'),
+            description=data.get('description'),
+            status=data['status'],
+            created_by=data.get('created_by')
+        )
+        # UserRepository.add chỉ flush -> controller commit
+        session.commit()
+    except ValueError as e:
+        session.rollback()
+        return jsonify({'error': str(e)}), 400
     return jsonify(response_schema.dump(user)), 201
 
 @owner_bp.route('/<int:employee_id>', methods=['GET'])
@@ -2,6 +2,10 @@ from flask import Blueprint, request, g, jsonify
 from services.warehouse_service import WarehouseService
 from infrastructure.repositories.warehouse_repository import WarehouseRepository
 from api.decorators.auth_decorators import require_permission
+from api.decorators.query_decorators import query_budget
+from api.decorators.cache_decorators import conditional_list
+from api.serialization import Encoder
+from api.utils.pagination import page_request_from_args, paginated_response, sparse_items
 
 # =====================================================
 # BLUEPRINTS
@@ -26,17 +30,12 @@ warehouse_service = WarehouseService(WarehouseRepository())
 # HELPER
 # =====================================================
 
-def warehouse_to_dict(w):
-    return {
-        "id": w.id,
-        "household_id": w.household_id,
-        "name": w.name,
-        "address": w.address,
-        "description": w.description,
-        "status": w.status,
-        "created_at": w.created_at.isoformat() if w.created_at else None,
-        "updated_at": w.updated_at.isoformat() if w.updated_at else None,
-    }
+# Encoder biên dịch sẵn (api/serialization.py), gọi như hàm: warehouse_to_dict(warehouse)
+warehouse_to_dict = Encoder(
+    ("id", "household_id", "name", "address", "description", "status",
+     "created_at", "updated_at"),
+    datetimes=("created_at", "updated_at")
+)
 
 
 # =====================================================
@@ -45,6 +44,8 @@ def warehouse_to_dict(w):
 
 @owner_bp.route("", methods=["GET"])
 @require_permission("F107", ["GET"])
+@query_budget(5)
+@conditional_list(warehouse_service.warehouses_version)
 def owner_list_warehouses():
     """
     List warehouses (Owner)
@@ -53,12 +54,26 @@ def owner_list_warehouses():
       summary: List warehouses
       tags: [Owner Warehouses]
       security: [{Bearer: []}]
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      description: "Filters: status. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of warehouses
+        304:
+          description: Not modified (If-None-Match matches ETag)
     """
-    warehouses = warehouse_service.list_warehouses(g.household_id)
-    return jsonify([warehouse_to_dict(w) for w in warehouses]), 200
+    try:
+        page_request = page_request_from_args()
+        page = warehouse_service.list_warehouses_page(g.household_id, page_request)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return paginated_response(sparse_items(page.items, page_request.fields, warehouse_to_dict), page)
 
 
 @owner_bp.route("", methods=["POST"])
@@ -218,6 +233,8 @@ def owner_delete_warehouse(warehouse_id):
 
 @employee_bp.route("", methods=["GET"])
 @require_permission("F216", ["GET"])
+@query_budget(5)
+@conditional_list(warehouse_service.warehouses_version)
 def employee_list_warehouses():
     """
     List warehouses (Employee – read only)
@@ -226,12 +243,26 @@ def employee_list_warehouses():
       summary: List warehouses
       tags: [Employee Warehouses]
       security: [{Bearer: []}]
+      parameters:
+        - {name: limit, in: query, type: integer, description: Page size (max 100)}
+        - {name: cursor, in: query, type: string, description: X-Next-Cursor of previous page}
+        - {name: sort, in: query, type: string, description: "Sort column, '-' prefix = descending"}
+        - {name: search, in: query, type: string}
+        - {name: include_total, in: query, type: boolean}
+        - {name: fields, in: query, type: string, description: "Sparse fieldset, vd: fields=id,name"}
+      description: "Filters: status. Next page cursor in X-Next-Cursor / Link headers."
       responses:
         200:
           description: List of warehouses
+        304:
+          description: Not modified (If-None-Match matches ETag)
     """
-    warehouses = warehouse_service.list_warehouses(g.household_id)
-    return jsonify([warehouse_to_dict(w) for w in warehouses]), 200
+    try:
+        page_request = page_request_from_args()
+        page = warehouse_service.list_warehouses_page(g.household_id, page_request)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return paginated_response(sparse_items(page.items, page_request.fields, warehouse_to_dict), page)
 
 
 @employee_bp.route("/<int:warehouse_id>", methods=["GET"])
@@ -1,16 +1,61 @@
 """
 Auth Decorators - Check permission, role, subscription
 """
+import hmac
+import ipaddress
 from functools import wraps
-from flask import jsonify, request, g, current_app
-import jwt
-from services.permission_service import PermissionService
-from services.subscription_service import SubscriptionService
+from flask import jsonify, request, g
+from config import Config
+from services.authorization_service import AuthorizationService
+from api.utils.auth_utils import get_verified_claims
 from infrastructure.databases.mssql import session
-from infrastructure.models import User
+from infrastructure.models import Function
+
+authorization_service = AuthorizationService(session)
+
+
+def _internal_networks():
+    networks = []
+    for item in Config.INTERNAL_ALLOWED_NETWORKS.split(','):
+        if item.strip():
+            networks.append(ipaddress.ip_network(item.strip(), strict=False))
+    return networks
+
+
+_INTERNAL_NETWORKS = _internal_networks()
+
+
+def is_internal_request():
+    """Request từ mạng nội bộ (INTERNAL_ALLOWED_NETWORKS) hoặc có Bearer INTERNAL_ACCESS_TOKEN"""
+    token = Config.INTERNAL_ACCESS_TOKEN
+    auth_header = request.headers.get('Authorization', '')
+    if token and auth_header.startswith('Bearer ') and hmac.compare_digest(
+            auth_header[len('Bearer '):].encode('utf-8'), token.encode('utf-8')):
+        return True
+    try:
+        address = ipaddress.ip_address(request.remote_addr or '')
+    except ValueError:
+        return False
+    return any(address in network for network in _INTERNAL_NETWORKS)
+
+
+def require_internal_access(f):
+    """
+    Decorator cho endpoint vận hành (/metrics, /health/db): lộ pool, pid... -> chỉ nội bộ, ngoài ra trả 404
+
+    Usage:
+        @bp.route('/metrics', methods=['GET'])
+        @require_internal_access
+        def metrics():
+            pass
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not is_internal_request():
+            return jsonify({'error': 'Not found'}), 404
+        return f(*args, **kwargs)
+    return decorated_function
 
-permission_service = PermissionService(session)
-subscription_service = SubscriptionService(session)
 
 def require_permission(function_code, methods=None):
     """
@@ -47,21 +92,22 @@ def require_permission(function_code, methods=None):
                 return jsonify({'error': 'Missing token', 'debug': 'Token is empty'}), 401
             
             try:
-                payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
+                # Dùng lại claims đã verify trong middleware (không decode lại)
+                payload = get_verified_claims(token)
                 user_id = payload.get('user_id')
                 role_id = payload.get('role_id')
                 household_id = payload.get('household_id')
-            except jwt.ExpiredSignatureError:
-                return jsonify({'error': 'Token expired'}), 401
-            except jwt.InvalidTokenError:
-                return jsonify({'error': 'Invalid token'}), 401
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 401
+            
+            # 2. Resolve user status + permission + subscription (cache, hoặc 1 fused query)
+            context = authorization_service.resolve(user_id, role_id, household_id, function_code, claims=payload)
             
-            # 2. Check user có tồn tại và active không
-            user = session.query(User).filter_by(id=user_id).first()
-            if not user:
+            # Check user có tồn tại và active không
+            if context is None:
                 return jsonify({'error': 'User not found'}), 404
             
-            if hasattr(user, 'status') and user.status.upper() != 'ACTIVE':
+            if context.user_status and context.user_status.upper() != 'ACTIVE':
                 return jsonify({'error': 'User is inactive'}), 403
             
             # 3. Check role có function code không
@@ -69,11 +115,7 @@ def require_permission(function_code, methods=None):
             if methods and http_method not in methods:
                 return jsonify({'error': f'Method {http_method} not allowed'}), 405
             
-            has_permission = permission_service.check_role_has_function(
-                role_id=role_id,
-                function_code=function_code,
-                http_method=http_method
-            )
+            has_permission = bool(context.permission_mask & Function.method_bit(http_method))
             
             if not has_permission:
                 return jsonify({
@@ -82,7 +124,7 @@ def require_permission(function_code, methods=None):
             
             # 4. Check subscription (nếu Owner/Employee)
             if household_id:  # Không phải Admin
-                if not subscription_service.check_household_subscription_active(household_id):
+                if not context.subscription_active:
                     return jsonify({'error': 'Household subscription is not active'}), 403
             
             # 5. Lưu thông tin vào g (Flask context) để dùng trong controller
@@ -0,0 +1,45 @@
+"""
+Cache Decorators - Conditional GET (ETag / Last-Modified) cho list reference data của household
+"""
+import hashlib
+from functools import wraps
+from flask import g, make_response, request
+
+
+def conditional_list(get_version):
+    """
+    Decorator ETag/Last-Modified cho list endpoint theo household hiện tại (g.household_id)
+
+    - ETag = version stamp của collection + query string (mỗi trang/filter/fields có ETag riêng)
+    - If-None-Match khớp -> 304 ngay, không load row (chỉ đọc version stamp, thường từ cache)
+    - Cache-Control: private, no-cache -> client luôn hỏi lại server, dữ liệu theo token nên không cache dùng chung
+
+    Args:
+        get_version: household_id -> CollectionVersion (vd: category_service.categories_version)
+
+    Usage:
+        @owner_bp.route("", methods=["GET"])
+        @require_permission("F105", ["GET"])
+        @query_budget(5)
+        @conditional_list(category_service.categories_version)
+        def owner_list_categories():
+            pass
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            version = get_version(g.household_id)
+            etag = hashlib.sha1(version.tag.encode('ascii') + b'?' + request.query_string).hexdigest()[:27]
+            if request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            if version.last_modified is not None:
+                response.last_modified = version.last_modified
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return decorated_function
+    return decorator
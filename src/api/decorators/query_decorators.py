@@ -0,0 +1,29 @@
+"""
+Query Decorators - Khai báo số SQL statement tối đa của endpoint
+"""
+
+
+def query_budget(max_queries):
+    """
+    Decorator khai báo query budget của endpoint (tính cả query của require_permission)
+
+    Vượt budget: log warning, hoặc trả 500 khi SQL_STRICT_MODE bật (test fail ngay).
+    Không dùng cho endpoint streaming (stream_response): query chạy khi gửi body, sau khi thống kê đã dừng.
+
+    Usage:
+        @bp.route('/products', methods=['GET'])
+        @require_permission(function_code="F104", methods=["GET"])
+        @query_budget(4)
+        def list_products():
+            pass
+    """
+    def decorator(f):
+        # functools.wraps của các decorator bên ngoài copy __dict__ -> attribute đi theo view function
+        f.query_budget = max_queries
+        return f
+    return decorator
+
+
+def get_query_budget(view_function):
+    """Query budget đã khai báo của view function, None nếu không có"""
+    return getattr(view_function, 'query_budget', None)
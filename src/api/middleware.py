@@ -1,11 +1,12 @@
 # Middleware functions for processing requests and responses
 
 from flask import request, jsonify, g, current_app
-import jwt
-
-def log_request_info(app):
-    app.logger.debug('Headers: %s', request.headers)
-    app.logger.debug('Body: %s', request.get_data())
+from api.utils.auth_utils import get_verified_claims
+from api.decorators.query_decorators import get_query_budget
+from api.compression import compress_response
+from api.access_log import start_access_log, access_log_response
+from infrastructure.databases.query_stats import start_query_stats, stop_query_stats
+from config import get_config
 
 def handle_options_request():
     return jsonify({'message': 'CORS preflight response'}), 200
@@ -19,6 +20,41 @@ def add_custom_headers(response):
     response.headers['X-Custom-Header'] = 'Value'
     return response
 
+def query_stats_response(app, response):
+    """
+    Server-Timing + log thống kê SQL của request, strict mode trả 500 khi vượt budget hoặc có N+1
+
+    Response streaming: query còn chạy khi gửi body (sau hàm này) -> không gửi Server-Timing và không đưa
+    số liệu (thiếu) vào access log
+    """
+    stats = stop_query_stats()
+    if stats is None:
+        return response
+    if response.is_streamed:
+        return response
+    g.query_stats = stats  # access log dùng lại
+    response.headers.add('Server-Timing', stats.server_timing())
+    app.logger.debug('%s %s: %d queries, %.2f ms DB', request.method, request.path,
+                     stats.count, stats.duration * 1000)
+
+    config = get_config()
+    problems = []
+    budget = get_query_budget(app.view_functions.get(request.endpoint))
+    if budget is not None and stats.count > budget:
+        problems.append(f'Query budget exceeded: {stats.count} statements (budget {budget})')
+    for statement, count in stats.repeated(config.SQL_REPEATED_STATEMENT_THRESHOLD):
+        problems.append(f'Repeated statement ({count}x, possible N+1): {" ".join(statement.split())[:200]}')
+    if not problems:
+        return response
+    for problem in problems:
+        app.logger.warning('%s %s: %s', request.method, request.path, problem)
+    if config.SQL_STRICT_MODE:
+        strict_response = jsonify({'error': 'SQL strict mode', 'problems': problems})
+        strict_response.status_code = 500
+        strict_response.headers.add('Server-Timing', stats.server_timing())
+        return strict_response
+    return response
+
 def decode_jwt_middleware():
     """Decode JWT token và lưu vào Flask context (g)"""
     # Skip cho các endpoint public (login, swagger, docs)
@@ -30,23 +66,28 @@ def decode_jwt_middleware():
     if auth_header and auth_header.startswith('Bearer '):
         try:
             token = auth_header.split(' ')[1]
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
+            # Verify một lần, claims được lưu trong g để decorator dùng lại
+            payload = get_verified_claims(token)
             g.user_id = payload.get('user_id')
             g.role_id = payload.get('role_id')
             g.household_id = payload.get('household_id')
-        except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
+        except ValueError:
             # Lỗi sẽ được xử lý bởi decorator
             pass
 
 def middleware(app):
     @app.before_request
     def before_request():
-        log_request_info(app)
+        start_query_stats()  # Đếm SQL statement của request này
+        start_access_log()  # Request id + sampling, không đọc header/body ở đây
         decode_jwt_middleware()  # Decode JWT và lưu vào g
 
     @app.after_request
     def after_request(response):
-        return add_custom_headers(response)
+        response = query_stats_response(app, response)
+        response = add_custom_headers(response)
+        response = compress_response(response)  # Nén body đã hoàn chỉnh
+        return access_log_response(response)  # Cuối cùng: log kích thước body thực gửi đi
 
     @app.errorhandler(Exception)
     def handle_exception(error):
@@ -13,6 +13,7 @@ from api.controllers.household_controller import owner_bp as owner_household_bp
 from api.controllers.subscription_plan_controller import admin_bp as admin_subscription_plan_bp, public_bp as public_subscription_plan_bp, owner_bp as owner_subscription_plan_bp
 from api.controllers.subscription_controller import admin_bp as admin_subscription_bp, owner_bp as owner_subscription_bp
 from api.controllers.registration_controller import bp as public_registration_bp
+from api.controllers.health_controller import bp as health_bp
 
 def register_routes(app):
     # Todo (sample module)
@@ -47,3 +48,6 @@ def register_routes(app):
     # Public endpoints (không cần auth)
     app.register_blueprint(public_subscription_plan_bp)  # GET /api/public/subscription-plans
     app.register_blueprint(public_registration_bp)  # POST /api/public/register
+    
+    # Health check + metrics (không cần auth)
+    app.register_blueprint(health_bp)  # GET /health/db, GET /metrics
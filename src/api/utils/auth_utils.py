@@ -1,9 +1,56 @@
 """
 Auth utilities - Lấy thông tin từ JWT token
 """
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 import jwt
 from flask import request, current_app, g
 from functools import wraps
+from config import Config
+
+
+class VerifiedTokenCache:
+    """
+    LRU có giới hạn: sha256(secret + token) -> claims đã verify
+
+    Token lặp lại (client gọi liên tục) không phải verify HMAC + parse JSON lại.
+    Entry bị loại khi claims hết hạn (exp), nên token expired vẫn bị reject.
+    """
+    def __init__(self, maxsize=None):
+        self.maxsize = Config.JWT_CLAIMS_CACHE_SIZE if maxsize is None else maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            claims = self._entries.get(key)
+            if claims is None:
+                return None
+            exp = claims.get('exp')
+            if exp is not None and exp <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def set(self, key, claims):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = claims
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache()
+
 
 def get_current_user_id():
     """Lấy user_id từ JWT token (đã decode trong middleware)"""
@@ -18,14 +65,40 @@ def get_current_household_id():
     return getattr(g, 'household_id', None)
 
 def decode_jwt_token(token):
-    """Decode JWT token và trả về payload"""
-    try:
-        payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
+    """Decode JWT token và trả về payload (dùng LRU token đã verify)"""
+    secret_key = current_app.config['SECRET_KEY']
+    cache_key = hashlib.sha256(f'{secret_key}.{token}'.encode('utf-8')).hexdigest()
+    payload = verified_token_cache.get(cache_key)
+    if payload is not None:
         return payload
+    try:
+        payload = jwt.decode(token, secret_key, algorithms=['HS256'])
     except jwt.ExpiredSignatureError:
         raise ValueError('Token expired')
     except jwt.InvalidTokenError:
         raise ValueError('Invalid token')
+    verified_token_cache.set(cache_key, payload)
+    return payload
+
+def get_verified_claims(token):
+    """
+    Claims đã verify của token trong request hiện tại
+
+    Decode một lần mỗi request: kết quả (hoặc lỗi) được lưu trong g và dùng lại
+    cho middleware, require_permission và các controller.
+    Raise ValueError('Token expired' / 'Invalid token') nếu token không hợp lệ.
+    """
+    if getattr(g, 'jwt_token', None) != token:
+        g.jwt_token = token
+        g.jwt_claims = None
+        g.jwt_error = None
+        try:
+            g.jwt_claims = decode_jwt_token(token)
+        except ValueError as e:
+            g.jwt_error = str(e)
+    if g.jwt_error:
+        raise ValueError(g.jwt_error)
+    return g.jwt_claims
 
 def get_token_from_header():
     """Lấy token từ Authorization header"""
@@ -0,0 +1,101 @@
+"""
+Pagination helpers cho controller: query params -> PageRequest, Page -> response (body là JSON array)
+
+Query params:
+    limit          số item mỗi trang (mặc định DEFAULT_PAGE_SIZE, tối đa MAX_PAGE_SIZE)
+    cursor         giá trị header X-Next-Cursor của trang trước
+    sort           tên cột, thêm '-' phía trước để sort giảm dần (vd: sort=-created_at)
+    search         tìm kiếm contains (không phân biệt hoa thường)
+    include_total  true -> header X-Total-Count
+    fields         cột cần trả về, phân cách bởi dấu phẩy (vd: fields=id,name) - giảm payload cho mobile
+    <filter>=...   các param còn lại là filter bằng (vd: status=Active)
+
+Response headers:
+    X-Next-Cursor, Link: <...>; rel="next"  (không có ở trang cuối)
+    X-Total-Count                           (khi include_total=true)
+"""
+from urllib.parse import urlencode
+from flask import request
+from api.serialization import json_response
+from domain.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from domain.models.page import InvalidPageRequest, PageRequest
+
+RESERVED_PARAMS = ('limit', 'cursor', 'sort', 'search', 'include_total', 'fields')
+
+
+def fields_from_args(args=None, allowed=None):
+    """
+    Parse ?fields=id,name thành tuple (giữ thứ tự, bỏ trùng), None nếu không có
+
+    Args:
+        allowed: tên field hợp lệ (None = để repository kiểm tra theo cột của bảng)
+    Raises:
+        InvalidPageRequest nếu có field không nằm trong allowed
+    """
+    args = request.args if args is None else args
+    fields = tuple(dict.fromkeys(name.strip() for name in (args.get('fields') or '').split(',') if name.strip()))
+    if not fields:
+        return None
+    if allowed is not None:
+        unknown = set(fields) - set(allowed)
+        if unknown:
+            raise InvalidPageRequest(f'Unsupported fields: {", ".join(sorted(unknown))}')
+    return fields
+
+
+def page_request_from_args(args=None, default_sort='id', ignore=()):
+    """
+    Parse query params thành PageRequest
+
+    Args:
+        ignore: param không phải filter (endpoint tự xử lý, 'search' trong ignore -> không set search)
+    Raises:
+        InvalidPageRequest nếu limit không hợp lệ
+    """
+    args = request.args if args is None else args
+    try:
+        limit = int(args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise InvalidPageRequest('limit must be an integer')
+    if limit < 1:
+        raise InvalidPageRequest('limit must be >= 1')
+    sort = args.get('sort') or default_sort
+    descending = sort.startswith('-')
+    filters = {
+        key: value for key, value in args.items()
+        if key not in RESERVED_PARAMS and key not in ignore and value != ''
+    }
+    return PageRequest(
+        limit=min(limit, MAX_PAGE_SIZE),
+        cursor=args.get('cursor') or None,
+        sort=sort.lstrip('-'),
+        descending=descending,
+        filters=filters,
+        search=None if 'search' in ignore else args.get('search') or None,
+        include_total=args.get('include_total', '').lower() in ('true', '1'),
+        fields=fields_from_args(args)
+    )
+
+
+def sparse_items(items, fields, encoder):
+    """Item -> dict cho response bằng Encoder, fields=None -> mọi field, ngược lại chỉ các field yêu cầu"""
+    encode = encoder.project(fields)
+    return [encode(item) for item in items]
+
+
+def page_headers(page, args=None) -> dict:
+    """Header X-Next-Cursor/Link/X-Total-Count của một trang (args: query params cho Link, mặc định request.args)"""
+    headers = {}
+    if page.next_cursor:
+        headers['X-Next-Cursor'] = page.next_cursor
+        args = (request.args if args is None else args).to_dict()
+        args['cursor'] = page.next_cursor
+        headers['Link'] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    if page.total is not None:
+        headers['X-Total-Count'] = str(page.total)
+    return headers
+
+
+def paginated_response(items, page, status=200):
+    """JSON array + header X-Next-Cursor/Link/X-Total-Count"""
+    return json_response(items, headers=page_headers(page)), status
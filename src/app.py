@@ -2,16 +2,20 @@ from flask import Flask, jsonify
 from api.swagger import spec
 from api.middleware import middleware
 from infrastructure.databases import init_db
-from config import Config
+from config import get_config
+from app_logging import setup_logging
 from flasgger import Swagger
 from config import SwaggerConfig
 from flask_swagger_ui import get_swaggerui_blueprint
 from api.routes import register_routes
+from infrastructure.databases.mssql import session
+from services.permission_service import permission_matrix
 
 
 def create_app():
     app = Flask(__name__)
-    app.config.from_object(Config)
+    app.config.from_object(get_config())  # Cùng class với `Config` mà các module đọc
+    setup_logging(app)  # Ghi log qua queue + thread nền
     Swagger(app)
     
     # Register all routes
@@ -32,13 +36,22 @@ def create_app():
     except Exception as e:
         print(f"Error initializing database: {e}")
 
+    # Load RBAC permission matrix một lần khi startup
+    try:
+        permission_matrix.load(session)
+    except Exception as e:
+        session.rollback()
+        print(f"Error loading permission matrix: {e}")
+    finally:
+        session.remove()  # Không giữ connection của thread khởi động
+
     # Register middleware
     middleware(app)
 
     # Register routes for Swagger
     with app.test_request_context():
         for rule in app.url_map.iter_rules():
-            if rule.endpoint.startswith(('todo.', 'auth.', 'admin_', 'owner_', 'employee_', 'public')):
+            if rule.endpoint.startswith(('todo.', 'auth.', 'admin_', 'owner_', 'employee_', 'public', 'health.')):
                 view_func = app.view_functions[rule.endpoint]
                 print(f"Adding path: {rule.rule} -> {view_func}")
                 spec.path(view=view_func)
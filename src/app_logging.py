@@ -1,13 +1,159 @@
+"""
+Logging setup - mọi handler ghi file/console chạy trên thread nền (QueueHandler -> QueueListener)
+
+- Request thread chỉ đưa LogRecord vào queue (không chờ I/O), queue đầy thì bỏ record + đếm, không block
+- Log ứng dụng: text, kèm request_id của request đang xử lý -> LOG_FILE + stderr
+- Access log (logger ACCESS_LOGGER_NAME, xem api/access_log.py): mỗi request một dòng JSON -> ACCESS_LOG_FILE + stdout
+- JSON của access log được serialize trên thread nền
+- Mỗi process một thread nền: gunicorn preload_app gọi setup_logging() trong master, worker sau fork
+  tự tạo queue + thread mới (os.register_at_fork / kiểm tra pid)
+"""
+import atexit
+import json
 import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from flask import g, has_request_context
+from config import Config
+from infrastructure.metrics import Sample, metrics_registry
+
+ACCESS_LOGGER_NAME = 'access'
+APP_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s'
+
+_listener = None
+_listener_pid = None
+_queue_handler = None
+_handlers = ()
+_setup_lock = threading.Lock()
+
+
+class RequestIdFilter(logging.Filter):
+    """Gắn request_id của request hiện tại vào record (chạy trên request thread, trước khi vào queue)"""
+    def filter(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = g.get('request_id', '-') if has_request_context() else '-'
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler không bao giờ chờ: queue đầy -> bỏ record, tăng bộ đếm dropped"""
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.reset(log_queue)
+
+    def reset(self, log_queue):
+        """Queue + bộ đếm mới (sau fork: queue của process cha không có thread nào đọc)"""
+        self.queue = log_queue
+        self._lock_dropped = threading.Lock()
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock_dropped:
+                self.dropped += 1
+
+    def samples(self):
+        return [Sample('log_records_dropped_total', self.dropped, None,
+                       'Log records dropped because the log queue was full', 'counter')]
+
+
+class JsonAccessFormatter(logging.Formatter):
+    """Một dòng JSON: ts, level + các field của record.access"""
+    def format(self, record):
+        entry = {'ts': self.formatTime(record), 'level': record.levelname}
+        entry.update(getattr(record, 'access', None) or {'message': record.getMessage()})
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+    def formatTime(self, record, datefmt=None):
+        return super().formatTime(record, '%Y-%m-%dT%H:%M:%S') + f'.{int(record.msecs):03d}'
+
+
+def _only_access(record):
+    return record.name == ACCESS_LOGGER_NAME
+
+
+def _exclude_access(record):
+    return record.name != ACCESS_LOGGER_NAME
+
+
+def _handler(handler, formatter, record_filter):
+    handler.setFormatter(formatter)
+    handler.addFilter(record_filter)
+    return handler
+
+
+def setup_logging(app=None):
+    """
+    Cấu hình root logger + access logger một lần cho mỗi process (gọi lại thì bỏ qua)
+
+    Args:
+        app: Flask app (tùy chọn) - app.logger dùng chung handler của root
+    """
+    global _queue_handler, _handlers
+    with _setup_lock:
+        if _queue_handler is not None:
+            if _listener is None or _listener_pid != os.getpid():
+                _start_listener()
+            return
+        level = getattr(logging, Config.LOG_LEVEL.upper(), logging.INFO)
+        app_formatter = logging.Formatter(APP_LOG_FORMAT)
+        handlers = [_handler(logging.StreamHandler(sys.stderr), app_formatter, _exclude_access)]
+        if Config.LOG_FILE:
+            handlers.append(_handler(logging.FileHandler(Config.LOG_FILE, encoding='utf-8'),
+                                     app_formatter, _exclude_access))
+        access_formatter = JsonAccessFormatter()
+        handlers.append(_handler(logging.StreamHandler(sys.stdout), access_formatter, _only_access))
+        if Config.ACCESS_LOG_FILE:
+            handlers.append(_handler(logging.FileHandler(Config.ACCESS_LOG_FILE, encoding='utf-8'),
+                                     access_formatter, _only_access))
+
+        _queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=Config.LOG_QUEUE_SIZE))
+        _queue_handler.addFilter(RequestIdFilter())
+        _handlers = tuple(handlers)
+        root = logging.getLogger()
+        root.setLevel(level)
+        root.addHandler(_queue_handler)
+        logging.getLogger(ACCESS_LOGGER_NAME).setLevel(level)
+        if app is not None:
+            app.logger.setLevel(level)
+
+        _start_listener()
+        atexit.register(stop_logging)
+        metrics_registry.register(_queue_handler.samples)
+
+
+def _start_listener():
+    """Thread nền của process hiện tại; process con (pid khác) dùng queue mới"""
+    global _listener, _listener_pid
+    if _listener_pid is not None and _listener_pid != os.getpid():
+        _queue_handler.reset(queue.Queue(maxsize=Config.LOG_QUEUE_SIZE))
+    _listener = QueueListener(_queue_handler.queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+    _listener_pid = os.getpid()
+
+
+def _after_fork():
+    """os.register_at_fork: thread nền của process cha không tồn tại trong process con"""
+    global _setup_lock
+    _setup_lock = threading.Lock()  # Có thể đang bị giữ bởi thread khác của process cha
+    if _queue_handler is not None and _listener_pid != os.getpid():
+        _start_listener()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
+
 
-def setup_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler("app.log"),
-            logging.StreamHandler()
-        ]
-    )
-
-setup_logging() 
\ No newline at end of file
+def stop_logging():
+    """Ghi hết record còn trong queue rồi dừng thread nền (atexit)"""
+    global _listener
+    with _setup_lock:
+        if _listener is None or _listener_pid != os.getpid():
+            return
+        _listener.stop()
+        _listener = None
@@ -1,6 +1,8 @@
 # Dependency Injection Container
 
 from dependency_injector import containers, providers
+from config import Config
+from infrastructure.cache import create_cache_backend, create_invalidation_bus
 
 # Import your services and repositories here
 # from infrastructure.repositories import SomeRepository
@@ -11,4 +13,19 @@ class Container(containers.DeclarativeContainer):
     # some_repository = providers.Factory(SomeRepository)
     # some_service = providers.Factory(SomeService, repository=some_repository)
 
-    pass  # This file is intentionally left blank for now.
\ No newline at end of file
+    # Cache backend dùng chung (memory:// trong process, redis:// dùng chung giữa các worker)
+    cache_backend = providers.Singleton(
+        create_cache_backend,
+        url=Config.CACHE_URL,
+        max_entries=Config.CACHE_MAX_ENTRIES,
+        key_prefix=Config.CACHE_KEY_PREFIX
+    )
+
+    # Bus phát sự kiện "namespace/key changed" để cache ở mọi worker drop entry cũ
+    invalidation_bus = providers.Singleton(
+        create_invalidation_bus,
+        url=Config.INVALIDATION_BUS_URL
+    )
+
+
+container = Container()
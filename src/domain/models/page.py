@@ -0,0 +1,35 @@
+from domain.constants import DEFAULT_PAGE_SIZE
+
+
+class InvalidPageRequest(ValueError):
+    """limit/sort/filter/cursor không hợp lệ (controller trả 400)"""
+
+
+class PageRequest:
+    """
+    Tham số phân trang keyset + filter/sort cho các list
+
+    - sort: tên cột sort, descending=True để sort giảm dần (id luôn là tie-breaker)
+    - cursor: opaque cursor lấy từ Page.next_cursor của trang trước
+    - filters: {tên filter: giá trị (string từ query param)}, so sánh bằng
+    - search: chuỗi tìm kiếm (contains, không phân biệt hoa thường) trên các cột search của list
+    - fields: tên cột cần trả về (sparse fieldset), None = mọi cột
+    """
+    def __init__(self, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None, sort: str = 'id',
+                 descending: bool = False, filters: dict = None, search: str = None,
+                 include_total: bool = False, fields: tuple = None):
+        self.limit = limit
+        self.cursor = cursor
+        self.sort = sort
+        self.descending = descending
+        self.filters = filters or {}
+        self.search = search
+        self.include_total = include_total
+        self.fields = fields
+
+
+class Page:
+    def __init__(self, items: list = None, next_cursor: str = None, total: int = None):
+        self.items = items or []
+        self.next_cursor = next_cursor  # None nếu là trang cuối
+        self.total = total  # None nếu không yêu cầu include_total
@@ -0,0 +1,30 @@
+"""
+Gunicorn config - tất cả tham số chỉnh được qua biến môi trường
+
+    GUNICORN_BIND            (default 0.0.0.0:6868)
+    WEB_CONCURRENCY          số worker process (default 2 * CPU + 1)
+    GUNICORN_THREADS         số thread mỗi worker (default 4, > 1 dùng worker gthread)
+    GUNICORN_MAX_REQUESTS    recycle worker sau N request (default 1000, 0 = tắt)
+    GUNICORN_MAX_REQUESTS_JITTER
+    GUNICORN_TIMEOUT / GUNICORN_GRACEFUL_TIMEOUT / GUNICORN_KEEPALIVE
+    GUNICORN_PRELOAD         load app trong master trước khi fork (default True)
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:6868')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread' if threads > 1 else 'sync'
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', max_requests // 10))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True').lower() in ['true', '1']
+
+
+def post_fork(server, worker):
+    # Với preload_app, master đã tạo engine khi create_app() -> worker bỏ pool kế thừa, tạo connection riêng
+    from infrastructure.databases.mssql import dispose_engine_after_fork
+    dispose_engine_after_fork()
@@ -0,0 +1,34 @@
+from infrastructure.cache.base import ICacheBackend, NamespacedCache, CacheError
+from infrastructure.cache.memory import MemoryCacheBackend
+from infrastructure.cache.redis import RedisCacheBackend
+from infrastructure.cache.invalidation import (
+    IInvalidationBus, InProcessInvalidationBus, RedisInvalidationBus, create_invalidation_bus
+)
+
+
+def create_cache_backend(url: str = 'memory://', max_entries: int = 10000, key_prefix: str = '') -> ICacheBackend:
+    """
+    Tạo cache backend từ URL
+
+    - memory://                       -> MemoryCacheBackend (LRU trong process)
+    - redis://[:password@]host:port/db -> RedisCacheBackend (dùng chung giữa các worker)
+    """
+    if not url or url.startswith('memory://'):
+        return MemoryCacheBackend(max_entries=max_entries, key_prefix=key_prefix)
+    if url.startswith('redis://'):
+        return RedisCacheBackend.from_url(url, key_prefix=key_prefix)
+    raise ValueError(f'Unsupported cache URL: {url}')
+
+
+__all__ = [
+    'ICacheBackend',
+    'NamespacedCache',
+    'CacheError',
+    'MemoryCacheBackend',
+    'RedisCacheBackend',
+    'create_cache_backend',
+    'IInvalidationBus',
+    'InProcessInvalidationBus',
+    'RedisInvalidationBus',
+    'create_invalidation_bus'
+]
@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+
+
+class CacheError(Exception):
+    """Lỗi giao tiếp với cache backend (mất kết nối, protocol error...)"""
+    pass
+
+
+class ICacheBackend(ABC):
+    """
+    Interface chung cho cache backend (in-process LRU, Redis...)
+
+    - ttl tính bằng giây (float), None = không hết hạn (vẫn có thể bị LRU loại)
+    - get trả None khi miss, nên không cache giá trị None
+    - Giá trị phải serialize được sang JSON (dict/list/str/int/float/bool)
+    """
+    @abstractmethod
+    def get(self, key: str):
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value, ttl: float = None) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def incr(self, key: str, amount: int = 1, ttl: float = None) -> int:
+        """Tăng counter (tạo mới với giá trị amount nếu chưa có), ttl chỉ áp dụng khi tạo mới"""
+        pass
+
+    def namespace(self, name: str, versioned: bool = False) -> 'NamespacedCache':
+        return NamespacedCache(self, name, versioned=versioned)
+
+
+class NamespacedCache:
+    """
+    View của backend với key có prefix "<namespace>:"
+
+    Versioned namespace: key thực tế là "<namespace>:v<version>:<key>", version lưu ở
+    "<namespace>:__version__". bump_version() invalidate toàn bộ namespace trong 1 lệnh,
+    key cũ không còn được đọc và tự hết hạn theo TTL/LRU.
+    """
+    def __init__(self, backend: ICacheBackend, name: str, versioned: bool = False):
+        self.backend = backend
+        self.name = name
+        self.versioned = versioned
+        self._version_key = f'{name}:__version__'
+
+    def _key(self, key) -> str:
+        if self.versioned:
+            version = self.backend.get(self._version_key) or 0
+            return f'{self.name}:v{version}:{key}'
+        return f'{self.name}:{key}'
+
+    def get(self, key):
+        return self.backend.get(self._key(key))
+
+    def set(self, key, value, ttl: float = None) -> None:
+        self.backend.set(self._key(key), value, ttl)
+
+    def delete(self, key) -> None:
+        self.backend.delete(self._key(key))
+
+    def incr(self, key, amount: int = 1, ttl: float = None) -> int:
+        return self.backend.incr(self._key(key), amount, ttl)
+
+    def bump_version(self) -> int:
+        """Invalidate toàn bộ key trong namespace (chỉ dùng cho versioned namespace)"""
+        return self.backend.incr(self._version_key)
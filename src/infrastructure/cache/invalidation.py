@@ -0,0 +1,198 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from infrastructure.cache.base import CacheError
+from infrastructure.cache.redis import RedisConnection, parse_redis_url
+
+logger = logging.getLogger(__name__)
+
+# Namespace dùng chung giữa publisher (repository/service ghi dữ liệu) và subscriber (cache)
+NS_RBAC = 'rbac'                        # functions, role_functions -> permission matrix
+NS_ROLES = 'roles'                      # roles -> role registry
+NS_USER_STATUS = 'user_status'          # key = user_id
+NS_SUBSCRIPTION = 'subscription_active'  # key = household_id
+NS_PRODUCTS = 'products'                # key = 'household_id:product_id' -> product search index
+NS_SUBSCRIPTION_PLANS = 'subscription_plans'  # key = None (cả catalog) -> public plan catalog
+NS_COLLECTIONS = 'collections'          # key = collection_key(collection, household_id) -> ETag của list reference data
+
+# Collection có version stamp (conditional GET) trong NS_COLLECTIONS
+COLLECTION_PRODUCTS = 'products'
+COLLECTION_CATEGORIES = 'categories'
+COLLECTION_UNITS = 'units'
+COLLECTION_WAREHOUSES = 'warehouses'
+
+
+def collection_key(collection: str, household_id) -> str:
+    return f'{collection}:{household_id}'
+
+
+class IInvalidationBus(ABC):
+    """
+    Bus phát sự kiện "namespace/key changed" khi dữ liệu được cache bị thay đổi
+
+    - publish() gọi sau khi commit, handler local được gọi ngay (đồng bộ)
+    - Backend cross-process chuyển sự kiện tới các worker khác, handler ở đó được gọi
+      trên listener thread
+    - key=None nghĩa là cả namespace thay đổi
+    """
+    def __init__(self):
+        self._handlers = {}  # namespace -> [handler(namespace, key)]
+        self._handlers_lock = threading.Lock()
+
+    def subscribe(self, namespace: str, handler) -> None:
+        with self._handlers_lock:
+            self._handlers.setdefault(namespace, []).append(handler)
+
+    def dispatch(self, namespace: str, key=None) -> None:
+        """Gọi các handler local đã subscribe namespace"""
+        for handler in list(self._handlers.get(namespace, ())):
+            try:
+                handler(namespace, key)
+            except Exception:
+                logger.exception('Invalidation handler failed for %s/%s', namespace, key)
+
+    @abstractmethod
+    def publish(self, namespace: str, key=None) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class InProcessInvalidationBus(IInvalidationBus):
+    """Bus trong process: chỉ gọi handler local (1 worker hoặc cache dùng chung hoàn toàn)"""
+    def publish(self, namespace: str, key=None) -> None:
+        self.dispatch(namespace, key)
+
+
+class RedisInvalidationBus(IInvalidationBus):
+    """
+    Bus cross-worker qua Redis pub/sub (PUBLISH/SUBSCRIBE)
+
+    - Mỗi process có 1 listener thread (daemon) giữ kết nối SUBSCRIBE, tự reconnect khi mất kết nối
+    - Sự kiện do chính process publish đã được dispatch local nên bị bỏ qua khi nhận lại
+    - Listener khởi động khi subscribe; sau fork (gunicorn preload_app: subscribe chạy trong master lúc import)
+      process con tự khởi động listener riêng qua os.register_at_fork, kể cả worker chỉ đọc không publish
+    """
+    def __init__(self, host='127.0.0.1', port=6379, db=0, password=None,
+                 channel='bizflow:invalidation', reconnect_delay=1.0):
+        super().__init__()
+        self.connection_kwargs = {'host': host, 'port': port, 'db': db, 'password': password}
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.node_id = None
+        self._pid = None
+        self._publisher = None
+        self._publisher_lock = threading.Lock()
+        self._listener = None
+        self._listener_connection = None
+        self._closed = False
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisInvalidationBus':
+        return cls(**parse_redis_url(url), **kwargs)
+
+    def _ensure_process(self):
+        """Reset state kế thừa từ process cha sau fork"""
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self.node_id = uuid.uuid4().hex
+            self._publisher = None
+            self._publisher_lock = threading.Lock()  # Lock có thể đang bị giữ bởi thread khác của process cha
+            self._listener = None
+            self._listener_connection = None
+
+    def _after_fork(self):
+        """Process con: thread listener của cha không tồn tại -> khởi động lại nếu đã có handler"""
+        if self._closed or not self._handlers:
+            return
+        try:
+            self._ensure_listener()
+        except Exception:
+            logger.exception('Cannot restart invalidation listener after fork')
+
+    def subscribe(self, namespace: str, handler) -> None:
+        super().subscribe(namespace, handler)
+        self._ensure_listener()
+
+    def _ensure_listener(self):
+        self._ensure_process()
+        if self._listener is None or not self._listener.is_alive():
+            self._listener = threading.Thread(target=self._listen, name='invalidation-bus', daemon=True)
+            self._listener.start()
+
+    def publish(self, namespace: str, key=None) -> None:
+        self._ensure_listener()
+        self.dispatch(namespace, key)
+        message = json.dumps({'ns': namespace, 'key': key, 'origin': self.node_id})
+        with self._publisher_lock:
+            for attempt in range(2):
+                try:
+                    if self._publisher is None:
+                        self._publisher = RedisConnection(socket_timeout=1.0, **self.connection_kwargs)
+                    self._publisher.execute('PUBLISH', self.channel, message)
+                    return
+                except CacheError as e:
+                    self._publisher = None
+                    if attempt:
+                        logger.warning('Invalidation publish %s/%s failed: %s', namespace, key, e)
+
+    def _listen(self):
+        disconnected = False
+        while not self._closed:
+            connection = RedisConnection(**self.connection_kwargs)
+            try:
+                connection.execute('SUBSCRIBE', self.channel)
+                self._listener_connection = connection
+                if disconnected:
+                    # Có thể đã bỏ lỡ sự kiện trong lúc mất kết nối -> drop toàn bộ namespace
+                    disconnected = False
+                    for namespace in list(self._handlers):
+                        self.dispatch(namespace, None)
+                while not self._closed:
+                    reply = connection.read_reply()
+                    if isinstance(reply, list) and len(reply) == 3 and reply[0] == b'message':
+                        self._handle_message(reply[2])
+            except CacheError as e:
+                if not self._closed and not disconnected:
+                    logger.warning('Invalidation listener disconnected: %s', e)
+                disconnected = True
+            finally:
+                connection.close()
+            if not self._closed:
+                time.sleep(self.reconnect_delay)
+
+    def _handle_message(self, data):
+        try:
+            message = json.loads(data)
+        except ValueError:
+            logger.warning('Invalid invalidation message: %r', data)
+            return
+        if message.get('origin') == self.node_id:
+            return
+        self.dispatch(message.get('ns'), message.get('key'))
+
+    def close(self) -> None:
+        self._closed = True
+        if self._listener_connection is not None:
+            self._listener_connection.close()
+
+
+def create_invalidation_bus(url: str = 'local://') -> IInvalidationBus:
+    """
+    Tạo invalidation bus từ URL
+
+    - local://                        -> InProcessInvalidationBus
+    - redis://[:password@]host:port/db -> RedisInvalidationBus (pub/sub giữa các worker)
+    """
+    if not url or url.startswith('local://'):
+        return InProcessInvalidationBus()
+    if url.startswith('redis://'):
+        return RedisInvalidationBus.from_url(url)
+    raise ValueError(f'Unsupported invalidation bus URL: {url}')
@@ -0,0 +1,67 @@
+import threading
+import time
+from collections import OrderedDict
+from infrastructure.cache.base import ICacheBackend
+
+
+class MemoryCacheBackend(ICacheBackend):
+    """
+    Cache in-process: LRU có giới hạn số entry, TTL theo từng entry
+
+    Dùng cho development/test hoặc khi chạy 1 worker. Mỗi process có cache riêng.
+    """
+    def __init__(self, max_entries: int = 10000, key_prefix: str = ''):
+        self.max_entries = max_entries
+        self.key_prefix = key_prefix
+        self._entries = OrderedDict()  # key -> (value, expires_at theo time.monotonic() hoặc None)
+        self._lock = threading.Lock()
+
+    def _get_entry(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and time.monotonic() >= entry[1]:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put(self, key, value, expires_at):
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._get_entry(self.key_prefix + key)
+            return entry[0] if entry else None
+
+    def set(self, key: str, value, ttl: float = None) -> None:
+        if ttl is not None and ttl <= 0:
+            self.delete(key)
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._put(self.key_prefix + key, value, expires_at)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(self.key_prefix + key, None)
+
+    def incr(self, key: str, amount: int = 1, ttl: float = None) -> int:
+        full_key = self.key_prefix + key
+        with self._lock:
+            entry = self._get_entry(full_key)
+            if entry is None:
+                expires_at = time.monotonic() + ttl if ttl is not None else None
+                value = amount
+            else:
+                value = int(entry[0]) + amount
+                expires_at = entry[1]
+            self._put(full_key, value, expires_at)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
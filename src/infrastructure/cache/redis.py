@@ -0,0 +1,210 @@
+import json
+import logging
+import os
+import socket
+import threading
+from urllib.parse import urlparse, unquote
+from infrastructure.cache.base import ICacheBackend, CacheError
+
+logger = logging.getLogger(__name__)
+
+
+class RedisConnection:
+    """
+    Kết nối RESP (Redis protocol) tối giản qua socket
+
+    Đủ cho các lệnh cache (GET/SET/DEL/INCRBY/PEXPIRE/PUBLISH...). Tương thích Redis,
+    KeyDB, Dragonfly và fake server dùng khi test.
+    """
+    def __init__(self, host, port, db=0, password=None, socket_timeout=None):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.socket_timeout = socket_timeout
+        self._sock = None
+        self._reader = None
+
+    def connect(self):
+        try:
+            self._sock = socket.create_connection((self.host, self.port), timeout=self.socket_timeout)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._reader = self._sock.makefile('rb')
+        except OSError as e:
+            self.close()
+            raise CacheError(f'Cannot connect to {self.host}:{self.port}: {e}')
+        if self.password:
+            self.execute('AUTH', self.password)
+        if self.db:
+            self.execute('SELECT', self.db)
+
+    def close(self):
+        for resource in (self._reader, self._sock):
+            if resource is not None:
+                try:
+                    resource.close()
+                except OSError:
+                    pass
+        self._sock = None
+        self._reader = None
+
+    @staticmethod
+    def encode_command(*args) -> bytes:
+        parts = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            if isinstance(arg, bytes):
+                data = arg
+            else:
+                data = str(arg).encode('utf-8')
+            parts.append(b'$%d\r\n%s\r\n' % (len(data), data))
+        return b''.join(parts)
+
+    def send(self, *args):
+        if self._sock is None:
+            self.connect()
+        try:
+            self._sock.sendall(self.encode_command(*args))
+        except OSError as e:
+            self.close()
+            raise CacheError(f'Error sending command to {self.host}:{self.port}: {e}')
+
+    def _read(self, size=None) -> bytes:
+        """readline() (size=None) hoặc đọc đúng size byte; lỗi socket/đọc thiếu -> đóng kết nối + CacheError"""
+        try:
+            data = self._reader.readline() if size is None else self._reader.read(size)
+        except OSError as e:
+            self.close()
+            raise CacheError(f'Error reading reply from {self.host}:{self.port}: {e}')
+        if not data or (size is not None and len(data) != size):
+            self.close()
+            raise CacheError(f'Connection to {self.host}:{self.port} closed')
+        return data
+
+    def _read_int(self, payload) -> int:
+        try:
+            return int(payload)
+        except ValueError:
+            self.close()
+            raise CacheError(f'Invalid integer in reply: {payload!r}')
+
+    def read_reply(self):
+        line = self._read()
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b'+':
+            return payload.decode('utf-8')
+        if prefix == b'-':
+            raise CacheError(payload.decode('utf-8'))
+        if prefix == b':':
+            return self._read_int(payload)
+        if prefix == b'$':
+            length = self._read_int(payload)
+            if length == -1:
+                return None
+            return self._read(length + 2)[:-2]
+        if prefix == b'*':
+            count = self._read_int(payload)
+            if count == -1:
+                return None
+            return [self.read_reply() for _ in range(count)]
+        self.close()
+        raise CacheError(f'Unknown reply type: {line!r}')
+
+    def execute(self, *args):
+        self.send(*args)
+        return self.read_reply()
+
+
+def parse_redis_url(url: str) -> dict:
+    """redis://[:password@]host[:port][/db] -> kwargs cho RedisConnection"""
+    parsed = urlparse(url)
+    db = parsed.path.lstrip('/')
+    return {
+        'host': parsed.hostname or '127.0.0.1',
+        'port': parsed.port or 6379,
+        'db': int(db) if db else 0,
+        'password': unquote(parsed.password) if parsed.password else None,
+    }
+
+
+class RedisCacheBackend(ICacheBackend):
+    """
+    Cache dùng chung giữa các gunicorn worker/server qua Redis protocol
+
+    - Mỗi thread một kết nối (RESP là request/response tuần tự)
+    - Giá trị serialize JSON
+    - Lỗi kết nối không làm fail request: get trả None (miss), set/delete bỏ qua, có log warning
+    """
+    def __init__(self, host='127.0.0.1', port=6379, db=0, password=None,
+                 socket_timeout=0.5, key_prefix=''):
+        self.connection_kwargs = {
+            'host': host, 'port': port, 'db': db,
+            'password': password, 'socket_timeout': socket_timeout,
+        }
+        self.key_prefix = key_prefix
+        self._local = threading.local()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisCacheBackend':
+        return cls(**parse_redis_url(url), **kwargs)
+
+    def _connection(self) -> RedisConnection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            # Kết nối mới sau fork: socket kế thừa từ process cha không được dùng chung
+            connection = RedisConnection(**self.connection_kwargs)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def execute(self, *args):
+        """Gửi 1 lệnh, retry 1 lần nếu kết nối cũ bị đóng (server restart, idle timeout)"""
+        connection = self._connection()
+        try:
+            return connection.execute(*args)
+        except CacheError:
+            if connection._sock is not None:
+                raise  # Lỗi từ server (-ERR), không phải lỗi kết nối
+            return connection.execute(*args)
+
+    def get(self, key: str):
+        try:
+            data = self.execute('GET', self.key_prefix + key)
+        except CacheError as e:
+            logger.warning('Cache GET %s failed: %s', key, e)
+            return None
+        return json.loads(data) if data is not None else None
+
+    def set(self, key: str, value, ttl: float = None) -> None:
+        args = ['SET', self.key_prefix + key, json.dumps(value, separators=(',', ':'))]
+        if ttl is not None:
+            if ttl <= 0:
+                self.delete(key)
+                return
+            args += ['PX', max(1, int(ttl * 1000))]
+        try:
+            self.execute(*args)
+        except CacheError as e:
+            logger.warning('Cache SET %s failed: %s', key, e)
+
+    def delete(self, key: str) -> None:
+        try:
+            self.execute('DEL', self.key_prefix + key)
+        except CacheError as e:
+            logger.warning('Cache DEL %s failed: %s', key, e)
+
+    def incr(self, key: str, amount: int = 1, ttl: float = None) -> int:
+        full_key = self.key_prefix + key
+        try:
+            value = self.execute('INCRBY', full_key, amount)
+            if ttl is not None and value == amount:
+                self.execute('PEXPIRE', full_key, max(1, int(ttl * 1000)))
+            return value
+        except CacheError as e:
+            logger.warning('Cache INCRBY %s failed: %s', key, e)
+            return None
+
+    def ping(self) -> bool:
+        try:
+            return self.execute('PING') == 'PONG'
+        except CacheError:
+            return False
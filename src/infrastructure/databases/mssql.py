@@ -1,12 +1,223 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from config import Config
+import contextlib
+import functools
+import itertools
+import os
+import threading
+from flask import g, has_request_context, request
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from sqlalchemy.sql.elements import TextClause
+from config import Config, get_config
+from dependency_container import container
 from infrastructure.databases.base import Base
+from infrastructure.databases.pool_metrics import InstrumentedQueuePool, instrument_engine
+from infrastructure.databases.query_stats import instrument_queries
 
 # Database configuration
 DATABASE_URI = Config.DATABASE_URI
-engine = create_engine(DATABASE_URI)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-session = SessionLocal()
+# Read replica (phân cách bởi dấu phẩy), để trống = mọi query chạy trên primary
+DATABASE_REPLICA_URIS = [uri.strip() for uri in Config.DATABASE_REPLICA_URIS.split(',') if uri.strip()]
+
+
+def engine_options(database_uri, config=None):
+    """Tham số pool cho create_engine từ Config (SQLite dùng pool mặc định của dialect)"""
+    config = config or get_config()
+    options = {
+        'pool_pre_ping': config.DB_POOL_PRE_PING,
+        'pool_recycle': config.DB_POOL_RECYCLE,
+    }
+    if not database_uri.startswith('sqlite'):
+        options.update({
+            'poolclass': InstrumentedQueuePool,
+            'pool_size': config.DB_POOL_SIZE,
+            'max_overflow': config.DB_MAX_OVERFLOW,
+            'pool_timeout': config.DB_POOL_TIMEOUT,
+        })
+    return options
+
+
+# Engine tạo lazily, mỗi process một bộ engine (pool connection không được dùng chung qua fork)
+_engines = {}  # database_uri -> engine
+_engines_pid = None
+_engine_lock = threading.Lock()
+
+
+def _get_engine_for(database_uri):
+    global _engines_pid
+    engine = _engines.get(database_uri)
+    if engine is not None and _engines_pid == os.getpid():
+        return engine
+    with _engine_lock:
+        if _engines_pid != os.getpid():
+            # Engine kế thừa từ process cha: bỏ pool cũ, KHÔNG đóng connection (process cha vẫn đang dùng)
+            for inherited in _engines.values():
+                inherited.dispose(close=False)
+            _engines_pid = os.getpid()
+        engine = _engines.get(database_uri)
+        if engine is None:
+            engine = create_engine(database_uri, **engine_options(database_uri))
+            instrument_engine(engine)
+            if get_config().SQL_INSTRUMENTATION_ENABLED:
+                instrument_queries(engine)
+            _engines[database_uri] = engine
+    return engine
+
+
+def get_engine():
+    """Engine primary của process hiện tại, tạo ở lần dùng đầu tiên"""
+    return _get_engine_for(DATABASE_URI)
+
+
+def get_replica_engines():
+    """Engine của các read replica (list rỗng nếu không cấu hình replica)"""
+    return [_get_engine_for(uri) for uri in DATABASE_REPLICA_URIS]
+
+
+def dispose_engine_after_fork():
+    """Gọi trong process con sau fork (gunicorn post_fork, os.register_at_fork)"""
+    global _engine_lock
+    _engine_lock = threading.Lock()  # Lock có thể đang bị giữ bởi thread khác của process cha lúc fork
+    if _engines:
+        get_engine()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=dispose_engine_after_fork)
+
+
+class ReplicaPins:
+    """
+    Ghim đọc của user vào primary trong REPLICA_LAG_TOLERANCE giây sau khi user ghi (read-your-writes)
+
+    Lưu trên cache backend dùng chung nên có hiệu lực ở mọi worker.
+    """
+    def __init__(self, backend=None, lag_tolerance=None):
+        backend = backend or container.cache_backend()
+        self.lag_tolerance = Config.REPLICA_LAG_TOLERANCE if lag_tolerance is None else lag_tolerance
+        self._cache = backend.namespace('replica_pin')
+
+    def pin(self, user_id):
+        if user_id is not None and self.lag_tolerance > 0:
+            self._cache.set(user_id, 1, self.lag_tolerance)
+
+    def is_pinned(self, user_id):
+        return user_id is not None and self._cache.get(user_id) is not None
+
+
+replica_pins = ReplicaPins()
+_replica_counter = itertools.count()
+
+
+def _current_user_id():
+    return getattr(g, 'user_id', None) if has_request_context() else None
+
+
+class RoutingSession(Session):
+    """
+    Session chọn engine theo từng statement
+
+    - Ghi (flush, INSERT/UPDATE/DELETE, text SQL) -> primary, và mọi đọc sau đó trong session cũng ở primary
+    - Đọc trong GET/HEAD request hoặc trong repository method đánh dấu @replica_read -> replica (round-robin),
+      trừ khi user vừa ghi trong REPLICA_LAG_TOLERANCE giây hoặc đang trong primary_reads()
+    - Không cấu hình replica -> luôn primary
+    """
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary = get_engine()
+        if not DATABASE_REPLICA_URIS:
+            return primary
+        if self._flushing or getattr(clause, 'is_dml', False) or isinstance(clause, TextClause):
+            self.info['wrote'] = True
+            return primary
+        if self.info.get('wrote') or self.info.get('primary_depth', 0) > 0 or not self._replica_allowed():
+            return primary
+        replicas = get_replica_engines()
+        return replicas[next(_replica_counter) % len(replicas)]
+
+    def _replica_allowed(self):
+        read_only = self.info.get('replica_depth', 0) > 0 or (
+            has_request_context() and request.method in ('GET', 'HEAD')
+        )
+        if not read_only:
+            return False
+        if 'pinned' not in self.info:
+            # Tra cứu một lần cho mỗi session (mỗi request)
+            self.info['pinned'] = replica_pins.is_pinned(_current_user_id())
+        return not self.info['pinned']
+
+
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
+# Session theo request: mỗi thread một Session riêng (repository/service dùng proxy này như Session thường),
+# được đóng ở teardown của mỗi request -> transaction của các request chạy song song không lẫn nhau
+session = scoped_session(SessionLocal)
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _pin_after_write(db_session):
+    if DATABASE_REPLICA_URIS and db_session.info.get('wrote'):
+        replica_pins.pin(_current_user_id())
+        db_session.info['pinned'] = True
+
+
+def replica_read(method):
+    """
+    Đánh dấu repository method chỉ đọc: query bên trong được phép chạy trên read replica
+
+    Không dùng cho method mà flow ghi (PUT/POST/DELETE) đọc để kiểm tra rồi sửa (vd: get_by_id) -
+    replica có thể trễ; trong GET request các method đó vẫn đọc replica theo routing của RoutingSession
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        info = self.session.info
+        info['replica_depth'] = info.get('replica_depth', 0) + 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            info['replica_depth'] -= 1
+    return wrapper
+
+
+@contextlib.contextmanager
+def primary_reads(db_session):
+    """Đọc trong block này luôn ở primary (kể cả GET request) - dữ liệu vừa được báo thay đổi, replica có thể trễ"""
+    info = db_session.info
+    info['primary_depth'] = info.get('primary_depth', 0) + 1
+    try:
+        yield
+    finally:
+        info['primary_depth'] -= 1
+
+
+def primary_read(method):
+    """Đánh dấu repository method luôn đọc primary (kết quả được cache/so sánh với lần ghi vừa xong)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with primary_reads(self.session):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def remove_session(exception=None):
+    """Teardown: rollback phần chưa commit (nếu request lỗi) và trả connection về pool"""
+    if exception is not None:
+        session.rollback()
+    session.remove()
+
+
 def init_mssql(app):
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    """
+    Đăng ký teardown session và kiểm tra schema version (1 query, không reflect bảng)
+
+    Schema cũ hơn head: tự chạy migration nếu DB_AUTO_MIGRATE, ngược lại chỉ log cảnh báo
+    (chạy `python -m migrations upgrade` khi deploy).
+    """
+    from migrations import runner
+    app.teardown_appcontext(remove_session)
+    engine = get_engine()
+    current, head = runner.current_version(engine), runner.head_revision()
+    if current is not None and current >= head:
+        return
+    if get_config().DB_AUTO_MIGRATE:
+        runner.upgrade(engine, log=app.logger.info)
+    else:
+        app.logger.warning('Database schema version %s is behind head %s, run: python -m migrations upgrade',
+                           current, head)
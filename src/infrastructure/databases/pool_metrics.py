@@ -0,0 +1,151 @@
+"""
+Connection pool instrumentation - số connection checked-out/idle/overflow và thời gian chờ lấy connection
+"""
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+from infrastructure.metrics import Sample
+
+
+class PoolStats:
+    """Counter cộng dồn của một pool (thread-safe)"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.errors = 0  # Lỗi mở connection (refused, login...), không phải hết connection trong pool
+        self.wait_count = 0
+        self.wait_total = 0.0  # giây
+        self.wait_max = 0.0
+
+    def record_wait(self, seconds, timed_out=False, failed=False):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total += seconds
+            if seconds > self.wait_max:
+                self.wait_max = seconds
+            if timed_out:
+                self.timeouts += 1
+            elif failed:
+                self.errors += 1
+
+    def increment(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool đo thời gian chờ lấy connection (gồm cả thời gian mở connection mới)"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        except Exception:
+            self.stats.record_wait(time.perf_counter() - start, failed=True)
+            raise
+        self.stats.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def instrument_engine(engine):
+    """Gắn listener pool events (connect/checkout/checkin/invalidate) vào engine"""
+    def stats():
+        pool_stats = getattr(engine.pool, 'stats', None)
+        if pool_stats is None:
+            pool_stats = engine.pool.stats = PoolStats()
+        return pool_stats
+
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        stats().increment('connects')
+
+    @event.listens_for(engine, 'checkout')
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats().increment('checkouts')
+
+    @event.listens_for(engine, 'checkin')
+    def on_checkin(dbapi_connection, connection_record):
+        stats().increment('checkins')
+
+    @event.listens_for(engine, 'invalidate')
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        stats().increment('invalidations')
+
+    return engine
+
+
+def get_pool_status(engine) -> dict:
+    """Snapshot trạng thái pool hiện tại + counter cộng dồn"""
+    pool = engine.pool
+    status = {'pool_class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'idle': pool.checkedin(),
+            # overflow() âm khi pool chưa mở đủ pool_size connection
+            'overflow': max(pool.overflow(), 0),
+            'timeout': pool.timeout(),
+        })
+    stats = getattr(pool, 'stats', None)
+    if stats is not None:
+        status.update({
+            'connects': stats.connects,
+            'checkouts': stats.checkouts,
+            'checkins': stats.checkins,
+            'invalidations': stats.invalidations,
+            'timeouts': stats.timeouts,
+            'errors': stats.errors,
+            'wait_ms_total': round(stats.wait_total * 1000, 3),
+            'wait_ms_max': round(stats.wait_max * 1000, 3),
+            'wait_ms_avg': round(stats.wait_total * 1000 / stats.wait_count, 3) if stats.wait_count else 0.0,
+        })
+    return status
+
+
+_GAUGES = {
+    'size': 'Configured pool size',
+    'checked_out': 'Connections currently checked out',
+    'idle': 'Idle connections in the pool',
+    'overflow': 'Overflow connections currently open',
+}
+_COUNTERS = {
+    'connects': 'New DBAPI connections opened',
+    'checkouts': 'Connection checkouts',
+    'timeouts': 'Checkouts that failed waiting for a connection',
+    'errors': 'Checkouts that failed opening a new connection',
+    'invalidations': 'Connections invalidated',
+}
+
+
+def pool_metrics_collector(get_engine, name='primary'):
+    """Collector cho MetricsRegistry, đọc pool của engine hiện tại lúc scrape"""
+    def collect():
+        status = get_pool_status(get_engine())
+        labels = {'pool': name}
+        samples = []
+        for key, help_text in _GAUGES.items():
+            if key in status:
+                samples.append(Sample(f'db_pool_{key}', status[key], labels, help_text, 'gauge'))
+        for key, help_text in _COUNTERS.items():
+            if key in status:
+                samples.append(Sample(f'db_pool_{key}_total', status[key], labels, help_text, 'counter'))
+        if 'wait_ms_total' in status:
+            samples.append(Sample('db_pool_wait_seconds_total', status['wait_ms_total'] / 1000, labels,
+                                  'Total time spent waiting for a connection', 'counter'))
+            samples.append(Sample('db_pool_wait_seconds_max', status['wait_ms_max'] / 1000, labels,
+                                  'Longest wait for a connection', 'gauge'))
+        return samples
+    return collect
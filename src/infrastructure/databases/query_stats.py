@@ -0,0 +1,62 @@
+"""
+SQL instrumentation - số statement, tổng thời gian DB và statement lặp lại (N+1) của mỗi request
+"""
+import threading
+import time
+from collections import Counter
+from sqlalchemy import event
+
+_local = threading.local()
+
+
+class QueryStats:
+    """Thống kê query của một request (thread hiện tại)"""
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # giây
+        self.shapes = Counter()  # statement đã parametrize -> số lần chạy
+
+    def record(self, statement, seconds):
+        self.count += 1
+        self.duration += seconds
+        self.shapes[statement] += 1
+
+    def repeated(self, threshold):
+        """Các statement chạy >= threshold lần (nghi N+1), nhiều nhất trước"""
+        return [(statement, n) for statement, n in self.shapes.most_common() if n >= threshold]
+
+    def server_timing(self):
+        """Giá trị cho header Server-Timing"""
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries"'
+
+
+def start_query_stats():
+    _local.stats = QueryStats()
+    return _local.stats
+
+
+def current_query_stats():
+    return getattr(_local, 'stats', None)
+
+
+def stop_query_stats():
+    stats = current_query_stats()
+    _local.stats = None
+    return stats
+
+
+def instrument_queries(engine):
+    """Gắn listener before/after_cursor_execute, ghi vào QueryStats của request hiện tại (nếu có)"""
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_start = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        stats = current_query_stats()
+        start = getattr(context, '_query_start', None)
+        if stats is not None and start is not None:
+            stats.record(statement, time.perf_counter() - start)
+
+    return engine
@@ -0,0 +1,47 @@
+"""
+Metrics registry trong process - export dạng Prometheus text qua GET /metrics
+
+Mỗi collector là một hàm trả về list Sample; collector được gọi lúc scrape nên số liệu luôn là giá trị hiện tại.
+Với gunicorn nhiều worker, mỗi worker trả số liệu của chính nó (label pid để phân biệt).
+"""
+import os
+import threading
+from collections import namedtuple
+
+# type: 'gauge' | 'counter'
+Sample = namedtuple('Sample', ['name', 'value', 'labels', 'help', 'type'])
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def register(self, collector) -> None:
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self):
+        samples = []
+        for collector in list(self._collectors):
+            samples.extend(collector())
+        return samples
+
+    def render_prometheus(self) -> str:
+        # Exposition format: mọi sample của một metric phải liền nhau sau HELP/TYPE -> gom theo tên (giữ thứ tự gặp đầu)
+        families = {}
+        for sample in self.collect():
+            families.setdefault(sample.name, []).append(sample)
+        lines = []
+        pid = str(os.getpid())
+        for name, samples in families.items():
+            lines.append(f'# HELP {name} {samples[0].help}')
+            lines.append(f'# TYPE {name} {samples[0].type}')
+            for sample in samples:
+                labels = dict(sample.labels or {}, pid=pid)
+                label_text = ','.join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+                lines.append(f'{name}{{{label_text}}} {sample.value}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics_registry = MetricsRegistry()
@@ -22,6 +22,7 @@ from .subscriptionplan_model import SubscriptionPlan
 from .todo_model import TodoModel
 from .unit_model import Unit
 from .user_model import User
+from .user_search_token_model import UserSearchToken
 from .warehouse_model import Warehouse
 
 __all__ = [
@@ -49,5 +50,6 @@ __all__ = [
     'TodoModel',
     'Unit',
     'User',
+    'UserSearchToken',
     'Warehouse'
 ]
\ No newline at end of file
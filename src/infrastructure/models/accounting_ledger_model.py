@@ -1,9 +1,15 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 class AccountingLedger(Base):
     __tablename__ = 'accounting_ledger'
-    __table_args__ = {'extend_existing': True}  # Thêm dòng này
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_accounting_ledger_transaction_date', 'transaction_date',
+              mssql_include=['movement_type', 'debit_amount', 'credit_amount', 'balance'], postgresql_include=['movement_type', 'debit_amount', 'credit_amount', 'balance']),
+        Index('ix_accounting_ledger_status_transaction_date', 'status', 'transaction_date'),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     invoice_id=Column(Integer, ForeignKey("invoices.id"),nullable=False,unique=True)
@@ -1,9 +1,15 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 class Category(Base):
     __tablename__ = 'categories'
-    __table_args__ = {'extend_existing': True}  # Thêm dòng này
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_categories_household_id_id', 'household_id', 'id'),
+        Index('ix_categories_household_id_status', 'household_id', 'status',
+              mssql_include=['name'], postgresql_include=['name']),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     household_id= Column(Integer, ForeignKey("households.id"),nullable=False)
@@ -1,9 +1,14 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Numeric
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Numeric, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 class DebtRecord(Base):
     __tablename__ = 'debt_record'
-    __table_args__ = {'extend_existing': True}  # Thêm dòng này
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_debt_record_customer_id_record_at', 'customer_id', 'record_at',
+              mssql_include=['debit_amount', 'credit_amount', 'balance'], postgresql_include=['debit_amount', 'credit_amount', 'balance']),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     customer_id=Column(Integer, ForeignKey("customers.id"),nullable=False)
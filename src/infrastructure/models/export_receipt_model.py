@@ -1,10 +1,14 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Date
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Date, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 
 class ExportReceipt(Base):
     __tablename__ = 'export_receipts'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_export_receipts_warehouse_id_export_date', 'warehouse_id', 'export_date'),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     warehouse_id=Column(Integer, ForeignKey("warehouses.id"),nullable=False)
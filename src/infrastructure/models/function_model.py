@@ -24,6 +24,18 @@ class Function(Base):
     def __repr__(self):
         return f"<Function(id={self.id}, code='{self.function_code}', name='{self.function_name}')>"
     
+    # HTTP method -> CRUD code dùng trong cột http_methods
+    METHOD_CODES = {
+        'POST': 'C',
+        'GET': 'R',
+        'PUT': 'U',
+        'PATCH': 'U',
+        'DELETE': 'D'
+    }
+    
+    # CRUD code -> bit trong permission bitmask (C=1, R=2, U=4, D=8)
+    METHOD_BITS = {'C': 1, 'R': 2, 'U': 4, 'D': 8}
+    
     def allows_method(self, http_method):
         """
         Check if this function allows a specific HTTP method.
@@ -34,16 +46,28 @@ class Function(Base):
         Returns:
             bool: True if method is allowed, False otherwise
         """
-        method_map = {
-            'POST': 'C',
-            'GET': 'R',
-            'PUT': 'U',
-            'PATCH': 'U',
-            'DELETE': 'D'
-        }
-        
-        method_code = method_map.get(http_method.upper())
+        method_code = self.METHOD_CODES.get(http_method.upper())
         if not method_code:
             return False
             
         return method_code in self.http_methods
+    
+    @classmethod
+    def methods_to_mask(cls, http_methods):
+        """
+        Compile chuỗi http_methods (vd: 'C,R,U,D') thành bitmask.
+        
+        Returns:
+            int: Bitmask các CRUD code được phép
+        """
+        mask = 0
+        for code, bit in cls.METHOD_BITS.items():
+            if http_methods and code in http_methods:
+                mask |= bit
+        return mask
+    
+    @classmethod
+    def method_bit(cls, http_method):
+        """Bit tương ứng với HTTP method (0 nếu method không được hỗ trợ)"""
+        method_code = cls.METHOD_CODES.get(http_method.upper())
+        return cls.METHOD_BITS.get(method_code, 0)
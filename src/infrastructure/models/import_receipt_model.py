@@ -1,10 +1,14 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Date
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Date, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 
 class ImportReceipt(Base):
     __tablename__ = 'import_receipts'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_import_receipts_warehouse_id_import_date', 'warehouse_id', 'import_date'),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     warehouse_id=Column(Integer, ForeignKey("warehouses.id"),nullable=False)
@@ -1,9 +1,16 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 class Inventory(Base):
     __tablename__ = 'inventories'
-    __table_args__ = {'extend_existing': True}  # Thêm dòng này
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_inventories_warehouse_id_product_id', 'warehouse_id', 'product_id',
+              mssql_include=['unit_id', 'quantity'], postgresql_include=['unit_id', 'quantity']),
+        Index('ix_inventories_product_id', 'product_id',
+              mssql_include=['warehouse_id', 'quantity'], postgresql_include=['warehouse_id', 'quantity']),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     product_id=Column(Integer,ForeignKey("products.id"),nullable=False)
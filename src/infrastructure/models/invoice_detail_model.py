@@ -1,9 +1,15 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Numeric
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Numeric, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 class InvoiceDetail(Base):
     __tablename__ = 'invoice_details'
-    __table_args__ = {'extend_existing': True}  # Thêm dòng này
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_invoice_details_invoice_id', 'invoice_id',
+              mssql_include=['product_id', 'unit_id', 'quantity', 'price'], postgresql_include=['product_id', 'unit_id', 'quantity', 'price']),
+        Index('ix_invoice_details_product_id', 'product_id'),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     invoice_id=Column(Integer, ForeignKey("invoices.id"),nullable=False) # chi tiết hóa đơn 
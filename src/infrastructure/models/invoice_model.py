@@ -1,9 +1,18 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Numeric
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Numeric, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 class Invoice(Base):
     __tablename__ = 'invoices'
-    __table_args__ = {'extend_existing': True}  # Thêm dòng này
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_invoices_household_id_created_at', 'household_id', 'created_at',
+              mssql_include=['invoice_type', 'status', 'total_amount'], postgresql_include=['invoice_type', 'status', 'total_amount']),
+        Index('ix_invoices_household_id_status_created_at', 'household_id', 'status', 'created_at',
+              mssql_include=['total_amount'], postgresql_include=['total_amount']),
+        Index('ix_invoices_customer_id', 'customer_id'),
+        Index('ix_invoices_seller_id', 'seller_id'),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     household_id=Column(Integer, ForeignKey("households.id"),nullable=False)
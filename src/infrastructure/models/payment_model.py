@@ -1,9 +1,14 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Numeric
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Numeric, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 class Payment(Base):
     __tablename__ = 'payments'
-    __table_args__ = {'extend_existing': True}  # Thêm dòng này
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_payments_invoice_id', 'invoice_id',
+              mssql_include=['amount', 'status'], postgresql_include=['amount', 'status']),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     invoice_id=Column(Integer, ForeignKey("invoices.id"),nullable=False)
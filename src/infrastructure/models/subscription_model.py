@@ -1,9 +1,14 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Boolean, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 class Subscription(Base):
     __tablename__ = 'subscriptions'
-    __table_args__ = {'extend_existing': True}  # Thêm dòng này
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_subscriptions_household_id_is_active_end_date', 'household_id', 'is_active', 'end_date',
+              mssql_include=['plan_id', 'start_date'], postgresql_include=['plan_id', 'start_date']),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) # Cho phép NULL
     plan_id=Column(Integer,ForeignKey("subscriptionplans.id"),nullable=False)
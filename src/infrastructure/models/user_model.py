@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from infrastructure.databases.base import Base
 from datetime import datetime
 
 class User(Base):
     __tablename__ = 'users'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Index theo tenant/filter hay dùng (migration m0001_tenant_indexes)
+        Index('ix_users_household_id_role_id_status', 'household_id', 'role_id', 'status'),
+        Index('ix_users_role_id_status', 'role_id', 'status',
+              mssql_include=['user_name', 'email', 'household_id'], postgresql_include=['user_name', 'email', 'household_id']),
+        {'extend_existing': True}
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     household_id = Column(Integer, ForeignKey("households.id"), nullable=True)  # NULL for Admin
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from infrastructure.databases.base import Base
+from infrastructure.search.text import fold_text, trigrams
+
+# kind của token
+TOKEN_WORD = 'w'            # từ đã fold của user_name/email (+ user_name/email local part viết liền) -> khớp prefix
+TOKEN_NAME_TRIGRAM = 'u'    # 3-gram của user_name viết liền -> khớp giữa chuỗi
+TOKEN_EMAIL_TRIGRAM = 'e'   # 3-gram của email local part viết liền
+
+
+class UserSearchToken(Base):
+    """Token tìm kiếm user (admin search), thay cho ILIKE '%term%' phải scan cả bảng users"""
+    __tablename__ = 'user_search_tokens'
+    __table_args__ = (
+        # Lookup: kind + token (= hoặc LIKE 'abc%') -> user_id, không cần đọc bảng
+        Index('ix_user_search_tokens_kind_token_user_id', 'kind', 'token', 'user_id'),
+        Index('ix_user_search_tokens_user_id', 'user_id'),
+        {'extend_existing': True}
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    kind = Column(String(1), nullable=False)
+    token = Column(String(100), nullable=False)
+
+    @staticmethod
+    def tokens_for(user_name, email):
+        """
+        Tập (kind, token) của một user
+
+        "Owner_1", "chu.cua.hang@gmail.com" -> words: owner, 1, owner1, chu, cua, hang, gmail, com, chucuahang;
+        trigram: own, wne, ner, er1 (u) và chu, huc, ... (e)
+        """
+        tokens = set()
+        local_part = (email or '').split('@', 1)[0]
+        for text in (user_name, email):
+            tokens.update((TOKEN_WORD, word[:100]) for word in fold_text(text).split())
+        for kind, text in ((TOKEN_NAME_TRIGRAM, user_name), (TOKEN_EMAIL_TRIGRAM, local_part)):
+            compact = fold_text(text).replace(' ', '')[:100]
+            if compact:
+                tokens.add((TOKEN_WORD, compact))
+                tokens.update((kind, gram) for gram in trigrams(compact))
+        return tokens
+
+    def __repr__(self):
+        return f"<UserSearchToken(user_id={self.user_id}, kind='{self.kind}', token='{self.token}')>"
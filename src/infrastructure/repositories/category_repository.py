@@ -2,11 +2,27 @@ from domain.models.category import Category
 from domain.models.icategory_repository import ICategoryRepository
 from typing import List, Optional
 from infrastructure.models import Category as CategoryModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read, primary_read
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate, select_columns
+from infrastructure.cache.invalidation import NS_COLLECTIONS, COLLECTION_CATEGORIES, collection_key
+from dependency_container import container
+from sqlalchemy import func
+
+# Cột sort/filter/search của list categories
+CATEGORY_PAGE_SPEC = PageSpec(
+    CategoryModel.id,
+    sort_columns={'name': CategoryModel.name, 'created_at': CategoryModel.created_at,
+                  'updated_at': CategoryModel.updated_at},
+    filter_columns={'status': CategoryModel.status},
+    search_columns=[CategoryModel.name, CategoryModel.description]
+)
+
 
 class CategoryRepository(ICategoryRepository):
-    def __init__(self, session=session):
+    def __init__(self, session=session, bus=None):
         self.session = session
+        self.bus = bus or container.invalidation_bus()
 
     def add(self, category: Category) -> CategoryModel:
         try:
@@ -21,6 +37,7 @@ class CategoryRepository(ICategoryRepository):
             self.session.add(category_model)
             self.session.commit()
             self.session.refresh(category_model)
+            self._publish(category_model.household_id)
             return category_model
         except Exception as e:
             self.session.rollback() 
@@ -29,8 +46,27 @@ class CategoryRepository(ICategoryRepository):
     def get_by_id(self, category_id: int, household_id: int) -> Optional[CategoryModel]:
         return self.session.query(CategoryModel).filter_by(id=category_id, household_id=household_id).first()
 
+    @replica_read
     def list(self, household_id: int) -> List[CategoryModel]:
         return self.session.query(CategoryModel).filter_by(household_id=household_id).all()
+
+    @replica_read
+    def list_page(self, household_id: int, page_request: PageRequest) -> Page:
+        """
+        Một trang (keyset) của household, filter/sort theo CATEGORY_PAGE_SPEC
+
+        Items là Row chỉ gồm các cột cần (page_request.fields + id + cột sort), không phải ORM entity
+        """
+        columns = select_columns(CategoryModel.__table__, CATEGORY_PAGE_SPEC, page_request)
+        query = self.session.query(*columns).filter(CategoryModel.household_id == household_id)
+        return paginate(query, CATEGORY_PAGE_SPEC, page_request)
+
+    @primary_read
+    def version_stamp(self, household_id: int):
+        """(max(updated_at), count) của household - version stamp cho ETag của list (primary: stamp được cache)"""
+        return tuple(self.session.query(func.max(CategoryModel.updated_at), func.count(CategoryModel.id)).filter(
+            CategoryModel.household_id == household_id
+        ).one())
     
     def update(self, category: Category) -> CategoryModel:
         try:
@@ -49,6 +85,7 @@ class CategoryRepository(ICategoryRepository):
             
             self.session.commit()
             self.session.refresh(category_model)
+            self._publish(category_model.household_id)
             return category_model
         except Exception as e:
             self.session.rollback()
@@ -61,6 +98,11 @@ class CategoryRepository(ICategoryRepository):
                 raise ValueError('Category not found')
             self.session.delete(category_model)
             self.session.commit()
+            self._publish(household_id)
         except Exception as e:
             self.session.rollback()
-            raise ValueError(f'Error deleting category: {str(e)}')
\ No newline at end of file
+            raise ValueError(f'Error deleting category: {str(e)}')
+
+    def _publish(self, household_id):
+        """Sau commit: version stamp (ETag) list của household hết hiệu lực ở mọi worker"""
+        self.bus.publish(NS_COLLECTIONS, collection_key(COLLECTION_CATEGORIES, household_id))
@@ -2,11 +2,26 @@ from domain.models.ifunction_repository import IFunctionRepository
 from domain.models.function import Function
 from typing import List, Optional
 from infrastructure.models import Function as FunctionModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate
+from infrastructure.cache.invalidation import NS_RBAC
+from dependency_container import container
+
+# Cột sort/filter/search của list functions
+FUNCTION_PAGE_SPEC = PageSpec(
+    FunctionModel.id,
+    sort_columns={'function_code': FunctionModel.function_code, 'function_name': FunctionModel.function_name,
+                  'created_at': FunctionModel.created_at},
+    filter_columns={'resource_type': FunctionModel.resource_type},
+    search_columns=[FunctionModel.function_code, FunctionModel.function_name]
+)
+
 
 class FunctionRepository(IFunctionRepository):
-    def __init__(self, session=session):
+    def __init__(self, session=session, bus=None):
         self.session = session
+        self.bus = bus or container.invalidation_bus()
 
     def add(self, function: Function) -> FunctionModel:
         try:
@@ -23,6 +38,7 @@ class FunctionRepository(IFunctionRepository):
             self.session.add(function_model)
             self.session.commit()
             self.session.refresh(function_model)
+            self.bus.publish(NS_RBAC)  # http_methods/function_code đổi -> rebuild permission matrix
             return function_model
         except Exception as e:
             self.session.rollback()
@@ -31,9 +47,14 @@ class FunctionRepository(IFunctionRepository):
     def get_by_id(self, function_id: int) -> Optional[FunctionModel]:
         return self.session.query(FunctionModel).filter_by(id=function_id).first()
 
+    @replica_read
     def list(self) -> List[FunctionModel]:
         return self.session.query(FunctionModel).all()
 
+    @replica_read
+    def list_page(self, page_request: PageRequest) -> Page:
+        return paginate(self.session.query(FunctionModel), FUNCTION_PAGE_SPEC, page_request)
+
     def update(self, function: Function) -> FunctionModel:
         try:
             function_model = self.session.query(FunctionModel).filter_by(id=function.id).first()
@@ -57,6 +78,7 @@ class FunctionRepository(IFunctionRepository):
             
             self.session.commit()
             self.session.refresh(function_model)
+            self.bus.publish(NS_RBAC)  # http_methods/function_code đổi -> rebuild permission matrix
             return function_model
         except Exception as e:
             self.session.rollback()
@@ -68,6 +90,7 @@ class FunctionRepository(IFunctionRepository):
             if function:
                 self.session.delete(function)
                 self.session.commit()
+                self.bus.publish(NS_RBAC)
             else:
                 raise ValueError('Function not found')
         except Exception as e:
@@ -2,7 +2,7 @@ from domain.models.ihousehold_repository import IHouseholdRepository
 from domain.models.household import Household
 from typing import List, Optional
 from infrastructure.models.household_model import Household as HouseholdModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 
@@ -42,6 +42,7 @@ class HouseholdRepository(IHouseholdRepository):
         """Get household by ID (NO session.close - let controller manage session)"""
         return self.session.query(HouseholdModel).filter_by(id=household_id).first()
 
+    @replica_read
     def list(self) -> List[HouseholdModel]:
         """List all households (NO session.close - let controller manage session)"""
         return self.session.query(HouseholdModel).all()
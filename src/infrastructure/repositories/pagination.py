@@ -0,0 +1,178 @@
+"""
+Keyset pagination dùng chung cho repository: ORDER BY (sort key, id) + WHERE (sort key, id) > cursor
+
+Không dùng OFFSET nên trang sau cùng nhanh như trang đầu (dùng index (household_id, ...) của migration 0001).
+"""
+import base64
+import json
+from datetime import date, datetime
+from sqlalchemy import and_, or_, func, Boolean, Date, DateTime, Integer, Numeric
+from domain.models.page import InvalidPageRequest, Page, PageRequest
+
+
+class PageSpec:
+    """Cột được phép sort/filter/search của một list"""
+    def __init__(self, id_column, sort_columns: dict, filter_columns: dict = None, search_columns: list = None):
+        self.id_column = id_column
+        self.sort_columns = dict(sort_columns, id=id_column)
+        self.filter_columns = filter_columns or {}
+        self.search_columns = search_columns or []
+
+
+def select_columns(table, spec: PageSpec, page_request: PageRequest) -> list:
+    """
+    Cột SELECT cho list: fields của page_request (None = mọi cột) + id + cột sort (cần để tạo cursor)
+
+    Query theo cột trả về Row (tuple, truy cập theo tên cột) thay vì ORM entity:
+    không qua identity map/unit of work, không load cột client không cần.
+    """
+    required = [spec.id_column.key]
+    sort_column = spec.sort_columns.get(page_request.sort)
+    if sort_column is not None:
+        required.append(sort_column.key)
+    return table_columns(table, page_request.fields, required)
+
+
+def table_columns(table, fields=None, required=()) -> list:
+    """Cột của table theo tên field (None = mọi cột) + required, InvalidPageRequest nếu field không tồn tại"""
+    if not fields:
+        return list(table.columns)
+    unknown = set(fields) - set(table.columns.keys())
+    if unknown:
+        raise InvalidPageRequest(f'Unsupported fields: {", ".join(sorted(unknown))}')
+    names = set(fields) | set(required)
+    return [column for column in table.columns if column.key in names]
+
+
+def encode_cursor(sort: str, descending: bool, value, row_id) -> str:
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    payload = json.dumps([sort, int(descending), value, row_id], separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """-> (sort, descending, value, id), InvalidPageRequest nếu cursor không hợp lệ"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort, descending, value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return sort, bool(descending), value, int(row_id)
+    except (ValueError, TypeError):
+        raise InvalidPageRequest('Invalid cursor')
+
+
+def coerce_value(column, raw, name):
+    """Chuyển giá trị string (query param/cursor) về kiểu của cột"""
+    if raw is None:
+        return None
+    try:
+        if isinstance(column.type, Boolean):
+            if str(raw).lower() in ('true', '1'):
+                return True
+            if str(raw).lower() in ('false', '0'):
+                return False
+            raise InvalidPageRequest(raw)
+        if isinstance(column.type, Integer):
+            return int(raw)
+        if isinstance(column.type, Numeric):
+            return float(raw)
+        if isinstance(column.type, DateTime):
+            return datetime.fromisoformat(str(raw).replace('Z', '+00:00')).replace(tzinfo=None)
+        if isinstance(column.type, Date):
+            return date.fromisoformat(str(raw))
+    except (ValueError, TypeError):
+        raise InvalidPageRequest(f'Invalid value for {name}: {raw}')
+    return str(raw)
+
+
+# Giá trị thay NULL của cột date/datetime nullable (nhỏ hơn mọi giá trị thực, hợp lệ với DATETIME của SQL Server)
+NULL_DATETIME = datetime(1900, 1, 1)
+
+
+def _null_sentinel(column):
+    """Giá trị cùng kiểu với cột, dùng thay NULL trong sort key và cursor"""
+    if isinstance(column.type, DateTime):
+        return NULL_DATETIME
+    if isinstance(column.type, Date):
+        return NULL_DATETIME.date()
+    if isinstance(column.type, Boolean):
+        return False
+    return '' if column.type.python_type is str else 0
+
+
+def _sort_expression(column):
+    # Cột nullable: sort theo COALESCE để so sánh keyset không bị NULL làm sai
+    if column.nullable:
+        return func.coalesce(column, _null_sentinel(column))
+    return column
+
+
+def apply_filters(query, spec: PageSpec, page_request: PageRequest):
+    """
+    Filter bằng + search (contains, không phân biệt hoa thường)
+
+    Chỉ param có trong spec.filter_columns là filter; param khác (cache-buster ?_=..., param client cũ gửi kèm)
+    bị bỏ qua như trước khi có phân trang
+    """
+    for name, raw in page_request.filters.items():
+        column = spec.filter_columns.get(name)
+        if column is None:
+            continue
+        query = query.filter(column == coerce_value(column, raw, name))
+    if page_request.search:
+        if not spec.search_columns:
+            raise InvalidPageRequest('Search is not supported for this list')
+        pattern = '%' + page_request.search.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        query = query.filter(or_(*[
+            func.lower(column).like(pattern, escape='\\') for column in spec.search_columns
+        ]))
+    return query
+
+
+def paginate(query, spec: PageSpec, page_request: PageRequest) -> Page:
+    """
+    Một trang của query (đã filter theo tenant) theo page_request
+
+    Returns:
+        Page(items, next_cursor, total) - total chỉ tính khi page_request.include_total
+    Raises:
+        InvalidPageRequest nếu sort/filter/cursor không hợp lệ
+    """
+    sort_column = spec.sort_columns.get(page_request.sort)
+    if sort_column is None:
+        raise InvalidPageRequest(f'Unsupported sort: {page_request.sort}')
+    query = apply_filters(query, spec, page_request)
+    total = query.order_by(None).count() if page_request.include_total else None
+
+    id_column = spec.id_column
+    sort_key = id_column if sort_column is id_column else _sort_expression(sort_column)
+    descending = page_request.descending
+
+    if page_request.cursor:
+        sort, cursor_descending, value, last_id = decode_cursor(page_request.cursor)
+        if sort != page_request.sort or cursor_descending != descending:
+            raise InvalidPageRequest('Cursor does not match sort order')
+        if sort_key is id_column:
+            query = query.filter(id_column < last_id if descending else id_column > last_id)
+        else:
+            value = coerce_value(sort_column, value, 'cursor')
+            if descending:
+                query = query.filter(or_(sort_key < value, and_(sort_key == value, id_column < last_id)))
+            else:
+                query = query.filter(or_(sort_key > value, and_(sort_key == value, id_column > last_id)))
+
+    if sort_key is id_column:
+        order = [id_column.desc() if descending else id_column.asc()]
+    else:
+        order = [sort_key.desc(), id_column.desc()] if descending else [sort_key.asc(), id_column.asc()]
+    rows = query.order_by(*order).limit(page_request.limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > page_request.limit:
+        rows = rows[:page_request.limit]
+        last = rows[-1]
+        value = getattr(last, sort_column.key)
+        if value is None and sort_key is not sort_column:
+            value = _null_sentinel(sort_column)
+        next_cursor = encode_cursor(page_request.sort, descending, value, getattr(last, id_column.key))
+    return Page(rows, next_cursor, total)
@@ -2,11 +2,28 @@ from domain.models.iproduct_repository import IProductRepository
 from domain.models.product import Product
 from typing import List, Optional
 from infrastructure.models import Product as ProductModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read, primary_read, primary_reads
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, apply_filters, paginate, select_columns, table_columns
+from infrastructure.cache.invalidation import NS_PRODUCTS, NS_COLLECTIONS, COLLECTION_PRODUCTS, collection_key
+from dependency_container import container
+from config import Config
+from sqlalchemy import func
+
+# Cột sort/filter/search của list products (query params: sort, status, category_id, search)
+PRODUCT_PAGE_SPEC = PageSpec(
+    ProductModel.id,
+    sort_columns={'name': ProductModel.name, 'status': ProductModel.status,
+                  'created_at': ProductModel.created_at, 'updated_at': ProductModel.updated_at},
+    filter_columns={'status': ProductModel.status, 'category_id': ProductModel.category_id},
+    search_columns=[ProductModel.name, ProductModel.description]
+)
+
 
 class ProductRepository(IProductRepository):
-    def __init__(self, session=session):
+    def __init__(self, session=session, bus=None):
         self.session = session
+        self.bus = bus or container.invalidation_bus()
     def add(self, product: Product) -> ProductModel:
         try:
             product_model = ProductModel(
@@ -22,6 +39,7 @@ class ProductRepository(IProductRepository):
             self.session.add(product_model)
             self.session.commit()
             self.session.refresh(product_model)
+            self._publish(product_model.household_id, product_model.id)
             return product_model
         except Exception as e:
             self.session.rollback() 
@@ -30,8 +48,55 @@ class ProductRepository(IProductRepository):
     def get_by_id(self, product_id: int, household_id: int) -> Optional[ProductModel]:
         return self.session.query(ProductModel).filter_by(id=product_id, household_id=household_id).first()
         
+    @replica_read
     def list(self, household_id: int) -> List[ProductModel]:
         return self.session.query(ProductModel).filter_by(household_id=household_id).all()
+
+    @replica_read
+    def list_search_rows(self, household_id: int, product_ids: List[int] = None) -> list:
+        """
+        Row (không qua ORM identity map) để build search index, chỉ các product_ids nếu truyền
+
+        product_ids: product vừa được báo thay đổi (stale) -> đọc primary, replica có thể chưa có bản ghi mới
+        """
+        query = self.session.query(*ProductModel.__table__.columns).filter(
+            ProductModel.household_id == household_id
+        )
+        if product_ids is None:
+            return query.all()
+        with primary_reads(self.session):
+            return query.filter(ProductModel.id.in_(product_ids)).all()
+
+    @replica_read
+    def list_page(self, household_id: int, page_request: PageRequest) -> Page:
+        """
+        Một trang (keyset) của household, filter/sort theo PRODUCT_PAGE_SPEC
+
+        Items là Row chỉ gồm các cột cần (page_request.fields + id + cột sort), không phải ORM entity
+        """
+        columns = select_columns(ProductModel.__table__, PRODUCT_PAGE_SPEC, page_request)
+        query = self.session.query(*columns).filter(ProductModel.household_id == household_id)
+        return paginate(query, PRODUCT_PAGE_SPEC, page_request)
+
+    @primary_read
+    def version_stamp(self, household_id: int):
+        """(max(updated_at), count) của household - version stamp cho ETag của list (primary: stamp được cache)"""
+        return tuple(self.session.query(func.max(ProductModel.updated_at), func.count(ProductModel.id)).filter(
+            ProductModel.household_id == household_id
+        ).one())
+
+    @replica_read
+    def iter_rows(self, household_id: int, page_request: PageRequest, batch_size: int = None):
+        """
+        Mọi product của household khớp filter/search của page_request (bỏ qua limit/cursor), sort theo id
+
+        Trả về query yield_per: đọc từng batch từ server-side cursor khi được duyệt (streaming export),
+        Row chỉ gồm page_request.fields. Field/filter không hợp lệ -> InvalidPageRequest ngay khi gọi.
+        """
+        columns = table_columns(ProductModel.__table__, page_request.fields, required=('id',))
+        query = self.session.query(*columns).filter(ProductModel.household_id == household_id)
+        query = apply_filters(query, PRODUCT_PAGE_SPEC, page_request).order_by(ProductModel.id)
+        return query.yield_per(batch_size or Config.STREAM_BATCH_SIZE)
         
     def update(self, product: Product) -> ProductModel:
         try:
@@ -54,6 +119,7 @@ class ProductRepository(IProductRepository):
                 
             self.session.commit()
             self.session.refresh(product_model)
+            self._publish(product_model.household_id, product_model.id)
             return product_model
         except Exception as e: 
             self.session.rollback()
@@ -65,8 +131,15 @@ class ProductRepository(IProductRepository):
             if product:
                 self.session.delete(product)
                 self.session.commit()
+                self._publish(household_id, product_id)
             else:
                 raise ValueError('Product not found')
         except Exception as e:
             self.session.rollback()
-            raise ValueError(f'Error deleting product: {str(e)}')
\ No newline at end of file
+            raise ValueError(f'Error deleting product: {str(e)}')
+
+    def _publish(self, household_id, product_id):
+        # Product search index ở mọi worker đánh dấu product này cần load lại
+        self.bus.publish(NS_PRODUCTS, f'{household_id}:{product_id}')
+        # Version stamp (ETag) list products của household hết hiệu lực
+        self.bus.publish(NS_COLLECTIONS, collection_key(COLLECTION_PRODUCTS, household_id))
@@ -2,11 +2,24 @@ from domain.models.irole_function_repository import IRoleFunctionRepository
 from domain.models.role_function import RoleFunction
 from typing import List, Optional
 from infrastructure.models import RoleFunction as RoleFunctionModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate
+from infrastructure.cache.invalidation import NS_RBAC
+from dependency_container import container
+
+# Cột sort/filter của list functions theo role
+ROLE_FUNCTION_PAGE_SPEC = PageSpec(
+    RoleFunctionModel.id,
+    sort_columns={'function_id': RoleFunctionModel.function_id, 'created_at': RoleFunctionModel.created_at},
+    filter_columns={'function_id': RoleFunctionModel.function_id}
+)
+
 
 class RoleFunctionRepository(IRoleFunctionRepository):
-    def __init__(self, session=session):
+    def __init__(self, session=session, bus=None):
         self.session = session
+        self.bus = bus or container.invalidation_bus()
 
     def add(self, role_function: RoleFunction) -> RoleFunctionModel:
         try:
@@ -18,6 +31,7 @@ class RoleFunctionRepository(IRoleFunctionRepository):
             self.session.add(role_function_model)
             self.session.commit()
             self.session.refresh(role_function_model)
+            self.bus.publish(NS_RBAC)  # RBAC thay đổi -> rebuild permission matrix
             return role_function_model
         except Exception as e:
             self.session.rollback()
@@ -26,6 +40,7 @@ class RoleFunctionRepository(IRoleFunctionRepository):
     def get_by_id(self, role_function_id: int) -> Optional[RoleFunctionModel]:
         return self.session.query(RoleFunctionModel).filter_by(id=role_function_id).first()
 
+    @replica_read
     def list(self) -> List[RoleFunctionModel]:
         return self.session.query(RoleFunctionModel).all()
 
@@ -35,6 +50,7 @@ class RoleFunctionRepository(IRoleFunctionRepository):
             if role_function:
                 self.session.delete(role_function)
                 self.session.commit()
+                self.bus.publish(NS_RBAC)
             else:
                 raise ValueError('RoleFunction not found')
         except Exception as e:
@@ -44,6 +60,11 @@ class RoleFunctionRepository(IRoleFunctionRepository):
     def get_by_role_id(self, role_id: int) -> List[RoleFunctionModel]:
         return self.session.query(RoleFunctionModel).filter_by(role_id=role_id).all()
 
+    @replica_read
+    def get_by_role_id_page(self, role_id: int, page_request: PageRequest) -> Page:
+        query = self.session.query(RoleFunctionModel).filter_by(role_id=role_id)
+        return paginate(query, ROLE_FUNCTION_PAGE_SPEC, page_request)
+
     def get_by_role_and_function(self, role_id: int, function_id: int) -> Optional[RoleFunctionModel]:
         return self.session.query(RoleFunctionModel).filter_by(
             role_id=role_id, function_id=function_id
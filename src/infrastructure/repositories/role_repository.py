@@ -2,11 +2,24 @@ from domain.models.irole_repository import IRoleRepository
 from domain.models.role import Role
 from typing import List, Optional
 from infrastructure.models import Role as RoleModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate
+from infrastructure.cache.invalidation import NS_ROLES, NS_RBAC
+from dependency_container import container
+
+# Cột sort/search của list roles
+ROLE_PAGE_SPEC = PageSpec(
+    RoleModel.id,
+    sort_columns={'role_name': RoleModel.role_name, 'created_at': RoleModel.created_at},
+    search_columns=[RoleModel.role_name, RoleModel.description]
+)
+
 
 class RoleRepository(IRoleRepository):
-    def __init__(self, session=session):
+    def __init__(self, session=session, bus=None):
         self.session = session
+        self.bus = bus or container.invalidation_bus()
 
     def add(self, role: Role) -> RoleModel:
         try:
@@ -19,6 +32,7 @@ class RoleRepository(IRoleRepository):
             self.session.add(role_model)
             self.session.commit()
             self.session.refresh(role_model)
+            self.bus.publish(NS_ROLES)  # Roles thay đổi -> load lại role registry
             return role_model
         except Exception as e:
             self.session.rollback()
@@ -27,9 +41,14 @@ class RoleRepository(IRoleRepository):
     def get_by_id(self, role_id: int) -> Optional[RoleModel]:
         return self.session.query(RoleModel).filter_by(id=role_id).first()
 
+    @replica_read
     def list(self) -> List[RoleModel]:
         return self.session.query(RoleModel).all()
 
+    @replica_read
+    def list_page(self, page_request: PageRequest) -> Page:
+        return paginate(self.session.query(RoleModel), ROLE_PAGE_SPEC, page_request)
+
     def update(self, role: Role) -> RoleModel:
         try:
             role_model = self.session.query(RoleModel).filter_by(id=role.id).first()
@@ -45,6 +64,7 @@ class RoleRepository(IRoleRepository):
             
             self.session.commit()
             self.session.refresh(role_model)
+            self.bus.publish(NS_ROLES)  # Roles thay đổi -> load lại role registry
             return role_model
         except Exception as e:
             self.session.rollback()
@@ -56,6 +76,8 @@ class RoleRepository(IRoleRepository):
             if role:
                 self.session.delete(role)
                 self.session.commit()
+                self.bus.publish(NS_ROLES)
+                self.bus.publish(NS_RBAC)  # role_functions của role bị xóa theo (ON DELETE CASCADE)
             else:
                 raise ValueError('Role not found')
         except Exception as e:
@@ -3,16 +3,32 @@
 from domain.models.isubscription_plan_repository import ISubscriptionPlanRepository
 from domain.models.subscription_plan import SubscriptionPlan
 from typing import List, Optional
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read
 from infrastructure.models.subscriptionplan_model import SubscriptionPlan as SubscriptionPlanModel
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime
+from dependency_container import container
+from infrastructure.cache.invalidation import NS_SUBSCRIPTION_PLANS
+
+# Cột sort/filter/search của list subscription plans
+SUBSCRIPTION_PLAN_PAGE_SPEC = PageSpec(
+    SubscriptionPlanModel.id,
+    sort_columns={'name': SubscriptionPlanModel.name, 'price': SubscriptionPlanModel.price,
+                  'created_at': SubscriptionPlanModel.created_at},
+    filter_columns={'status': SubscriptionPlanModel.status, 'billing_cycle': SubscriptionPlanModel.billing_cycle},
+    search_columns=[SubscriptionPlanModel.name, SubscriptionPlanModel.description]
+)
+
 
 class SubscriptionPlanRepository(ISubscriptionPlanRepository):
-    def __init__(self, session: Session = session):
+    def __init__(self, session: Session = session, bus=None):
         self._plans = []
         self._id_counter = 1
         self.session = session
+        self.bus = bus or container.invalidation_bus()
 
     # ---------------- CREATE ----------------
     def add(self, plan: SubscriptionPlan) -> SubscriptionPlanModel:
@@ -31,6 +47,7 @@ class SubscriptionPlanRepository(ISubscriptionPlanRepository):
             )
             self.session.add(plan_model)
             self.session.commit()
+            self.bus.publish(NS_SUBSCRIPTION_PLANS)
             self.session.refresh(plan_model)
             return plan_model
         except Exception as e:
@@ -43,10 +60,19 @@ class SubscriptionPlanRepository(ISubscriptionPlanRepository):
     def get_by_id(self, plan_id: int) -> Optional[SubscriptionPlanModel]:
         return self.session.query(SubscriptionPlanModel).filter_by(id=plan_id).first()
 
+    @replica_read
     def list(self) -> List[SubscriptionPlanModel]:
         self._plans = self.session.query(SubscriptionPlanModel).all()
         return self._plans
 
+    @replica_read
+    def list_page(self, page_request: PageRequest, active_only: bool = False) -> Page:
+        """active_only: chỉ plan status 'active' (không phân biệt hoa thường) - dùng cho public/owner list"""
+        query = self.session.query(SubscriptionPlanModel)
+        if active_only:
+            query = query.filter(func.lower(SubscriptionPlanModel.status) == 'active')
+        return paginate(query, SUBSCRIPTION_PLAN_PAGE_SPEC, page_request)
+
     def get_by_name(self, name: str) -> Optional[SubscriptionPlanModel]:
         return self.session.query(SubscriptionPlanModel).filter_by(name=name).first()
 
@@ -68,6 +94,7 @@ class SubscriptionPlanRepository(ISubscriptionPlanRepository):
             )
             self.session.merge(plan_model)
             self.session.commit()
+            self.bus.publish(NS_SUBSCRIPTION_PLANS)
             self.session.refresh(plan_model)
             return plan_model
         except Exception as e:
@@ -83,6 +110,7 @@ class SubscriptionPlanRepository(ISubscriptionPlanRepository):
             if plan_model:
                 self.session.delete(plan_model)
                 self.session.commit()
+                self.bus.publish(NS_SUBSCRIPTION_PLANS)
             else:
                 raise ValueError("Subscription plan not found")
         except Exception as e:
@@ -1,11 +1,23 @@
 from domain.models.isubscription_repository import ISubscriptionRepository
 from domain.models.subscription import Subscription
 from typing import List, Optional
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read
 from infrastructure.models.subscription_model import Subscription as SubscriptionModel
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 
+# Cột sort/filter của list subscriptions (Admin)
+SUBSCRIPTION_PAGE_SPEC = PageSpec(
+    SubscriptionModel.id,
+    sort_columns={'start_date': SubscriptionModel.start_date, 'end_date': SubscriptionModel.end_date,
+                  'created_at': SubscriptionModel.created_at},
+    filter_columns={'household_id': SubscriptionModel.household_id, 'plan_id': SubscriptionModel.plan_id,
+                    'is_active': SubscriptionModel.is_active}
+)
+
+
 class SubscriptionRepository(ISubscriptionRepository):
     def __init__(self, session: Session = session):
         self.session = session
@@ -41,12 +53,17 @@ class SubscriptionRepository(ISubscriptionRepository):
         """
         return self.session.query(SubscriptionModel).filter_by(id=subscription_id).first()
 
+    @replica_read
     def list(self) -> List[SubscriptionModel]:
         """
         Lấy tất cả subscription
         """
         return self.session.query(SubscriptionModel).all()
 
+    @replica_read
+    def list_page(self, page_request: PageRequest) -> Page:
+        return paginate(self.session.query(SubscriptionModel), SUBSCRIPTION_PAGE_SPEC, page_request)
+
     def update(self, subscription: SubscriptionModel) -> SubscriptionModel:
         """
         Update subscription in session (NO COMMIT - let controller manage transaction)
@@ -10,9 +10,20 @@ from sqlalchemy import Column, Integer, String, DateTime
 from infrastructure.databases import Base
 from sqlalchemy.orm import Session
 from infrastructure.models.todo_model import TodoModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate
 load_dotenv()
 
+# Cột sort/filter/search của list todos
+TODO_PAGE_SPEC = PageSpec(
+    TodoModel.id,
+    sort_columns={'title': TodoModel.title, 'created_at': TodoModel.created_at},
+    filter_columns={'status': TodoModel.status},
+    search_columns=[TodoModel.title, TodoModel.description]
+)
+
+
 class TodoRepository(ITodoRepository):
     def __init__(self, session: Session = session):
         self._todos = []
@@ -52,11 +63,16 @@ class TodoRepository(ITodoRepository):
     # def list(self) -> List[Todo]:
     #     self._todos
     #     return self._todos
+    @replica_read
     def list(self) -> List[TodoModel]:
         self._todos = session.query(TodoModel).all()
         # select * from todos
         return self._todos
 
+    @replica_read
+    def list_page(self, page_request: PageRequest) -> Page:
+        return paginate(self.session.query(TodoModel), TODO_PAGE_SPEC, page_request)
+
 
     def update(self, todo: TodoModel) -> TodoModel:
         try:
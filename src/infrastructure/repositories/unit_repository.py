@@ -2,11 +2,27 @@ from domain.models.unit import Unit
 from domain.models.iunit_repository import IUnitRepository
 from typing import List, Optional
 from infrastructure.models import Unit as UnitModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read, primary_read
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate, select_columns
+from infrastructure.cache.invalidation import NS_COLLECTIONS, COLLECTION_UNITS, collection_key
+from dependency_container import container
+from sqlalchemy import func
+
+# Cột sort/filter/search của list units
+UNIT_PAGE_SPEC = PageSpec(
+    UnitModel.id,
+    sort_columns={'name': UnitModel.name, 'created_at': UnitModel.created_at,
+                  'updated_at': UnitModel.updated_at},
+    filter_columns={'status': UnitModel.status},
+    search_columns=[UnitModel.name, UnitModel.description]
+)
+
 
 class UnitRepository(IUnitRepository):
-    def __init__(self, session=session):
+    def __init__(self, session=session, bus=None):
         self.session = session
+        self.bus = bus or container.invalidation_bus()
 
     def add(self, unit: Unit) -> UnitModel:
         try:
@@ -21,6 +37,7 @@ class UnitRepository(IUnitRepository):
             self.session.add(unit_model)
             self.session.commit()
             self.session.refresh(unit_model)
+            self._publish(unit_model.household_id)
             return unit_model
         except Exception as e:
             self.session.rollback() 
@@ -29,8 +46,27 @@ class UnitRepository(IUnitRepository):
     def get_by_id(self, unit_id: int, household_id: int) -> Optional[UnitModel]:
         return self.session.query(UnitModel).filter_by(id=unit_id, household_id=household_id).first()
 
+    @replica_read
     def list(self, household_id: int) -> List[UnitModel]:
         return self.session.query(UnitModel).filter_by(household_id=household_id).all()
+
+    @replica_read
+    def list_page(self, household_id: int, page_request: PageRequest) -> Page:
+        """
+        Một trang (keyset) của household, filter/sort theo UNIT_PAGE_SPEC
+
+        Items là Row chỉ gồm các cột cần (page_request.fields + id + cột sort), không phải ORM entity
+        """
+        columns = select_columns(UnitModel.__table__, UNIT_PAGE_SPEC, page_request)
+        query = self.session.query(*columns).filter(UnitModel.household_id == household_id)
+        return paginate(query, UNIT_PAGE_SPEC, page_request)
+
+    @primary_read
+    def version_stamp(self, household_id: int):
+        """(max(updated_at), count) của household - version stamp cho ETag của list (primary: stamp được cache)"""
+        return tuple(self.session.query(func.max(UnitModel.updated_at), func.count(UnitModel.id)).filter(
+            UnitModel.household_id == household_id
+        ).one())
     
     def update(self, unit: Unit) -> UnitModel:
         try:
@@ -49,6 +85,7 @@ class UnitRepository(IUnitRepository):
             
             self.session.commit()
             self.session.refresh(unit_model)
+            self._publish(unit_model.household_id)
             return unit_model
         except Exception as e:
             self.session.rollback()
@@ -62,6 +99,11 @@ class UnitRepository(IUnitRepository):
             
             self.session.delete(unit_model)
             self.session.commit()
+            self._publish(household_id)
         except Exception as e:
             self.session.rollback()
-            raise ValueError(f'Error deleting unit: {str(e)}')
\ No newline at end of file
+            raise ValueError(f'Error deleting unit: {str(e)}')
+
+    def _publish(self, household_id):
+        """Sau commit: version stamp (ETag) list của household hết hiệu lực ở mọi worker"""
+        self.bus.publish(NS_COLLECTIONS, collection_key(COLLECTION_UNITS, household_id))
@@ -1,13 +1,111 @@
 from domain.models.iuser_repository import IUserRepository
 from domain.models.user import User
 from typing import List, Optional
-from infrastructure.models import User as UserModel
-from infrastructure.databases.mssql import session
-from sqlalchemy import func, or_
+from infrastructure.models import User as UserModel, UserSearchToken
+from infrastructure.models.user_search_token_model import TOKEN_WORD, TOKEN_NAME_TRIGRAM, TOKEN_EMAIL_TRIGRAM
+from infrastructure.search import tokenize, trigrams
+from infrastructure.databases.mssql import session, replica_read
+from sqlalchemy import and_, exists, func, or_, select
+from collections import namedtuple
+from config import Config
+from dependency_container import container
+from infrastructure.cache.invalidation import NS_USER_STATUS
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate
+
+# Thông tin user cần cho authorize mỗi request
+UserStatus = namedtuple('UserStatus', ['status', 'role_id', 'household_id'])
+
+
+class UserStatusCache:
+    """
+    Cache user_id -> UserStatus(status, role_id, household_id) trên cache backend dùng chung
+
+    Write-through: UserRepository.update ghi giá trị mới sau commit, delete xóa entry,
+    nên deactivate user có hiệu lực ngay ở request tiếp theo.
+    Worker khác drop entry khi nhận sự kiện NS_USER_STATUS từ invalidation bus.
+    """
+    def __init__(self, backend=None, ttl=None, bus=None):
+        backend = backend or container.cache_backend()
+        self.ttl = Config.USER_CACHE_TTL if ttl is None else ttl
+        self._cache = backend.namespace(NS_USER_STATUS, versioned=True)
+        (bus or container.invalidation_bus()).subscribe(
+            NS_USER_STATUS, lambda namespace, user_id: self.invalidate(user_id)
+        )
+
+    def get(self, user_id):
+        value = self._cache.get(user_id)
+        return UserStatus(*value) if value is not None else None
+
+    def set(self, user_id, user_status):
+        self._cache.set(user_id, list(user_status), self.ttl)
+
+    def invalidate(self, user_id=None):
+        if user_id is None:
+            self._cache.bump_version()
+        else:
+            self._cache.delete(user_id)
+
+
+user_status_cache = UserStatusCache()
+
+# Cột sort/filter/search của list users (household_id/exclude role do repository tự filter)
+USER_PAGE_SPEC = PageSpec(
+    UserModel.id,
+    sort_columns={'user_name': UserModel.user_name, 'status': UserModel.status,
+                  'created_at': UserModel.created_at, 'updated_at': UserModel.updated_at},
+    filter_columns={'role_id': UserModel.role_id, 'status': UserModel.status},
+    search_columns=[UserModel.user_name, UserModel.email]
+)
+
+# Số từ tối đa của search term dùng để lọc (mỗi từ thêm 1-2 subquery)
+MAX_SEARCH_WORDS = 5
+
+
+def user_search_condition(search_term: str):
+    """
+    Điều kiện search user_name/email qua bảng user_search_tokens (index), không dấu, không phân biệt hoa thường
+
+    Mỗi từ của search term phải khớp (AND): prefix của một từ (token LIKE 'abc%' dùng được index),
+    hoặc với từ >= 3 ký tự: chứa trong user_name/email local part - 3-gram lọc ứng viên (mọi 3-gram của từ
+    cùng thuộc một field, dùng index), sau đó kiểm tra lại LIKE '%từ%' trên word token của ứng viên
+    (3-gram đủ chưa chắc là chuỗi con: 'abcd' có đủ 3-gram trong 'abcxbcd').
+    Trả về None nếu search term không có từ nào.
+    """
+    conditions = []
+    for word in list(dict.fromkeys(tokenize(search_term)))[:MAX_SEARCH_WORDS]:
+        matches = [UserModel.id.in_(
+            select(UserSearchToken.user_id).where(
+                UserSearchToken.kind == TOKEN_WORD, UserSearchToken.token.like(f'{word[:100]}%')
+            )
+        )]
+        grams = trigrams(word)
+        if grams:
+            matches.append(and_(
+                UserModel.id.in_(
+                    select(UserSearchToken.user_id)
+                    .where(UserSearchToken.kind.in_([TOKEN_NAME_TRIGRAM, TOKEN_EMAIL_TRIGRAM]),
+                           UserSearchToken.token.in_(sorted(grams)))
+                    .group_by(UserSearchToken.user_id, UserSearchToken.kind)
+                    .having(func.count(func.distinct(UserSearchToken.token)) == len(grams))
+                ),
+                # Recheck trên word token đã fold (gồm user_name/local part viết liền) -> vẫn không dấu như index
+                exists().where(
+                    UserSearchToken.user_id == UserModel.id, UserSearchToken.kind == TOKEN_WORD,
+                    UserSearchToken.token.like(f'%{word[:100]}%')
+                )
+            ))
+        conditions.append(or_(*matches))
+    if not conditions:
+        return None
+    return and_(*conditions)
+
 
 class UserRepository(IUserRepository):
-    def __init__(self, session=session):
+    def __init__(self, session=session, status_cache=user_status_cache, bus=None):
         self.session = session
+        self.status_cache = status_cache if Config.USER_CACHE_ENABLED else None
+        self.bus = bus or container.invalidation_bus()
 
     def add(self, user: User) -> UserModel:
         """
@@ -32,15 +130,31 @@ class UserRepository(IUserRepository):
             # KHÔNG commit ở đây - để controller quản lý transaction
             # self.session.commit()
             self.session.flush()  # Flush để lấy ID, nhưng không commit
+            self._index_search_tokens(user_model)  # Cùng transaction với user
             return user_model
         except Exception as e:
             # KHÔNG rollback ở đây - để controller quản lý transaction
             # self.session.rollback()
             raise ValueError(f'Error creating user: {str(e)}')
 
+    def _delete_search_tokens(self, user_id: int) -> None:
+        self.session.query(UserSearchToken).filter_by(user_id=user_id).delete(synchronize_session=False)
+
+    def _index_search_tokens(self, user_model: UserModel) -> None:
+        """Ghi lại token search của user (không commit - theo transaction của thao tác ghi user)"""
+        self._delete_search_tokens(user_model.id)
+        rows = [
+            {'user_id': user_model.id, 'kind': kind, 'token': token}
+            for kind, token in UserSearchToken.tokens_for(user_model.user_name, user_model.email)
+        ]
+        if rows:
+            # Core executemany: 1 statement cho mọi token, không cần lấy lại id từng dòng
+            self.session.execute(UserSearchToken.__table__.insert(), rows)
+
     def get_by_id(self, user_id: int) -> Optional[UserModel]:
         return self.session.query(UserModel).filter_by(id=user_id).first()
 
+    @replica_read
     def list(self) -> List[UserModel]:
         return self.session.query(UserModel).all()
 
@@ -68,9 +182,18 @@ class UserRepository(IUserRepository):
                 user_model.updated_by = user.updated_by
             if user.updated_at is not None:
                 user_model.updated_at = user.updated_at
+            if user.user_name is not None or user.email is not None:
+                self._index_search_tokens(user_model)
             
             self.session.commit()
             self.session.refresh(user_model)
+            # Publish trước (drop entry ở mọi worker), sau đó write-through giá trị mới
+            self.bus.publish(NS_USER_STATUS, user_model.id)
+            # Write-through: status/role/household mới có hiệu lực ngay cho require_permission
+            if self.status_cache is not None:
+                self.status_cache.set(user_model.id, UserStatus(
+                    user_model.status, user_model.role_id, user_model.household_id
+                ))
             return user_model
         except Exception as e:
             self.session.rollback()
@@ -80,8 +203,10 @@ class UserRepository(IUserRepository):
         try:
             user = self.session.query(UserModel).filter_by(id=user_id).first()
             if user:
+                self._delete_search_tokens(user_id)
                 self.session.delete(user)
                 self.session.commit()
+                self.bus.publish(NS_USER_STATUS, user_id)
             else:
                 raise ValueError('User not found')
         except Exception as e:
@@ -90,27 +215,19 @@ class UserRepository(IUserRepository):
 
     def get_by_household_id(self, household_id: int) -> List[UserModel]:
         return self.session.query(UserModel).filter_by(household_id=household_id).all()
+
+    @replica_read
+    def get_by_household_id_page(self, household_id: int, page_request: PageRequest) -> Page:
+        query = self.session.query(UserModel).filter_by(household_id=household_id)
+        return paginate(query, USER_PAGE_SPEC, page_request)
     
     def list_exclude_role(self, exclude_role_id: int) -> List[UserModel]:
         """List all users except users with specific role_id"""
         return self.session.query(UserModel).filter(UserModel.role_id != exclude_role_id).all()
     
-    def search_and_filter(self, exclude_role_id: int = None, role_id: int = None, 
-                         status: str = None, household_id: int = None,
-                         search_term: str = None) -> List[UserModel]:
-        """
-        Search and filter users
-        
-        Business Logic: Admin quản lý Owner accounts - view, search, filter, manage
-        
-        Args:
-            exclude_role_id: Exclude users with this role_id (e.g., exclude Employee for Admin)
-            role_id: Filter by role_id (e.g., only Owner role)
-            status: Filter by status (Active, Inactive) - để activate/deactivate
-            household_id: Filter by household_id
-            search_term: Search by user_name or email (case-insensitive, partial match) - để search Owner accounts
-        """
-        query = self.session.query(UserModel)
+    def _filtered_query(self, columns, exclude_role_id=None, role_id=None, status=None,
+                        household_id=None, search_term=None):
+        query = self.session.query(*columns)
         
         # Filter: Exclude role (Admin exclude Employee)
         if exclude_role_id is not None:
@@ -128,12 +245,55 @@ class UserRepository(IUserRepository):
         if household_id is not None:
             query = query.filter(UserModel.household_id == household_id)
         
-        # Search: By user_name or email (case-insensitive, partial match)
+        # Search: By user_name or email qua token index (không dấu, prefix/chứa trong chuỗi)
         if search_term:
-            search_pattern = f'%{search_term}%'
-            query = query.filter(
-                (UserModel.user_name.ilike(search_pattern)) | 
-                (UserModel.email.ilike(search_pattern))
-            )
+            condition = user_search_condition(search_term)
+            if condition is not None:
+                query = query.filter(condition)
+        return query
+
+    @replica_read
+    def search_and_filter(self, exclude_role_id: int = None, role_id: int = None, 
+                         status: str = None, household_id: int = None,
+                         search_term: str = None, page_request: PageRequest = None):
+        """
+        Search and filter users
         
-        return query.all()
\ No newline at end of file
+        Business Logic: Admin quản lý Owner accounts - view, search, filter, manage
+        
+        Args:
+            exclude_role_id: Exclude users with this role_id (e.g., exclude Employee for Admin)
+            role_id: Filter by role_id (e.g., only Owner role)
+            status: Filter by status (Active, Inactive) - để activate/deactivate
+            household_id: Filter by household_id
+            search_term: Search by user_name or email (không dấu, prefix hoặc chứa trong chuỗi) - để search Owner accounts
+            page_request: Nếu có -> trả về Page (keyset) thay vì List[UserModel]
+        """
+        query = self._filtered_query(
+            (UserModel,), exclude_role_id=exclude_role_id, role_id=role_id, status=status,
+            household_id=household_id, search_term=search_term
+        )
+        if page_request is not None:
+            return paginate(query, USER_PAGE_SPEC, page_request)
+        return query.all()
+
+    @replica_read
+    def facet_counts(self, exclude_role_id: int = None, role_id: int = None, status: str = None,
+                     household_id: int = None, search_term: str = None) -> dict:
+        """
+        Số user theo role_id và theo status với cùng filter/search của search_and_filter (2 query GROUP BY)
+
+        Mỗi facet bỏ qua filter của chính nó (đếm theo role không lọc role_id) để UI hiển thị số lượng
+        của các lựa chọn khác. Returns: {'role_id': {role_id: count}, 'status': {status: count}}
+        """
+        filters = dict(exclude_role_id=exclude_role_id, household_id=household_id, search_term=search_term)
+        by_role = self._filtered_query(
+            (UserModel.role_id, func.count(UserModel.id)), status=status, **filters
+        ).group_by(UserModel.role_id).all()
+        by_status = self._filtered_query(
+            (UserModel.status, func.count(UserModel.id)), role_id=role_id, **filters
+        ).group_by(UserModel.status).all()
+        return {
+            'role_id': {role: count for role, count in by_role},
+            'status': {value: count for value, count in by_status},
+        }
@@ -2,12 +2,27 @@ from domain.models.warehouse import Warehouse
 from domain.models.iwarehouse_repository import IWarehouseRepository
 from typing import List, Optional
 from infrastructure.models import Warehouse as WarehouseModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import session, replica_read, primary_read
+from domain.models.page import Page, PageRequest
+from infrastructure.repositories.pagination import PageSpec, paginate, select_columns
+from infrastructure.cache.invalidation import NS_COLLECTIONS, COLLECTION_WAREHOUSES, collection_key
+from dependency_container import container
+from sqlalchemy import func
+
+# Cột sort/filter/search của list warehouses
+WAREHOUSE_PAGE_SPEC = PageSpec(
+    WarehouseModel.id,
+    sort_columns={'name': WarehouseModel.name, 'created_at': WarehouseModel.created_at,
+                  'updated_at': WarehouseModel.updated_at},
+    filter_columns={'status': WarehouseModel.status},
+    search_columns=[WarehouseModel.name, WarehouseModel.address]
+)
 
 
 class WarehouseRepository(IWarehouseRepository):
-    def __init__(self, session=session):
+    def __init__(self, session=session, bus=None):
         self.session = session
+        self.bus = bus or container.invalidation_bus()
 
     def add(self, warehouse: Warehouse) -> WarehouseModel:
         try:
@@ -23,6 +38,7 @@ class WarehouseRepository(IWarehouseRepository):
             self.session.add(warehouse_model)
             self.session.commit()
             self.session.refresh(warehouse_model)
+            self._publish(warehouse_model.household_id)
             return warehouse_model
         except Exception as e:
             self.session.rollback()
@@ -34,11 +50,30 @@ class WarehouseRepository(IWarehouseRepository):
             household_id=household_id
         ).first()
 
+    @replica_read
     def list(self, household_id: int) -> List[WarehouseModel]:
         return self.session.query(WarehouseModel).filter_by(
             household_id=household_id
         ).all()
 
+    @replica_read
+    def list_page(self, household_id: int, page_request: PageRequest) -> Page:
+        """
+        Một trang (keyset) của household, filter/sort theo WAREHOUSE_PAGE_SPEC
+
+        Items là Row chỉ gồm các cột cần (page_request.fields + id + cột sort), không phải ORM entity
+        """
+        columns = select_columns(WarehouseModel.__table__, WAREHOUSE_PAGE_SPEC, page_request)
+        query = self.session.query(*columns).filter(WarehouseModel.household_id == household_id)
+        return paginate(query, WAREHOUSE_PAGE_SPEC, page_request)
+
+    @primary_read
+    def version_stamp(self, household_id: int):
+        """(max(updated_at), count) của household - version stamp cho ETag của list (primary: stamp được cache)"""
+        return tuple(self.session.query(func.max(WarehouseModel.updated_at), func.count(WarehouseModel.id)).filter(
+            WarehouseModel.household_id == household_id
+        ).one())
+
     def update(self, warehouse: Warehouse) -> WarehouseModel:
         try:
             warehouse_model = self.session.query(WarehouseModel).filter_by(
@@ -62,6 +97,7 @@ class WarehouseRepository(IWarehouseRepository):
 
             self.session.commit()
             self.session.refresh(warehouse_model)
+            self._publish(warehouse_model.household_id)
             return warehouse_model
         except Exception as e:
             self.session.rollback()
@@ -79,6 +115,11 @@ class WarehouseRepository(IWarehouseRepository):
 
             self.session.delete(warehouse_model)
             self.session.commit()
+            self._publish(household_id)
         except Exception as e:
             self.session.rollback()
             raise ValueError(f"Error deleting warehouse: {str(e)}")
+
+    def _publish(self, household_id):
+        """Sau commit: version stamp (ETag) list của household hết hiệu lực ở mọi worker"""
+        self.bus.publish(NS_COLLECTIONS, collection_key(COLLECTION_WAREHOUSES, household_id))
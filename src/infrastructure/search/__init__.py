@@ -0,0 +1,9 @@
+from infrastructure.search.text import fold_text, tokenize, trigrams
+from infrastructure.search.index import SearchIndex
+
+__all__ = [
+    'fold_text',
+    'tokenize',
+    'trigrams',
+    'SearchIndex'
+]
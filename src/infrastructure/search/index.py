@@ -0,0 +1,250 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+from infrastructure.search.text import tokenize, trigrams
+
+# Điểm của một từ trong query khi khớp với một từ của document (nhân với weight của field)
+SCORE_EXACT = 3.0    # trùng cả từ
+SCORE_PREFIX = 2.0   # khớp đầu từ ("xi ma" -> "xi măng")
+SCORE_INFIX = 1.0    # khớp giữa từ, chỉ dùng khi khớp đầu từ không đủ kết quả (từ query >= 3 ký tự)
+FIRST_WORD_BONUS = 1.25  # từ đầu tiên của field
+
+_EMPTY = frozenset()
+
+
+class _Document:
+    __slots__ = ('payload', 'word_weights', 'rank')
+
+    def __init__(self, payload, word_weights, rank):
+        self.payload = payload
+        self.word_weights = word_weights  # từ (đã fold) -> weight cao nhất của từ trong document
+        self.rank = rank  # thứ tự khi cùng điểm (nhỏ trước)
+
+
+class SearchIndex:
+    """
+    Inverted index full-text trong bộ nhớ, không dấu, cho tìm kiếm gõ tới đâu lọc tới đó
+
+    - postings: từ -> set doc_id; primary postings: chỉ từ thuộc field weight cao nhất (vd: tên sản phẩm)
+    - vocabulary: danh sách từ đã sort -> lookup prefix bằng bisect (không lưu từng prefix, tiết kiệm bộ nhớ)
+    - trigram index trên vocabulary: 3-gram -> set từ, để khớp giữa từ ("mang" trong "ximang")
+    - Mọi từ của query phải khớp (AND), lọc bằng phép giao set; chỉ chấm điểm tập document
+      khớp ở field chính nếu tập đó đủ limit kết quả -> query ngắn ("x") không phải chấm điểm cả catalog
+    - add/remove incremental, thread-safe
+
+    Args:
+        field_weights: {field: weight}
+        rank: payload -> key sort tăng dần khi cùng điểm (tính một lần lúc add), mặc định doc_id
+    """
+    def __init__(self, field_weights: dict, rank=None):
+        self.field_weights = field_weights
+        self.rank = rank
+        self.primary_field = max(field_weights, key=field_weights.get)
+        self._docs = {}
+        self._postings = {}
+        self._primary_postings = {}
+        self._weighted_postings = {}  # từ -> {weight: set doc_id}, xếp hạng query 1 từ không cần duyệt từng doc
+        self._vocabulary = []
+        self._trigrams = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._docs
+
+    def _document(self, texts, payload):
+        word_weights = {}
+        primary_words = ()
+        for field, weight in self.field_weights.items():
+            words = tokenize(texts.get(field))
+            if field == self.primary_field:
+                primary_words = set(words)
+            for position, word in enumerate(words):
+                score = weight * FIRST_WORD_BONUS if position == 0 else weight
+                if score > word_weights.get(word, 0):
+                    word_weights[word] = score
+        rank = self.rank(payload) if self.rank is not None else 0
+        return _Document(payload, word_weights, rank), primary_words
+
+    def _insert(self, doc_id, document, primary_words, new_words):
+        self._docs[doc_id] = document
+        for word in document.word_weights:
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = set()
+                new_words.append(word)
+                for gram in trigrams(word):
+                    self._trigrams.setdefault(gram, set()).add(word)
+            postings.add(doc_id)
+            self._weighted_postings.setdefault(word, {}).setdefault(document.word_weights[word], set()).add(doc_id)
+        for word in primary_words:
+            self._primary_postings.setdefault(word, set()).add(doc_id)
+
+    def add(self, doc_id, texts: dict, payload=None) -> None:
+        """Thêm hoặc thay thế document. texts: {field: text}"""
+        document, primary_words = self._document(texts, payload)
+        with self._lock:
+            self._remove(doc_id)
+            new_words = []
+            self._insert(doc_id, document, primary_words, new_words)
+            for word in new_words:
+                insort(self._vocabulary, word)
+
+    def add_many(self, items) -> None:
+        """Thêm nhiều document (doc_id, texts, payload), sort vocabulary một lần ở cuối (build index ban đầu)"""
+        with self._lock:
+            new_words = []
+            for doc_id, texts, payload in items:
+                document, primary_words = self._document(texts, payload)
+                self._remove(doc_id)
+                self._insert(doc_id, document, primary_words, new_words)
+            if new_words:
+                self._vocabulary = sorted(self._postings)
+
+    def remove(self, doc_id) -> None:
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        document = self._docs.pop(doc_id, None)
+        if document is None:
+            return
+        for word in document.word_weights:
+            primary = self._primary_postings.get(word)
+            if primary is not None:
+                primary.discard(doc_id)
+                if not primary:
+                    del self._primary_postings[word]
+            weighted = self._weighted_postings[word]
+            weight = document.word_weights[word]
+            weighted[weight].discard(doc_id)
+            if not weighted[weight]:
+                del weighted[weight]
+                if not weighted:
+                    del self._weighted_postings[word]
+            postings = self._postings[word]
+            postings.discard(doc_id)
+            if not postings:
+                # Từ không còn document nào -> bỏ khỏi vocabulary và trigram index
+                del self._postings[word]
+                index = bisect_left(self._vocabulary, word)
+                if index < len(self._vocabulary) and self._vocabulary[index] == word:
+                    del self._vocabulary[index]
+                for gram in trigrams(word):
+                    words = self._trigrams[gram]
+                    words.discard(word)
+                    if not words:
+                        del self._trigrams[gram]
+
+    def _prefix_words(self, token):
+        """Từ trong vocabulary bắt đầu bằng token -> điểm"""
+        start = bisect_left(self._vocabulary, token)
+        end = bisect_left(self._vocabulary, token + '\uffff', start)
+        return {word: SCORE_EXACT if word == token else SCORE_PREFIX for word in self._vocabulary[start:end]}
+
+    def _infix_words(self, token):
+        """Từ trong vocabulary chứa token ở giữa (token >= 3 ký tự) -> điểm"""
+        grams = trigrams(token)
+        if not grams:
+            return {}
+        candidate_sets = sorted((self._trigrams.get(gram, _EMPTY) for gram in grams), key=len)
+        words = set(candidate_sets[0])
+        for candidate_set in candidate_sets[1:]:
+            words &= candidate_set
+            if not words:
+                return {}
+        return {word: SCORE_INFIX for word in words if token in word and not word.startswith(token)}
+
+    @staticmethod
+    def _union(postings, words):
+        doc_ids = set()
+        for word in words:
+            doc_ids |= postings.get(word, _EMPTY)
+        return doc_ids
+
+    def _intersect(self, postings, token_words):
+        doc_ids = None
+        for words in sorted(token_words, key=len):
+            matched = self._union(postings, words)
+            doc_ids = matched if doc_ids is None else doc_ids & matched
+            if not doc_ids:
+                return set()
+        return doc_ids
+
+    def _pool(self, token_words, limit, predicate):
+        """doc_id cần chấm điểm: khớp mọi từ ở field chính nếu đủ limit, ngược lại khớp ở mọi field"""
+        pool = ()
+        for postings in (self._primary_postings, self._postings):
+            pool = self._intersect(postings, token_words)
+            if predicate is not None:
+                pool = [doc_id for doc_id in pool if predicate(self._docs[doc_id].payload)]
+            if len(pool) >= limit:
+                break
+        return pool
+
+    def _top_single(self, words, pool, limit):
+        """
+        Top-K cho query 1 từ: điểm của doc = base * weight chỉ có vài giá trị -> duyệt nhóm điểm
+        từ cao xuống thấp bằng phép toán set, chỉ sort theo rank trong nhóm cuối cùng cần lấy
+        """
+        groups = {}
+        for word, base in words.items():
+            for weight, doc_ids in self._weighted_postings[word].items():
+                groups.setdefault(base * weight, []).append(doc_ids)
+        pool = pool if isinstance(pool, set) else set(pool)
+        docs = self._docs
+        seen = set()
+        result = []
+        for score in sorted(groups, reverse=True):
+            doc_ids = pool.intersection(*groups[score]) if len(groups[score]) == 1 \
+                else pool & set().union(*groups[score])
+            doc_ids -= seen
+            if not doc_ids:
+                continue
+            seen |= doc_ids
+            ranked = heapq.nsmallest(limit - len(result), [(docs[doc_id].rank, doc_id) for doc_id in doc_ids])
+            result.extend(docs[doc_id].payload for _, doc_id in ranked)
+            if len(result) >= limit:
+                break
+        return result
+
+    def search(self, query: str, limit: int, predicate=None) -> list:
+        """
+        Top `limit` payload khớp query, điểm cao trước
+
+        Args:
+            predicate: payload -> bool, lọc thêm (status, category...) trước khi tính điểm
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or limit <= 0:
+            return []
+        with self._lock:
+            token_words = [self._prefix_words(token) for token in tokens]
+            pool = self._pool(token_words, limit, predicate)
+            if len(pool) < limit and any(len(token) >= 3 for token in tokens):
+                # Không đủ kết quả khớp đầu từ -> mở rộng sang khớp giữa từ
+                for token, words in zip(tokens, token_words):
+                    words.update(self._infix_words(token))
+                pool = self._pool(token_words, limit, predicate)
+            if len(token_words) == 1:
+                return self._top_single(token_words[0], pool, limit)
+            # Điểm của doc = tổng theo từng từ query của max(điểm khớp * weight của từ trong doc)
+            scores = None
+            for words in token_words:
+                token_scores = {}
+                for word, base in words.items():
+                    for doc_id in self._postings[word].intersection(pool) if scores is None \
+                            else self._postings[word].intersection(scores):
+                        score = base * self._docs[doc_id].word_weights[word]
+                        if score > token_scores.get(doc_id, 0):
+                            token_scores[doc_id] = score
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {doc_id: scores[doc_id] + score for doc_id, score in token_scores.items()}
+            docs = self._docs
+            # Tuple (-điểm, rank, doc_id) so sánh trong C, không cần key function
+            top = heapq.nsmallest(limit, [(-score, docs[doc_id].rank, doc_id) for doc_id, score in scores.items()])
+            return [docs[doc_id].payload for _, _, doc_id in top]
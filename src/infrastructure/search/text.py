@@ -0,0 +1,43 @@
+import re
+import sys
+import unicodedata
+
+_NON_WORD = re.compile(r'[^0-9a-z]+')
+
+
+def _build_fold_table():
+    """Ký tự Latin có dấu (kể cả tiếng Việt) -> chữ gốc, dấu rời (combining) -> bỏ"""
+    table = {ord('đ'): 'd', ord('Đ'): 'd'}
+    for code in range(0x00C0, 0x1EFF + 1):
+        char = chr(code)
+        if unicodedata.combining(char):
+            table[code] = None
+            continue
+        base = unicodedata.normalize('NFD', char)[0]
+        if base != char and base.isascii():
+            table[code] = base.lower()
+    return table
+
+
+_FOLD_TABLE = _build_fold_table()
+
+
+def fold_text(text: str) -> str:
+    """
+    Chuẩn hóa text để so khớp không dấu: lowercase, bỏ dấu tiếng Việt (đ -> d), ký tự khác chữ/số -> space
+
+    "Xi Măng Hà Tiên (50kg)" -> "xi mang ha tien 50kg"
+    """
+    if not text:
+        return ''
+    return _NON_WORD.sub(' ', text.lower().translate(_FOLD_TABLE)).strip()
+
+
+def tokenize(text: str) -> list:
+    """Danh sách từ đã fold (giữ thứ tự, có thể trùng)"""
+    return [sys.intern(word) for word in fold_text(text).split()]
+
+
+def trigrams(word: str) -> set:
+    """3-gram của một từ ("mang" -> {"man", "ang"}), rỗng nếu từ ngắn hơn 3 ký tự"""
+    return {word[i:i + 3] for i in range(len(word) - 2)}
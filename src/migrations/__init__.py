@@ -0,0 +1,6 @@
+# This directory contains database migration files.
+#
+# Mỗi migration là một module mNNNN_<tên>.py với:
+#   revision     : số thứ tự (int), tăng dần
+#   description  : mô tả ngắn
+#   upgrade(connection) / downgrade(connection)
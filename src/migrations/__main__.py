@@ -0,0 +1,51 @@
+"""
+Migration CLI
+
+Usage (chạy trong thư mục src):
+    python -m migrations status              # version hiện tại, head, migration chưa áp dụng
+    python -m migrations upgrade [--to N]    # áp dụng migration tới head (hoặc revision N)
+    python -m migrations downgrade --to N    # rollback về revision N
+    python -m migrations stamp [--to N]      # đánh version không chạy migration
+    python -m migrations create-all          # DEV: create_all từ model + đánh version head
+"""
+import argparse
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from infrastructure.databases.mssql import get_engine
+from migrations import runner
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m migrations', description='Database schema migrations')
+    parser.add_argument('command', choices=['status', 'upgrade', 'downgrade', 'stamp', 'create-all'])
+    parser.add_argument('--to', type=int, default=None, help='Target revision')
+    args = parser.parse_args()
+
+    engine = get_engine()
+    if args.command == 'status':
+        current, head, pending = runner.status(engine)
+        print(f'Current version: {current if current is not None else "none"}')
+        print(f'Head revision:   {head}')
+        print(f'Pending:         {", ".join(f"{r:04d}" for r in pending) or "none"}')
+    elif args.command == 'upgrade':
+        applied = runner.upgrade(engine, target=args.to)
+        print(f'{len(applied)} migration(s) applied')
+    elif args.command == 'downgrade':
+        if args.to is None:
+            parser.error('downgrade requires --to')
+        reverted = runner.downgrade(engine, target=args.to)
+        print(f'{len(reverted)} migration(s) reverted')
+    elif args.command == 'stamp':
+        runner.stamp(engine, args.to)
+        print('Stamped')
+    elif args.command == 'create-all':
+        runner.create_all(engine)
+        print('Schema created from models and stamped at head')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+"""
+Migration 0000 - Baseline schema: tạo tất cả bảng theo model hiện tại (bảng đã có thì bỏ qua)
+
+Database cũ tạo bằng create_all lúc boot cũng chạy được migration này (không đổi gì), sau đó được đánh version.
+"""
+revision = 0
+description = 'Baseline schema (all model tables)'
+
+
+def upgrade(connection):
+    import infrastructure.models  # noqa: F401 - đăng ký tất cả model vào Base.metadata
+    from infrastructure.databases.base import Base
+    Base.metadata.create_all(bind=connection)
+
+
+def downgrade(connection):
+    raise ValueError('Baseline migration cannot be downgraded')
@@ -0,0 +1,81 @@
+"""
+Migration 0001 - Composite/covering index cho các bảng theo tenant (household_id) và filter hay dùng
+
+Định nghĩa index nằm trong __table_args__ của model (database mới tạo bằng create_all đã có sẵn),
+migration này tạo các index còn thiếu trên database đã tồn tại. Chạy lại nhiều lần không lỗi.
+
+Usage:
+    python -m migrations upgrade
+"""
+from sqlalchemy import inspect
+
+revision = 1
+description = 'Tenant-aware composite and covering indexes'
+
+# Bảng -> index (tên khớp với Index trong model)
+INDEXES = {
+    'products': [
+        'ix_products_household_id_id',
+        'ix_products_household_id_status',
+        'ix_products_household_id_category_id',
+    ],
+    'categories': ['ix_categories_household_id_id', 'ix_categories_household_id_status'],
+    'units': ['ix_units_household_id_id', 'ix_units_household_id_status'],
+    'warehouses': ['ix_warehouses_household_id_id', 'ix_warehouses_household_id_status'],
+    'customers': ['ix_customers_household_id_id', 'ix_customers_household_id_status'],
+    'sellers': ['ix_sellers_household_id_id', 'ix_sellers_household_id_status'],
+    'users': ['ix_users_household_id_role_id_status', 'ix_users_role_id_status'],
+    'subscriptions': ['ix_subscriptions_household_id_is_active_end_date'],
+    'invoices': [
+        'ix_invoices_household_id_created_at',
+        'ix_invoices_household_id_status_created_at',
+        'ix_invoices_customer_id',
+        'ix_invoices_seller_id',
+    ],
+    'invoice_details': ['ix_invoice_details_invoice_id', 'ix_invoice_details_product_id'],
+    'payments': ['ix_payments_invoice_id'],
+    'inventories': ['ix_inventories_warehouse_id_product_id', 'ix_inventories_product_id'],
+    'debt_record': ['ix_debt_record_customer_id_record_at'],
+    'accounting_ledger': [
+        'ix_accounting_ledger_transaction_date',
+        'ix_accounting_ledger_status_transaction_date',
+    ],
+    'import_receipts': ['ix_import_receipts_warehouse_id_import_date'],
+    'export_receipts': ['ix_export_receipts_warehouse_id_export_date'],
+}
+
+
+def _model_indexes():
+    """(table_name, Index) lấy từ metadata của model"""
+    import infrastructure.models  # noqa: F401 - đăng ký tất cả model vào Base.metadata
+    from infrastructure.databases.base import Base
+    for table_name, index_names in INDEXES.items():
+        table = Base.metadata.tables[table_name]
+        by_name = {index.name: index for index in table.indexes}
+        for index_name in index_names:
+            yield table_name, by_name[index_name]
+
+
+def _existing_indexes(connection, table_name):
+    inspector = inspect(connection)
+    if not inspector.has_table(table_name):
+        return None
+    return {index['name'] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade(connection):
+    existing = {}
+    for table_name, index in _model_indexes():
+        if table_name not in existing:
+            existing[table_name] = _existing_indexes(connection, table_name)
+        # Bảng chưa tồn tại sẽ được tạo kèm index bởi create_all
+        if existing[table_name] is not None and index.name not in existing[table_name]:
+            index.create(bind=connection)
+
+
+def downgrade(connection):
+    for table_name, index in _model_indexes():
+        names = _existing_indexes(connection, table_name)
+        if names and index.name in names:
+            index.drop(bind=connection)
+
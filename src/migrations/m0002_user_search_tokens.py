@@ -0,0 +1,54 @@
+"""
+Migration 0002 - Bảng user_search_tokens cho admin search user (thay ILIKE '%term%' trên users)
+
+Tạo bảng + index nếu chưa có (database mới tạo bằng create_all đã có sẵn) rồi build lại token
+cho toàn bộ user hiện có. Chạy lại nhiều lần không lỗi.
+"""
+from sqlalchemy import inspect, select
+
+revision = 2
+description = 'User search token table (indexed admin user search)'
+
+# Số token insert mỗi lần (executemany)
+BATCH_SIZE = 1000
+
+
+def _tables():
+    import infrastructure.models  # noqa: F401 - đăng ký tất cả model vào Base.metadata
+    from infrastructure.databases.base import Base
+    return Base.metadata.tables['users'], Base.metadata.tables['user_search_tokens']
+
+
+def upgrade(connection):
+    from infrastructure.models import UserSearchToken
+    users, tokens = _tables()
+    inspector = inspect(connection)
+    if not inspector.has_table(tokens.name):
+        tokens.create(bind=connection)
+    else:
+        existing = {index['name'] for index in inspector.get_indexes(tokens.name)}
+        for index in tokens.indexes:
+            if index.name not in existing:
+                index.create(bind=connection)
+
+    # Backfill: build lại token của mọi user
+    connection.execute(tokens.delete())
+    batch = []
+    # fetchall: một số driver (pymssql) không cho execute khi result set trước chưa đọc hết
+    rows = connection.execute(select(users.c.id, users.c.user_name, users.c.email)).fetchall()
+    for user_id, user_name, email in rows:
+        batch.extend(
+            {'user_id': user_id, 'kind': kind, 'token': token}
+            for kind, token in UserSearchToken.tokens_for(user_name, email)
+        )
+        if len(batch) >= BATCH_SIZE:
+            connection.execute(tokens.insert(), batch)
+            batch = []
+    if batch:
+        connection.execute(tokens.insert(), batch)
+
+
+def downgrade(connection):
+    _, tokens = _tables()
+    if inspect(connection).has_table(tokens.name):
+        tokens.drop(bind=connection)
@@ -0,0 +1,115 @@
+"""
+Migration runner - áp dụng các migration mNNNN_*.py theo thứ tự và lưu version hiện tại trong bảng schema_version
+"""
+import importlib
+import pkgutil
+from datetime import datetime
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, inspect, select
+
+# Bảng 1 dòng (id = 1) lưu revision mới nhất đã áp dụng
+schema_metadata = MetaData()
+schema_version = Table(
+    'schema_version', schema_metadata,
+    Column('id', Integer, primary_key=True, autoincrement=False),
+    Column('version', Integer, nullable=False),
+    Column('description', String(255), nullable=True),
+    Column('applied_at', DateTime, nullable=False),
+)
+
+
+def load_migrations():
+    """Tất cả migration module trong package, sắp theo revision"""
+    import migrations
+    modules = []
+    for info in pkgutil.iter_modules(migrations.__path__):
+        if info.name.startswith('m') and info.name[1:5].isdigit():
+            modules.append(importlib.import_module(f'migrations.{info.name}'))
+    modules.sort(key=lambda module: module.revision)
+    revisions = [module.revision for module in modules]
+    if len(revisions) != len(set(revisions)):
+        raise ValueError(f'Duplicate migration revision: {revisions}')
+    return modules
+
+
+def head_revision():
+    return load_migrations()[-1].revision
+
+
+def current_version(engine):
+    """
+    Revision đã áp dụng, None nếu database chưa có bảng schema_version
+
+    Lỗi kết nối/query (database down...) được raise, không coi là database trống
+    """
+    with engine.connect() as connection:
+        if not inspect(connection).has_table(schema_version.name):
+            return None
+        return connection.execute(
+            select(schema_version.c.version).where(schema_version.c.id == 1)
+        ).scalar()
+
+
+def _stamp(connection, migration):
+    values = {'version': migration.revision, 'description': migration.description, 'applied_at': datetime.utcnow()}
+    updated = connection.execute(schema_version.update().where(schema_version.c.id == 1).values(**values))
+    if updated.rowcount == 0:
+        connection.execute(schema_version.insert().values(id=1, **values))
+
+
+def upgrade(engine, target=None, log=print):
+    """Áp dụng các migration có revision > version hiện tại (tới target), mỗi migration một transaction"""
+    schema_metadata.create_all(bind=engine)
+    current = current_version(engine)
+    applied = []
+    for migration in load_migrations():
+        if current is not None and migration.revision <= current:
+            continue
+        if target is not None and migration.revision > target:
+            break
+        with engine.begin() as connection:
+            migration.upgrade(connection)
+            _stamp(connection, migration)
+        log(f'Applied migration {migration.revision:04d}: {migration.description}')
+        applied.append(migration.revision)
+    return applied
+
+
+def downgrade(engine, target, log=print):
+    """Rollback các migration có revision > target (mới nhất trước)"""
+    current = current_version(engine)
+    if current is None:
+        return []
+    migrations = {migration.revision: migration for migration in load_migrations()}
+    reverted = []
+    for revision in sorted((r for r in migrations if target < r <= current), reverse=True):
+        previous = max(r for r in migrations if r < revision)
+        with engine.begin() as connection:
+            migrations[revision].downgrade(connection)
+            _stamp(connection, migrations[previous])
+        log(f'Reverted migration {revision:04d}: {migrations[revision].description}')
+        reverted.append(revision)
+    return reverted
+
+
+def stamp(engine, revision=None):
+    """Đánh version mà không chạy migration (database đã đúng schema)"""
+    schema_metadata.create_all(bind=engine)
+    migrations = {migration.revision: migration for migration in load_migrations()}
+    revision = max(migrations) if revision is None else revision
+    with engine.begin() as connection:
+        _stamp(connection, migrations[revision])
+
+
+def create_all(engine):
+    """Dev: tạo toàn bộ schema từ model rồi đánh version head (không chạy từng migration)"""
+    import infrastructure.models  # noqa: F401
+    from infrastructure.databases.base import Base
+    Base.metadata.create_all(bind=engine)
+    stamp(engine)
+
+
+def status(engine):
+    """(version hiện tại, head, danh sách revision chưa áp dụng)"""
+    current = current_version(engine)
+    pending = [m.revision for m in load_migrations() if current is None or m.revision > current]
+    return current, head_revision(), pending
@@ -16,6 +16,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from infrastructure.databases.mssql import session
 from infrastructure.models import Role, Function, RoleFunction
+from dependency_container import container
+from infrastructure.cache.invalidation import NS_RBAC, NS_ROLES
 
 def clean_old_data(clean_all_functions=False):
     """
@@ -257,6 +259,12 @@ def main():
         # Bước 3: Map Functions to Roles (tạo mới RoleFunction mappings)
         seed_role_functions()
         
+        # Bước 4: Báo RBAC thay đổi qua invalidation bus (server dùng redis:// bus rebuild ngay,
+        # local:// bus thì server đang chạy sẽ rebuild sau RBAC_CACHE_TTL)
+        bus = container.invalidation_bus()
+        bus.publish(NS_ROLES)
+        bus.publish(NS_RBAC)
+        
         print("=" * 60)
         print("SEED DATA COMPLETED SUCCESSFULLY!")
         print("=" * 60)
@@ -2,17 +2,20 @@
 Auth Service - Business logic cho authentication
 """
 from infrastructure.databases.mssql import session
-from infrastructure.models import User as UserModel, Role
+from infrastructure.models import User as UserModel
 from datetime import datetime, timedelta
 import jwt
 from flask import current_app
 from config import Config
 from services.subscription_service import SubscriptionService
+from services.permission_service import PermissionService
+from services.role_registry_service import role_registry
 
 class AuthService:
     def __init__(self, db_session):
         self.session = db_session
         self.subscription_service = SubscriptionService(db_session)
+        self.permission_service = PermissionService(db_session)
     
     def authenticate_user(self, user_name: str, password: str):
         """
@@ -39,7 +42,7 @@ class AuthService:
         # Business rule: Check subscription cho Owner/Employee (không check cho Admin)
         if user.household_id:  # Owner hoặc Employee (Admin có household_id = NULL)
             # Lấy role để check
-            role = self.session.query(Role).filter_by(id=user.role_id).first()
+            role = role_registry.get_by_id(user.role_id)
             if role:
                 role_name_upper = role.role_name.upper()
                 # Chỉ check subscription cho Owner và Employee, không check cho Admin
@@ -67,6 +70,13 @@ class AuthService:
             'exp': datetime.utcnow() + timedelta(hours=24)
         }
         
+        # Optional: embed permission snapshot (function_code -> bitmask) + RBAC version
+        # require_permission authorize từ token khi rbac_v còn khớp, fallback database khi lệch
+        if Config.JWT_EMBED_PERMISSIONS:
+            snapshot = self.permission_service.get_permission_snapshot(user.role_id)
+            if snapshot is not None:
+                payload['perms'], payload['rbac_v'] = snapshot
+        
         # Lấy SECRET_KEY từ current_app hoặc Config
         try:
             secret_key = current_app.config['SECRET_KEY']
@@ -85,26 +95,3 @@ class AuthService:
             UserModel hoặc None
         """
         return self.session.query(UserModel).filter_by(id=user_id).first()
-    
-    def decode_token(self, token: str):
-        """
-        Decode JWT token
-        
-        Returns:
-            dict: Payload
-            Raise ValueError nếu token invalid/expired
-        """
-        # Lấy SECRET_KEY từ current_app hoặc Config
-        try:
-            secret_key = current_app.config['SECRET_KEY']
-        except RuntimeError:
-            # Không có app context, dùng Config
-            secret_key = Config.SECRET_KEY
-        
-        try:
-            payload = jwt.decode(token, secret_key, algorithms=['HS256'])
-            return payload
-        except jwt.ExpiredSignatureError:
-            raise ValueError('Token expired')
-        except jwt.InvalidTokenError:
-            raise ValueError('Invalid token')
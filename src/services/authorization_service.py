@@ -0,0 +1,108 @@
+"""
+Authorization Service - Resolve user status, permission và subscription cho require_permission
+"""
+from collections import namedtuple
+from datetime import datetime
+from sqlalchemy import func
+from infrastructure.models import User, Function, RoleFunction, Subscription
+from services.permission_service import PermissionService
+from services.subscription_service import SubscriptionService
+from infrastructure.repositories.user_repository import user_status_cache, UserStatus
+from config import Config
+
+# Kết quả authorize của một request
+# - user_status: status của user
+# - permission_mask: bitmask CRUD của role cho function_code (0 nếu không có quyền)
+# - subscription_active: household có subscription active không (True cho Admin)
+AuthorizationContext = namedtuple(
+    'AuthorizationContext',
+    ['user_status', 'permission_mask', 'subscription_active']
+)
+
+
+class AuthorizationService:
+    def __init__(self, db_session):
+        self.session = db_session
+        self.permission_service = PermissionService(db_session)
+        self.subscription_service = SubscriptionService(db_session)
+        self.user_cache = user_status_cache if Config.USER_CACHE_ENABLED else None
+    
+    def resolve(self, user_id, role_id, household_id, function_code, claims=None):
+        """
+        Resolve thông tin authorize cho request
+        
+        Ưu tiên permission snapshot trong token (nếu rbac_v còn khớp), rồi tới cache
+        (permission matrix, subscription status cache). Phần nào cache bị tắt hoặc miss
+        thì dùng 1 fused query duy nhất thay vì query tuần tự.
+        
+        Returns:
+            AuthorizationContext, hoặc None nếu user không tồn tại
+        """
+        permission_mask = self.permission_service.get_token_mask(claims, function_code)
+        if permission_mask is None:
+            permission_mask = self.permission_service.get_cached_mask(role_id, function_code)
+        
+        subscription_active = True  # Admin (household_id = None) không cần check subscription
+        status_cache = self.subscription_service.status_cache
+        if household_id:
+            subscription_active = status_cache.get(household_id) if status_cache is not None else None
+        
+        user = self.user_cache.get(user_id) if self.user_cache is not None else None
+        if user is not None and permission_mask is not None and subscription_active is not None:
+            # Tất cả cache đều warm -> không cần database
+            return AuthorizationContext(user.status, permission_mask, subscription_active)
+        
+        # Cache cold/tắt -> lấy tất cả phần còn thiếu trong 1 query
+        row = self.fetch_authorization_row(user_id, role_id, household_id, function_code)
+        if row is None:
+            return None
+        
+        if self.user_cache is not None:
+            self.user_cache.set(user_id, UserStatus(row.status, row.role_id, row.household_id))
+        
+        if permission_mask is None:
+            permission_mask = Function.methods_to_mask(row.http_methods)
+        
+        if subscription_active is None:
+            subscription_active = row.subscription_end_date is not None
+            if status_cache is not None:
+                status_cache.set(household_id, subscription_active, row.subscription_end_date)
+        
+        return AuthorizationContext(row.status, permission_mask, subscription_active)
+    
+    def fetch_authorization_row(self, user_id, role_id, household_id, function_code):
+        """
+        Fused authorization query: 1 round trip cho user status, permission và subscription
+        
+        SELECT users.status, users.role_id, users.household_id,
+               (SELECT functions.http_methods FROM functions JOIN role_functions ...
+                WHERE role_functions.role_id = :role_id AND functions.function_code = :code),
+               (SELECT MAX(subscriptions.end_date) FROM subscriptions
+                WHERE household_id = :household_id AND is_active = 1 AND end_date >= :now)
+        FROM users WHERE users.id = :user_id
+        
+        Returns:
+            Row (status, role_id, household_id, http_methods, subscription_end_date),
+            hoặc None nếu user không tồn tại
+        """
+        permission = self.session.query(Function.http_methods).join(
+            RoleFunction, RoleFunction.function_id == Function.id
+        ).filter(
+            RoleFunction.role_id == role_id,
+            Function.function_code == function_code
+        ).scalar_subquery()
+        
+        # Subscription active: is_active=True và end_date >= now (end_date lưu UTC không timezone)
+        subscription_end_date = self.session.query(func.max(Subscription.end_date)).filter(
+            Subscription.household_id == household_id,
+            Subscription.is_active == True,
+            Subscription.end_date >= datetime.utcnow()
+        ).scalar_subquery()
+        
+        return self.session.query(
+            User.status.label('status'),
+            User.role_id.label('role_id'),
+            User.household_id.label('household_id'),
+            permission.label('http_methods'),
+            subscription_end_date.label('subscription_end_date')
+        ).filter(User.id == user_id).first()
@@ -2,10 +2,14 @@ from domain.models.category import Category
 from domain.models.icategory_repository import ICategoryRepository
 from typing import List, Optional
 from datetime import datetime
+from domain.models.page import Page, PageRequest
+from infrastructure.cache.invalidation import COLLECTION_CATEGORIES
+from services.collection_version_service import CollectionVersion, collection_versions
 
 class CategoryService:
-    def __init__(self, repository: ICategoryRepository):
+    def __init__(self, repository: ICategoryRepository, versions=collection_versions):
         self.repository = repository
+        self.versions = versions
 
     def create_category(self, household_id:int, name: str, description: str = None, 
                         status: str = None) -> Category:
@@ -20,6 +24,13 @@ class CategoryService:
     def list_categories(self, household_id: int) -> List[Category]:
         return self.repository.list(household_id)
 
+    def list_categories_page(self, household_id: int, page_request: PageRequest) -> Page:
+        return self.repository.list_page(household_id, page_request)
+
+    def categories_version(self, household_id: int) -> CollectionVersion:
+        """Version stamp của list categories (ETag/Last-Modified), không load row"""
+        return self.versions.get(COLLECTION_CATEGORIES, household_id, self.repository.version_stamp)
+
     def update_category(self, category_id: int, household_id: int, name: str = None, description: str = None,
                         status: str = None) -> Category:
         now = datetime.utcnow()
@@ -0,0 +1,60 @@
+"""
+Collection Version Service - Version stamp (ETag/Last-Modified) của list reference data theo household
+"""
+import hashlib
+from collections import namedtuple
+from datetime import datetime
+from config import Config
+from dependency_container import container
+from infrastructure.cache.invalidation import NS_COLLECTIONS, collection_key
+
+# tag: hash của (collection, household, max(updated_at), count); last_modified: max(updated_at) (None nếu rỗng)
+CollectionVersion = namedtuple('CollectionVersion', ['tag', 'last_modified'])
+
+
+class CollectionVersionCache:
+    """
+    Cache version stamp của (collection, household) trên cache backend dùng chung
+
+    - Stamp tính từ DB bằng 1 query aggregate: max(updated_at) + count(*) (count đổi khi xóa row)
+    - Repository ghi collection publish NS_COLLECTIONS 'collection:household_id' -> mọi worker xóa entry,
+      request tiếp theo tính lại stamp
+    - Đếm số lần invalidate theo key: stamp tính xong chỉ được cache nếu không có invalidate xen giữa
+      (tránh ghi lại stamp cũ đọc trước khi commit)
+    """
+    def __init__(self, backend=None, ttl=None, bus=None):
+        backend = backend or container.cache_backend()
+        self.ttl = Config.COLLECTION_VERSION_TTL if ttl is None else ttl
+        self._cache = backend.namespace(NS_COLLECTIONS, versioned=True)
+        self._generations = backend.namespace(f'{NS_COLLECTIONS}_generation')
+        (bus or container.invalidation_bus()).subscribe(
+            NS_COLLECTIONS, lambda namespace, key: self.invalidate(key)
+        )
+
+    def get(self, collection, household_id, loader) -> CollectionVersion:
+        """
+        Args:
+            loader: loader(household_id) -> (max_updated_at, count), chỉ gọi khi miss
+        """
+        key = collection_key(collection, household_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            tag, last_modified = cached
+            return CollectionVersion(tag, datetime.fromisoformat(last_modified) if last_modified else None)
+        generation = self._generations.get(key)
+        max_updated_at, count = loader(household_id)
+        tag = hashlib.sha1(f'{key}:{max_updated_at}:{count}'.encode('utf-8')).hexdigest()[:20]
+        if self.ttl > 0 and self._generations.get(key) == generation:
+            self._cache.set(key, [tag, max_updated_at.isoformat() if max_updated_at else None], self.ttl)
+        return CollectionVersion(tag, max_updated_at)
+
+    def invalidate(self, key=None):
+        """Xóa stamp của 'collection:household_id' (hoặc tất cả nếu key=None)"""
+        if key is None:
+            self._cache.bump_version()
+            return
+        self._generations.incr(key, ttl=self.ttl or None)
+        self._cache.delete(key)
+
+
+collection_versions = CollectionVersionCache()
@@ -2,6 +2,7 @@ from domain.models.function import Function
 from domain.models.ifunction_repository import IFunctionRepository
 from typing import List, Optional
 from datetime import datetime
+from domain.models.page import Page, PageRequest
 
 class FunctionService:
     def __init__(self, repository: IFunctionRepository):
@@ -23,6 +24,9 @@ class FunctionService:
     def list_functions(self) -> List[Function]:
         return self.repository.list()
 
+    def list_functions_page(self, page_request: PageRequest) -> Page:
+        return self.repository.list_page(page_request)
+
     def update_function(self, function_id: int, function_code: str = None, function_name: str = None,
                        url_pattern: str = None, http_methods: str = None, description: str = None,
                        resource_type: str = None) -> Function:
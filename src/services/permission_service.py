@@ -1,12 +1,105 @@
 """
 Permission Service - Check role có function code không
 """
+import threading
+import time
+import zlib
 from infrastructure.databases.mssql import session
 from infrastructure.models import RoleFunction, Function, Role
+from config import Config
+from dependency_container import container
+from infrastructure.cache.invalidation import NS_RBAC
+
+
+class PermissionMatrix:
+    """
+    Compiled RBAC matrix trong process: role_id -> function_code -> method bitmask
+
+    - Load một lần (1 query join role_functions + functions), sau đó check permission chỉ là dict lookup
+    - invalidate() khi nhận sự kiện NS_RBAC (functions/role_functions thay đổi ở bất kỳ worker nào),
+      rebuild lazily ở lần check tiếp theo
+    - Rebuild định kỳ theo RBAC_CACHE_TTL để nhận thay đổi từ process khác (seed script, worker khác)
+    - version: checksum của nội dung matrix, giống nhau giữa các worker có cùng dữ liệu RBAC
+    - invalidate() có thể chạy trên thread listener của bus: đếm generation, matrix build xong chỉ được lưu
+      nếu không có invalidate xen giữa (tránh lưu lại matrix đọc trước khi ghi)
+    """
+    def __init__(self, ttl=None):
+        self.ttl = Config.RBAC_CACHE_TTL if ttl is None else ttl
+        self._state = None  # (matrix, version, loaded_at)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self):
+        state = self._state
+        return state is not None and (time.monotonic() - state[2]) < self.ttl
+
+    def load(self, db_session):
+        """Build lại toàn bộ matrix từ database"""
+        return self._load(db_session)[0]
+
+    def _load(self, db_session):
+        """Build matrix, trả về state vừa build (kể cả khi không được lưu do có invalidate xen giữa)"""
+        with self._lock:
+            generation = self._generation
+        rows = db_session.query(
+            RoleFunction.role_id,
+            Function.function_code,
+            Function.http_methods
+        ).join(Function, Function.id == RoleFunction.function_id).all()
+
+        matrix = {}
+        for role_id, function_code, http_methods in rows:
+            matrix.setdefault(role_id, {})[function_code] = Function.methods_to_mask(http_methods)
+
+        entries = sorted(
+            (role_id, code, mask)
+            for role_id, functions in matrix.items()
+            for code, mask in functions.items()
+        )
+        version = zlib.crc32(repr(entries).encode('utf-8'))
+
+        state = (matrix, version, time.monotonic())
+        with self._lock:
+            if generation == self._generation:
+                self._state = state
+        return state
+
+    def invalidate(self):
+        """Đánh dấu matrix cũ, lần check tiếp theo sẽ rebuild"""
+        with self._lock:
+            self._generation += 1
+            self._state = None
+
+    def _current(self, db_session):
+        state = self._state
+        if state is None or (time.monotonic() - state[2]) >= self.ttl:
+            state = self._load(db_session)
+        return state
+
+    def get_mask(self, db_session, role_id, function_code):
+        """Bitmask method của role cho function_code (0 nếu không có quyền)"""
+        matrix = self._current(db_session)[0]
+        return matrix.get(role_id, {}).get(function_code, 0)
+
+    def get_role_masks(self, db_session, role_id):
+        """Tất cả function_code -> bitmask của role (bản copy)"""
+        matrix = self._current(db_session)[0]
+        return dict(matrix.get(role_id, {}))
+
+    def get_version(self, db_session):
+        """RBAC version hiện tại (đổi mỗi khi nội dung role_functions/functions đổi)"""
+        return self._current(db_session)[1]
+
+
+permission_matrix = PermissionMatrix()
+container.invalidation_bus().subscribe(NS_RBAC, lambda namespace, key: permission_matrix.invalidate())
+
 
 class PermissionService:
-    def __init__(self, db_session):
+    def __init__(self, db_session, matrix=permission_matrix):
         self.session = db_session
+        self.matrix = matrix if Config.RBAC_CACHE_ENABLED else None
     
     def check_role_has_function(self, role_id, function_code, http_method):
         """
@@ -20,6 +113,10 @@ class PermissionService:
         Returns:
             bool: True nếu có permission, False nếu không
         """
+        if self.matrix is not None:
+            mask = self.matrix.get_mask(self.session, role_id, function_code)
+            return bool(mask & Function.method_bit(http_method))
+        
         # Tìm function theo code
         function = self.session.query(Function).filter_by(function_code=function_code).first()
         if not function:
@@ -37,6 +134,43 @@ class PermissionService:
         # Check HTTP method có trong function.http_methods không
         return function.allows_method(http_method)
     
+    def get_cached_mask(self, role_id, function_code):
+        """
+        Bitmask method của role cho function_code từ permission matrix
+        
+        Returns:
+            int nếu RBAC cache đang bật, None nếu cache bị tắt (caller phải query database)
+        """
+        if self.matrix is None:
+            return None
+        return self.matrix.get_mask(self.session, role_id, function_code)
+    
+    def get_permission_snapshot(self, role_id):
+        """
+        Snapshot permission của role để embed vào JWT
+        
+        Returns:
+            (perms, version): perms = {function_code: bitmask}, version = RBAC version hiện tại
+            None nếu RBAC cache bị tắt (không có version để đối chiếu)
+        """
+        if self.matrix is None:
+            return None
+        return self.matrix.get_role_masks(self.session, role_id), self.matrix.get_version(self.session)
+    
+    def get_token_mask(self, claims, function_code):
+        """
+        Bitmask permission lấy từ snapshot trong token
+        
+        Returns:
+            int nếu token có snapshot và rbac version còn khớp, None nếu phải check database
+        """
+        perms = claims.get('perms') if claims else None
+        if perms is None or self.matrix is None:
+            return None
+        if claims.get('rbac_v') != self.matrix.get_version(self.session):
+            return None
+        return perms.get(function_code, 0)
+    
     def get_role_functions(self, role_id):
         """Lấy tất cả functions của role"""
         role_functions = self.session.query(RoleFunction).filter_by(role_id=role_id).all()
@@ -0,0 +1,146 @@
+"""
+Product Search Service - Tìm kiếm sản phẩm tức thì (không dấu) cho bán hàng tại quầy
+"""
+import threading
+import time
+from collections import OrderedDict
+from config import Config
+from dependency_container import container
+from infrastructure.cache.invalidation import NS_PRODUCTS
+from infrastructure.search import SearchIndex
+
+# Tên sản phẩm quan trọng hơn mô tả khi xếp hạng
+PRODUCT_FIELD_WEIGHTS = {'name': 3.0, 'description': 1.0}
+
+
+class IndexedProduct:
+    """Bản sao các cột của product giữ trong index (trả kết quả không cần query lại DB)"""
+    __slots__ = ('id', 'household_id', 'category_id', 'name', 'image_url', 'description',
+                 'status', 'created_at', 'updated_at')
+
+    def __init__(self, source):
+        for attribute in self.__slots__:
+            setattr(self, attribute, getattr(source, attribute, None))
+
+
+class _HouseholdIndex:
+    __slots__ = ('index', 'loaded_at', 'stale')
+
+    def __init__(self, index):
+        self.index = index
+        self.loaded_at = time.monotonic()
+        self.stale = set()  # product_id thay đổi ở worker khác, load lại trước lần search tiếp theo
+
+
+class ProductSearchEngine:
+    """
+    Index tìm kiếm sản phẩm theo household, trong process
+
+    - Build lazily ở lần search đầu tiên của household (1 query), giữ tối đa max_households index (LRU)
+    - Worker ghi product: cập nhật index incremental ngay (upsert/remove)
+    - Worker khác: nhận sự kiện NS_PRODUCTS 'household_id:product_id' -> đánh dấu stale,
+      load lại đúng các product đó ở lần search tiếp theo
+    - Rebuild toàn bộ sau ttl giây để bù sự kiện bị mất
+    """
+    def __init__(self, max_households=None, ttl=None):
+        self.max_households = Config.PRODUCT_SEARCH_MAX_HOUSEHOLDS if max_households is None else max_households
+        self.ttl = Config.PRODUCT_SEARCH_INDEX_TTL if ttl is None else ttl
+        self._households = OrderedDict()  # household_id -> _HouseholdIndex
+        self._lock = threading.Lock()
+
+    def _build(self, household_id, loader):
+        # Cùng điểm: tên ngắn hơn (khớp sát hơn) trước
+        index = SearchIndex(PRODUCT_FIELD_WEIGHTS, rank=lambda product: len(product.name or ''))
+        index.add_many(self._item(row) for row in loader(household_id))
+        entry = _HouseholdIndex(index)
+        with self._lock:
+            self._households[household_id] = entry
+            self._households.move_to_end(household_id)
+            while len(self._households) > self.max_households:
+                self._households.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _item(product):
+        payload = IndexedProduct(product)
+        return payload.id, {'name': payload.name, 'description': payload.description}, payload
+
+    def _add(self, index, product):
+        index.add(*self._item(product))
+
+    def _get(self, household_id, loader):
+        with self._lock:
+            entry = self._households.get(household_id)
+            if entry is not None:
+                self._households.move_to_end(household_id)
+        if entry is None or (time.monotonic() - entry.loaded_at) >= self.ttl:
+            return self._build(household_id, loader)
+        if entry.stale:
+            with self._lock:
+                product_ids, entry.stale = entry.stale, set()
+            rows = loader(household_id, list(product_ids))
+            for row in rows:
+                self._add(entry.index, row)
+            for product_id in product_ids - {row.id for row in rows}:
+                entry.index.remove(product_id)
+        return entry
+
+    def search(self, household_id, query, limit, loader, status=None, category_id=None):
+        """
+        Top `limit` IndexedProduct khớp query của household, liên quan nhất trước
+
+        Args:
+            loader: loader(household_id, product_ids=None) -> rows có các cột của product
+            status, category_id: lọc thêm (None = không lọc)
+        """
+        entry = self._get(household_id, loader)
+        predicate = None
+        if status is not None or category_id is not None:
+            status_folded = status.lower() if status is not None else None
+            predicate = lambda product: (
+                (status_folded is None or (product.status or '').lower() == status_folded)
+                and (category_id is None or product.category_id == category_id)
+            )
+        return entry.index.search(query, limit, predicate=predicate)
+
+    def upsert(self, product):
+        """Cập nhật index sau khi worker này ghi product (bỏ qua nếu household chưa có index)"""
+        with self._lock:
+            entry = self._households.get(product.household_id)
+            if entry is not None:
+                entry.stale.discard(product.id)
+        if entry is not None:
+            self._add(entry.index, product)
+
+    def remove(self, household_id, product_id):
+        with self._lock:
+            entry = self._households.get(household_id)
+            if entry is not None:
+                entry.stale.discard(product_id)
+        if entry is not None:
+            entry.index.remove(product_id)
+
+    def mark_stale(self, household_id, product_id):
+        with self._lock:
+            entry = self._households.get(household_id)
+            if entry is not None:
+                entry.stale.add(product_id)
+
+    def invalidate(self, household_id=None):
+        """Bỏ index của household (hoặc tất cả), build lại ở lần search tiếp theo"""
+        with self._lock:
+            if household_id is None:
+                self._households.clear()
+            else:
+                self._households.pop(household_id, None)
+
+    def on_invalidation(self, namespace, key):
+        if key is None:
+            self.invalidate()
+            return
+        household_id, product_id = (int(part) for part in str(key).split(':'))
+        self.mark_stale(household_id, product_id)
+
+
+product_search_engine = ProductSearchEngine()
+container.invalidation_bus().subscribe(NS_PRODUCTS, product_search_engine.on_invalidation)
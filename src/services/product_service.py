@@ -2,10 +2,17 @@ from domain.models.product import Product
 from domain.models.iproduct_repository import IProductRepository
 from typing import List, Optional
 from datetime import datetime
+from domain.models.page import Page, PageRequest
+from infrastructure.cache.invalidation import COLLECTION_PRODUCTS
+from services.collection_version_service import CollectionVersion, collection_versions
+from services.product_search_service import product_search_engine
 
 class ProductService:
-    def __init__(self, repository: IProductRepository):
+    def __init__(self, repository: IProductRepository, search_engine=product_search_engine,
+                 versions=collection_versions):
         self.repository = repository
+        self.search_engine = search_engine
+        self.versions = versions
 
     def create_product(self, household_id: int, category_id: int, name: str,
                        image_url: str, description: str, status: str,
@@ -14,13 +21,34 @@ class ProductService:
         product = Product(id=None, household_id=household_id, category_id=category_id,
                           name=name, image_url=image_url, description=description,
                           status=status, created_at=created_at or now, updated_at=updated_at or now)
-        return self.repository.add(product)
+        product = self.repository.add(product)
+        self.search_engine.upsert(product)
+        return product
     
     def get_product(self, product_id: int, household_id: int) -> Optional[Product]:
         return self.repository.get_by_id(product_id, household_id)
     
     def list_products(self, household_id: int) -> List[Product]:
         return self.repository.list(household_id)
+
+    def list_products_page(self, household_id: int, page_request: PageRequest) -> Page:
+        return self.repository.list_page(household_id, page_request)
+
+    def products_version(self, household_id: int) -> CollectionVersion:
+        """Version stamp của list products (ETag/Last-Modified), không load row"""
+        return self.versions.get(COLLECTION_PRODUCTS, household_id, self.repository.version_stamp)
+
+    def iter_products(self, household_id: int, page_request: PageRequest):
+        """Toàn bộ product (filter theo page_request), đọc dần - dùng cho export streaming"""
+        return self.repository.iter_rows(household_id, page_request)
+
+    def search_products(self, household_id: int, query: str, limit: int,
+                        status: str = None, category_id: int = None) -> list:
+        """Tìm theo tên/mô tả (không dấu, khớp đầu từ), liên quan nhất trước, tối đa limit kết quả"""
+        return self.search_engine.search(
+            household_id, query, limit, self.repository.list_search_rows,
+            status=status, category_id=category_id
+        )
     
     def update_product(self, product_id: int, household_id: int, category_id: int = None,
                        name: str = None, image_url: str = None, description: str = None,
@@ -29,8 +57,11 @@ class ProductService:
         product = Product(id=product_id, household_id=household_id, category_id=category_id,
                           name=name, image_url=image_url, description=description,
                           status=status, updated_at=updated_at or now)
-        return self.repository.update(product)
+        product = self.repository.update(product)
+        self.search_engine.upsert(product)
+        return product
 
     def delete_product(self, product_id: int, household_id: int) -> None:
         self.repository.delete(product_id, household_id)
+        self.search_engine.remove(household_id, product_id)
     
\ No newline at end of file
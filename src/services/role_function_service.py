@@ -2,6 +2,7 @@ from domain.models.role_function import RoleFunction
 from domain.models.irole_function_repository import IRoleFunctionRepository
 from typing import List, Optional
 from datetime import datetime
+from domain.models.page import Page, PageRequest
 
 class RoleFunctionService:
     def __init__(self, repository: IRoleFunctionRepository):
@@ -23,6 +24,9 @@ class RoleFunctionService:
     def get_functions_by_role(self, role_id: int) -> List[RoleFunction]:
         return self.repository.get_by_role_id(role_id)
 
+    def get_functions_by_role_page(self, role_id: int, page_request: PageRequest) -> Page:
+        return self.repository.get_by_role_id_page(role_id, page_request)
+
     def remove_function_from_role(self, role_id: int, function_id: int) -> None:
         role_function = self.repository.get_by_role_and_function(role_id, function_id)
         if role_function:
@@ -0,0 +1,74 @@
+"""
+Role Registry Service - Tra cứu Role theo tên/id không cần query database mỗi lần
+"""
+import threading
+import time
+from collections import namedtuple
+from infrastructure.databases.mssql import session
+from infrastructure.models import Role
+from config import Config
+from dependency_container import container
+from infrastructure.cache.invalidation import NS_ROLES
+
+# Bản ghi role nhẹ (không phải ORM object) -> không bị lỗi "not bound to Session"
+RoleEntry = namedtuple('RoleEntry', ['id', 'role_name'])
+
+
+class RoleRegistryService:
+    """
+    Registry roles trong process
+
+    - Load tất cả roles một lần, index theo role_name (upper-case) và id
+    - invalidate() khi nhận sự kiện NS_ROLES (RoleRepository tạo/sửa/xóa role), load lại ở lần tra cứu tiếp theo
+    - Reload định kỳ theo RBAC_CACHE_TTL để nhận thay đổi từ process khác
+    - Có invalidate xen giữa lúc refresh (thread listener của bus) -> kết quả refresh vẫn dùng cho lần gọi này
+      nhưng không được lưu
+    """
+    def __init__(self, db_session=None, ttl=None):
+        self.session = db_session or session
+        self.ttl = Config.RBAC_CACHE_TTL if ttl is None else ttl
+        self._state = None  # (by_name, by_id, loaded_at)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Load lại toàn bộ roles từ database"""
+        with self._lock:
+            generation = self._generation
+        rows = self.session.query(Role.id, Role.role_name).all()
+        by_name = {}
+        by_id = {}
+        for role_id, role_name in rows:
+            entry = RoleEntry(role_id, role_name)
+            by_name[role_name.upper()] = entry
+            by_id[role_id] = entry
+        state = (by_name, by_id, time.monotonic())
+        with self._lock:
+            if generation == self._generation:
+                self._state = state
+        return state
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._state = None
+
+    def _current(self):
+        state = self._state
+        if state is None or (time.monotonic() - state[2]) >= self.ttl:
+            state = self.refresh()
+        return state
+
+    def get_by_name(self, role_name: str):
+        """Lấy role theo tên (case-insensitive), None nếu không có"""
+        if not role_name:
+            return None
+        return self._current()[0].get(role_name.upper())
+
+    def get_by_id(self, role_id: int):
+        """Lấy role theo id, None nếu không có"""
+        return self._current()[1].get(role_id)
+
+
+role_registry = RoleRegistryService()
+container.invalidation_bus().subscribe(NS_ROLES, lambda namespace, key: role_registry.invalidate())
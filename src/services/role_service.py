@@ -2,6 +2,7 @@ from domain.models.role import Role
 from domain.models.irole_repository import IRoleRepository
 from typing import List, Optional
 from datetime import datetime
+from domain.models.page import Page, PageRequest
 
 class RoleService:
     def __init__(self, repository: IRoleRepository):
@@ -19,6 +20,9 @@ class RoleService:
     def list_roles(self) -> List[Role]:
         return self.repository.list()
 
+    def list_roles_page(self, page_request: PageRequest) -> Page:
+        return self.repository.list_page(page_request)
+
     def update_role(self, role_id: int, role_name: str = None, description: str = None) -> Role:
         now = datetime.utcnow()
         role = Role(id=role_id, role_name=role_name, description=description, updated_at=now)
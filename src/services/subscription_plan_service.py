@@ -2,6 +2,68 @@ from domain.models.subscription_plan import SubscriptionPlan
 from domain.models.isubscription_plan_repository import ISubscriptionPlanRepository
 from typing import List, Optional
 from datetime import datetime
+from domain.models.page import Page, PageRequest
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from config import Config
+from dependency_container import container
+from infrastructure.cache.invalidation import NS_SUBSCRIPTION_PLANS
+
+# Response đã serialize sẵn: body (bytes), headers (dict), etag (hash của body)
+CatalogEntry = namedtuple('CatalogEntry', ['body', 'headers', 'etag'])
+
+
+class PublicPlanCatalog:
+    """
+    Catalog plan public đã serialize sẵn theo query string, trong process
+
+    - Hit: trả body bytes có sẵn -> 0 query DB, không serialize lại (traffic trang đăng ký)
+    - Admin create/update/delete plan publish NS_SUBSCRIPTION_PLANS -> mọi worker xóa catalog
+    - TTL là lưới an toàn khi mất sự kiện; tối đa max_entries query string khác nhau (LRU)
+    - Render xen giữa một lần invalidate không được cache (tránh giữ lại catalog cũ); render phải đọc primary
+    """
+    def __init__(self, ttl=None, max_entries=None, bus=None):
+        self.ttl = Config.PUBLIC_PLAN_CACHE_TTL if ttl is None else ttl
+        self.max_entries = Config.PUBLIC_PLAN_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, CatalogEntry)
+        self._generation = 0
+        self._lock = threading.Lock()
+        (bus or container.invalidation_bus()).subscribe(
+            NS_SUBSCRIPTION_PLANS, lambda namespace, key: self.invalidate()
+        )
+
+    def get(self, key, render) -> CatalogEntry:
+        """
+        Args:
+            render: () -> (body bytes, headers dict), chỉ gọi khi miss; exception không được cache
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] > now:
+                self._entries.move_to_end(key)
+                return cached[1]
+            generation = self._generation
+        body, headers = render()
+        entry = CatalogEntry(body, headers, hashlib.sha1(body).hexdigest()[:27])
+        with self._lock:
+            if generation == self._generation and self.ttl > 0:
+                self._entries[key] = (now + self.ttl, entry)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+public_plan_catalog = PublicPlanCatalog()
+
 
 class SubscriptionPlanService:
     def __init__(self, repository: ISubscriptionPlanRepository):
@@ -41,6 +103,9 @@ class SubscriptionPlanService:
     def list_plans(self) -> List[SubscriptionPlan]:
         return self.repository.list()
 
+    def list_plans_page(self, page_request: PageRequest, active_only: bool = False) -> Page:
+        return self.repository.list_page(page_request, active_only=active_only)
+
     def get_plan_by_name(self, name: str) -> Optional[SubscriptionPlan]:
         return self.repository.get_by_name(name)
 
@@ -4,11 +4,63 @@ Subscription Service - Check household có subscription active và CRUD subscrip
 from datetime import datetime, timezone
 from infrastructure.databases.mssql import session
 from infrastructure.models import Subscription  # path đúng với project
+from infrastructure.repositories.subscription_repository import SubscriptionRepository
+from domain.models.page import Page, PageRequest
+from config import Config
+from dependency_container import container
+from infrastructure.cache.invalidation import NS_SUBSCRIPTION
+
+
+class SubscriptionStatusCache:
+    """
+    Cache verdict "household có subscription active không" trên cache backend dùng chung
+
+    - Entry active hết hạn tại min(now + SUBSCRIPTION_CACHE_TTL, end_date) -> không bao giờ trả active sau end_date
+    - Entry không active hết hạn sau SUBSCRIPTION_CACHE_TTL
+    - Invalidate khi create/update/delete subscription (qua invalidation bus -> mọi worker)
+    """
+    def __init__(self, backend=None, ttl=None, bus=None):
+        backend = backend or container.cache_backend()
+        self.ttl = Config.SUBSCRIPTION_CACHE_TTL if ttl is None else ttl
+        self._cache = backend.namespace(NS_SUBSCRIPTION, versioned=True)
+        (bus or container.invalidation_bus()).subscribe(
+            NS_SUBSCRIPTION, lambda namespace, household_id: self.invalidate(household_id)
+        )
+
+    def get(self, household_id):
+        """True/False nếu còn trong cache, None nếu miss hoặc đã hết hạn"""
+        return self._cache.get(household_id)
+
+    def set(self, household_id, is_active, end_date=None):
+        ttl = self.ttl
+        if is_active and end_date is not None:
+            # Cap TTL bởi end_date (end_date lưu dạng UTC, có thể naive hoặc timezone-aware)
+            if end_date.tzinfo:
+                remaining = (end_date - datetime.now(timezone.utc)).total_seconds()
+            else:
+                remaining = (end_date - datetime.utcnow()).total_seconds()
+            ttl = min(ttl, remaining)
+        if ttl <= 0:
+            return
+        self._cache.set(household_id, bool(is_active), ttl)
+
+    def invalidate(self, household_id=None):
+        """Xóa entry của household (hoặc toàn bộ cache nếu household_id=None)"""
+        if household_id is None:
+            self._cache.bump_version()
+        else:
+            self._cache.delete(household_id)
+
+
+subscription_status_cache = SubscriptionStatusCache()
+
 
 class SubscriptionService:
-    def __init__(self, db_session=None):
+    def __init__(self, db_session=None, status_cache=subscription_status_cache, bus=None):
         # Nếu không truyền session thì dùng mặc định
         self.session = db_session or session
+        self.status_cache = status_cache if Config.SUBSCRIPTION_CACHE_ENABLED else None
+        self.bus = bus or container.invalidation_bus()
 
     # ---------------- CHECK ----------------
     def check_household_subscription_active(self, household_id: int) -> bool:
@@ -23,7 +75,18 @@ class SubscriptionService:
             # Admin không cần check subscription
             return True
         
+        if self.status_cache is not None:
+            cached = self.status_cache.get(household_id)
+            if cached is not None:
+                return cached
+        
         subscription = self.get_active_subscription(household_id)
+        if self.status_cache is not None:
+            self.status_cache.set(
+                household_id,
+                subscription is not None,
+                subscription.end_date if subscription else None
+            )
         return subscription is not None
 
     def get_active_subscription(self, household_id: int):
@@ -103,6 +166,7 @@ class SubscriptionService:
         self.session.add(subscription)
         self.session.commit()
         self.session.refresh(subscription)
+        self._invalidate_status(household_id)
         return subscription
 
     # ---------------- LIST ----------------
@@ -110,6 +174,10 @@ class SubscriptionService:
         """Lấy tất cả subscription"""
         return self.session.query(Subscription).all()
 
+    def list_subscriptions_page(self, page_request: PageRequest) -> Page:
+        """Một trang subscription (keyset), filter household_id/plan_id/is_active"""
+        return SubscriptionRepository(self.session).list_page(page_request)
+
     # ---------------- GET BY ID ----------------
     def get_subscription(self, subscription_id: int):
         """Lấy subscription theo ID"""
@@ -129,6 +197,7 @@ class SubscriptionService:
         subscription = self.get_subscription(subscription_id)
         if not subscription:
             raise ValueError("Subscription not found")
+        old_household_id = subscription.household_id
         if household_id is not None:
             subscription.household_id = household_id
         if plan_id is not None:
@@ -141,6 +210,8 @@ class SubscriptionService:
             subscription.is_active = is_active
         subscription.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)  # SQL Server không support timezone
         self.session.commit()
+        self._invalidate_status(old_household_id)
+        self._invalidate_status(subscription.household_id)
         return subscription
 
     # ---------------- DELETE ----------------
@@ -149,8 +220,10 @@ class SubscriptionService:
         subscription = self.get_subscription(subscription_id)
         if not subscription:
             raise ValueError("Subscription not found")
+        household_id = subscription.household_id
         self.session.delete(subscription)
         self.session.commit()
+        self._invalidate_status(household_id)
     
     # ---------------- OWNER METHODS (Data Isolation) ----------------
     def get_own_subscription(self, household_id: int):
@@ -237,4 +310,10 @@ class SubscriptionService:
         
         self.session.commit()
         self.session.refresh(subscription)
-        return subscription
\ No newline at end of file
+        self._invalidate_status(household_id)
+        return subscription
+    
+    def _invalidate_status(self, household_id):
+        """Xóa verdict subscription active đã cache của household (ở mọi worker) sau khi ghi"""
+        if household_id:
+            self.bus.publish(NS_SUBSCRIPTION, household_id)
@@ -1,6 +1,7 @@
 from domain.models.todo import Todo
 from domain.models.itodo_repository import ITodoRepository
 from typing import List, Optional
+from domain.models.page import Page, PageRequest
 
 class TodoService:
     def __init__(self, repository: ITodoRepository):
@@ -16,6 +17,9 @@ class TodoService:
     def list_todos(self) -> List[Todo]:
         return self.repository.list()
 
+    def list_todos_page(self, page_request: PageRequest) -> Page:
+        return self.repository.list_page(page_request)
+
     def update_todo(self, todo_id: int, title: str, description: str, status: str, created_at, updated_at) -> Todo:
         todo = Todo(id=todo_id, title=title, description=description, status=status, created_at=created_at, updated_at=updated_at)
         return self.repository.update(todo)
@@ -2,10 +2,14 @@ from domain.models.unit import Unit
 from domain.models.iunit_repository import IUnitRepository
 from typing import List, Optional
 from datetime import datetime
+from domain.models.page import Page, PageRequest
+from infrastructure.cache.invalidation import COLLECTION_UNITS
+from services.collection_version_service import CollectionVersion, collection_versions
 
 class UnitService:
-    def __init__(self, repository: IUnitRepository):
+    def __init__(self, repository: IUnitRepository, versions=collection_versions):
         self.repository = repository
+        self.versions = versions
 
     def create_unit(self, household_id: int, name: str, description: str = None, status: str = None) -> Unit:
         now = datetime.utcnow()
@@ -19,6 +23,13 @@ class UnitService:
     def list_units(self, household_id: int) -> List[Unit]:
         return self.repository.list(household_id)
 
+    def list_units_page(self, household_id: int, page_request: PageRequest) -> Page:
+        return self.repository.list_page(household_id, page_request)
+
+    def units_version(self, household_id: int) -> CollectionVersion:
+        """Version stamp của list units (ETag/Last-Modified), không load row"""
+        return self.versions.get(COLLECTION_UNITS, household_id, self.repository.version_stamp)
+
     def update_unit(self, unit_id: int, household_id: int, name: str = None, description: str = None, status: str = None) -> Unit:
         now = datetime.utcnow()
         unit = Unit(id=unit_id, household_id=household_id, name=name, description=description, status=status, updated_at=now)
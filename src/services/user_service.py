@@ -2,17 +2,17 @@ from domain.models.user import User
 from domain.models.iuser_repository import IUserRepository
 from typing import List, Optional
 from datetime import datetime
-from infrastructure.databases.mssql import session
-from infrastructure.models import Role
+from services.role_registry_service import role_registry
+from domain.models.page import Page, PageRequest
 
 class UserService:
-    def __init__(self, repository: IUserRepository):
+    def __init__(self, repository: IUserRepository, roles=role_registry):
         self.repository = repository
+        self.roles = roles
     
     def _get_role_by_name(self, role_name: str):
         """Lấy Role theo tên (case-insensitive) - Helper method"""
-        all_roles = session.query(Role).all()
-        return next((r for r in all_roles if r.role_name.upper() == role_name.upper()), None)
+        return self.roles.get_by_name(role_name)
     
     def _get_employee_role(self):
         """Lấy Employee role"""
@@ -82,7 +82,8 @@ class UserService:
         return user
 
     def list_users(self, exclude_employee: bool = False, role_id: int = None, 
-                   status: str = None, household_id: int = None, search_term: str = None) -> List[User]:
+                   status: str = None, household_id: int = None, search_term: str = None,
+                   page_request: PageRequest = None):
         """
         List users với business rules và search/filter
         
@@ -94,33 +95,50 @@ class UserService:
             status: Filter by status (Active, Inactive) - để activate/deactivate
             household_id: Filter by household_id
             search_term: Search by user_name or email (case-insensitive) - để search Owner accounts
+            page_request: Nếu có -> trả về Page (keyset pagination) thay vì List[User]
         """
-        employee_role = None
-        if exclude_employee:
-            # Business rule: Admin chỉ quản lý Admin và Owner, KHÔNG Employee
-            employee_role = self._get_employee_role()
-            if not employee_role:
-                # Nếu không tìm thấy Employee role, raise error để đảm bảo business rule
-                raise ValueError("Employee role not found in database. Cannot exclude Employee users.")
-            
-            # BUSINESS RULE VALIDATION: Admin không được filter Employee role
-            # Nếu Admin cố filter role_id = Employee, thì phải reject vì conflict
-            if role_id is not None and role_id == employee_role.id:
-                raise ValueError(f"Admin cannot filter Employee role (role_id={role_id}). Admin can only manage Admin and Owner accounts. Use role_id=1 (Admin) or role_id=2 (Owner).")
+        employee_role = self._employee_role_to_exclude(role_id) if exclude_employee else None
         
         # Use search_and_filter if có search_term, filter, hoặc exclude_employee
-        if exclude_employee or role_id or status or household_id or search_term:
+        if exclude_employee or role_id or status or household_id or search_term or page_request:
             return self.repository.search_and_filter(
                 exclude_role_id=employee_role.id if employee_role else None,
                 role_id=role_id,
                 status=status,
                 household_id=household_id,
-                search_term=search_term
+                search_term=search_term,
+                page_request=page_request
             )
         
         # Default: list all
         return self.repository.list()
 
+    def _employee_role_to_exclude(self, role_id: int = None):
+        """Employee role mà Admin list/search phải loại ra"""
+        # Business rule: Admin chỉ quản lý Admin và Owner, KHÔNG Employee
+        employee_role = self._get_employee_role()
+        if not employee_role:
+            # Nếu không tìm thấy Employee role, raise error để đảm bảo business rule
+            raise ValueError("Employee role not found in database. Cannot exclude Employee users.")
+        
+        # BUSINESS RULE VALIDATION: Admin không được filter Employee role
+        # Nếu Admin cố filter role_id = Employee, thì phải reject vì conflict
+        if role_id is not None and role_id == employee_role.id:
+            raise ValueError(f"Admin cannot filter Employee role (role_id={role_id}). Admin can only manage Admin and Owner accounts. Use role_id=1 (Admin) or role_id=2 (Owner).")
+        return employee_role
+
+    def user_facets(self, exclude_employee: bool = False, role_id: int = None, status: str = None,
+                    household_id: int = None, search_term: str = None) -> dict:
+        """Số user theo role_id / status với cùng filter và search của list_users"""
+        employee_role = self._employee_role_to_exclude(role_id) if exclude_employee else None
+        return self.repository.facet_counts(
+            exclude_role_id=employee_role.id if employee_role else None,
+            role_id=role_id,
+            status=status,
+            household_id=household_id,
+            search_term=search_term
+        )
+
     def update_user(self, user_id: int, household_id: int = None, role_id: int = None,
                    user_name: str = None, password: str = None, email: str = None,
                    description: str = None, status: str = None, updated_by: str = None,
@@ -159,6 +177,9 @@ class UserService:
 
     def get_users_by_household(self, household_id: int) -> List[User]:
         return self.repository.get_by_household_id(household_id)
+
+    def get_users_by_household_page(self, household_id: int, page_request: PageRequest) -> Page:
+        return self.repository.get_by_household_id_page(household_id, page_request)
     
     def list_users_exclude_role(self, exclude_role_id: int) -> List[User]:
         """List all users except users with specific role_id"""
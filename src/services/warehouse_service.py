@@ -2,11 +2,15 @@ from domain.models.warehouse import Warehouse
 from domain.models.iwarehouse_repository import IWarehouseRepository
 from typing import List, Optional
 from datetime import datetime
+from domain.models.page import Page, PageRequest
+from infrastructure.cache.invalidation import COLLECTION_WAREHOUSES
+from services.collection_version_service import CollectionVersion, collection_versions
 
 
 class WarehouseService:
-    def __init__(self, repository: IWarehouseRepository):
+    def __init__(self, repository: IWarehouseRepository, versions=collection_versions):
         self.repository = repository
+        self.versions = versions
 
     def create_warehouse(self, household_id: int, name: str,
                          address: str, description: str = None, status: str = None) -> Warehouse:
@@ -28,6 +32,13 @@ class WarehouseService:
     def list_warehouses(self, household_id: int) -> List[Warehouse]:
         return self.repository.list(household_id)
 
+    def list_warehouses_page(self, household_id: int, page_request: PageRequest) -> Page:
+        return self.repository.list_page(household_id, page_request)
+
+    def warehouses_version(self, household_id: int) -> CollectionVersion:
+        """Version stamp của list warehouses (ETag/Last-Modified), không load row"""
+        return self.versions.get(COLLECTION_WAREHOUSES, household_id, self.repository.version_stamp)
+
     def update_warehouse(
         self,
         warehouse_id: int,
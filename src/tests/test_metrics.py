@@ -0,0 +1,38 @@
+"""
+MetricsRegistry.render_prometheus: sample của một metric liền nhau, HELP/TYPE một lần cho mỗi metric
+
+Chạy: cd src && python -m unittest discover tests
+"""
+import unittest
+from infrastructure.metrics import MetricsRegistry, Sample
+
+
+class RenderPrometheusTest(unittest.TestCase):
+    def test_families_are_contiguous_across_labels(self):
+        def per_encoding():
+            # Cùng dạng CompressionStats.samples: các metric xen kẽ theo từng encoding
+            samples = [Sample('http_compression_skipped_small_total', 1, None, 'Skipped', 'counter')]
+            for encoding in ('br', 'gzip'):
+                labels = {'encoding': encoding}
+                samples.append(Sample('http_compression_responses_total', 2, labels, 'Responses', 'counter'))
+                samples.append(Sample('http_compression_bytes_in_total', 100, labels, 'Bytes in', 'counter'))
+            return samples
+
+        registry = MetricsRegistry()
+        registry.register(per_encoding)
+
+        lines = registry.render_prometheus().splitlines()
+        names = [line.split('{')[0] for line in lines if not line.startswith('#')]
+        families = [name for index, name in enumerate(names) if index == 0 or names[index - 1] != name]
+        self.assertEqual(len(families), len(set(families)))
+        self.assertEqual(names.count('http_compression_bytes_in_total'), 2)
+
+        type_lines = [line for line in lines if line.startswith('# TYPE ')]
+        self.assertEqual(len(type_lines), len(families))
+        for name in families:
+            type_index = lines.index(f'# TYPE {name} counter')
+            self.assertTrue(lines[type_index + 1].startswith(name + '{'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+RedisConnection (RESP) với fake server local: parse reply + đường lỗi (đọc thiếu, timeout, reply sai)
+
+Chạy: cd src && python -m unittest discover tests
+"""
+import socket
+import threading
+import unittest
+from infrastructure.cache.base import CacheError
+from infrastructure.cache.redis import RedisConnection
+
+
+class FakeRedisServer:
+    """Server 1 kết nối: mỗi lệnh nhận được trả về reply kế tiếp trong replies (bytes), None = đóng kết nối"""
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.commands = []
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.bind(('127.0.0.1', 0))
+        self._sock.listen(1)
+        self.port = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        client, _ = self._sock.accept()
+        with client:
+            for reply in self.replies:
+                self.commands.append(client.recv(65536))
+                if reply is None:
+                    return
+                client.sendall(reply)
+            client.recv(65536)  # Giữ kết nối tới khi client đóng
+
+    def close(self):
+        self._sock.close()
+        self._thread.join(timeout=2)
+
+
+class RedisConnectionTest(unittest.TestCase):
+    def connect(self, replies, socket_timeout=2.0):
+        server = FakeRedisServer(replies)
+        self.addCleanup(server.close)
+        connection = RedisConnection('127.0.0.1', server.port, socket_timeout=socket_timeout)
+        self.addCleanup(connection.close)
+        return server, connection
+
+    def test_reply_types(self):
+        server, connection = self.connect([
+            b'+PONG\r\n', b':42\r\n', b'$5\r\nhello\r\n', b'$-1\r\n', b'*2\r\n$1\r\na\r\n:1\r\n', b'$0\r\n\r\n',
+        ])
+        self.assertEqual(connection.execute('PING'), 'PONG')
+        self.assertEqual(connection.execute('INCRBY', 'k', 42), 42)
+        self.assertEqual(connection.execute('GET', 'k'), b'hello')
+        self.assertIsNone(connection.execute('GET', 'missing'))
+        self.assertEqual(connection.execute('X'), [b'a', 1])
+        self.assertEqual(connection.execute('GET', 'empty'), b'')
+        self.assertEqual(server.commands[0], b'*1\r\n$4\r\nPING\r\n')
+
+    def test_server_error_keeps_connection(self):
+        _, connection = self.connect([b'-ERR wrong type\r\n', b'+OK\r\n'])
+        with self.assertRaisesRegex(CacheError, 'wrong type'):
+            connection.execute('GET', 'k')
+        self.assertIsNotNone(connection._sock)
+        self.assertEqual(connection.execute('SET', 'k', 'v'), 'OK')
+
+    def test_truncated_bulk_string(self):
+        _, connection = self.connect([b'$10\r\nhel', None])
+        with self.assertRaises(CacheError):
+            connection.execute('GET', 'k')
+        self.assertIsNone(connection._sock)
+
+    def test_timeout_mid_bulk_string(self):
+        _, connection = self.connect([b'$10\r\nhel'], socket_timeout=0.2)
+        with self.assertRaises(CacheError):
+            connection.execute('GET', 'k')
+        self.assertIsNone(connection._sock)
+
+    def test_connection_closed(self):
+        _, connection = self.connect([None])
+        with self.assertRaises(CacheError):
+            connection.execute('PING')
+        self.assertIsNone(connection._sock)
+
+    def test_invalid_reply(self):
+        _, connection = self.connect([b'$abc\r\n'])
+        with self.assertRaises(CacheError):
+            connection.execute('GET', 'k')
+        self.assertIsNone(connection._sock)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Regression: user tạo qua API phải được commit (session theo request bỏ mọi thay đổi chưa commit ở teardown)
+
+Chạy: cd src && python -m unittest discover tests
+"""
+import datetime
+import os
+import tempfile
+import unittest
+
+_db_dir = tempfile.mkdtemp()
+os.environ.setdefault('DATABASE_URI', f'sqlite:///{os.path.join(_db_dir, "test.db")}')
+os.environ.setdefault('DB_AUTO_MIGRATE', 'True')
+os.environ.setdefault('LOG_FILE', '')
+os.environ.setdefault('ACCESS_LOG_FILE', '')
+os.environ.setdefault('ACCESS_LOG_ENABLED', 'False')
+
+
+class UserPersistenceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not os.environ['DATABASE_URI'].startswith('sqlite'):
+            raise unittest.SkipTest('Cần database sqlite tạm (DATABASE_URI)')
+        import app as app_module
+        from infrastructure.databases.mssql import session
+        from infrastructure.models import Household, Subscription, SubscriptionPlan, User
+        from scripts import seed_auth_data
+        from services.permission_service import permission_matrix
+        from services.role_registry_service import role_registry
+
+        cls.app = app_module.create_app()
+        seed_auth_data.seed_roles()
+        seed_auth_data.seed_functions()
+        seed_auth_data.seed_role_functions()
+        permission_matrix.invalidate()
+        role_registry.invalidate()
+
+        household = Household(name='H1', status='Active')
+        session.add(household)
+        session.flush()
+        cls.household_id = household.id
+        owner_role = role_registry.get_by_name('OWNER')
+        admin = User(user_name='admin', password='x', status='Active', role_id=role_registry.get_by_name('ADMIN').id)
+        session.add(admin)
+        session.flush()
+        plan = SubscriptionPlan(name='Basic', user_id=admin.id, status='active', billing_cycle='monthly')
+        session.add(plan)
+        session.flush()
+        now = datetime.datetime.utcnow()
+        session.add(Subscription(plan_id=plan.id, household_id=household.id, start_date=now,
+                                 end_date=now + datetime.timedelta(days=30), is_active=True))
+        session.add(User(user_name='owner', password='x', status='Active', role_id=owner_role.id,
+                         household_id=household.id))
+        session.commit()
+        session.remove()
+        cls.owner_role_id = owner_role.id
+        cls.employee_role_id = role_registry.get_by_name('EMPLOYEE').id
+        cls.client = cls.app.test_client()
+
+    def login(self, user_name):
+        response = self.client.post('/api/auth/login', json={'user_name': user_name, 'password': 'x'})
+        self.assertEqual(response.status_code, 200, response.get_json())
+        return {'Authorization': 'Bearer ' + response.get_json()['token']}
+
+    def test_admin_created_user_is_persisted(self):
+        headers = self.login('admin')
+        response = self.client.post('/api/admin/users/', headers=headers, json={
+            'role_id': self.owner_role_id, 'user_name': 'owner_new', 'password': 'secret', 'status': 'Active',
+        })
+        self.assertEqual(response.status_code, 201, response.get_json())
+        user_id = response.get_json()['id']
+
+        response = self.client.get(f'/api/admin/users/{user_id}', headers=headers)
+        self.assertEqual(response.status_code, 200, response.get_json())
+        self.assertEqual(response.get_json()['user_name'], 'owner_new')
+
+    def test_owner_created_employee_is_persisted(self):
+        headers = self.login('owner')
+        response = self.client.post('/api/owner/employees/', headers=headers, json={
+            'role_id': self.employee_role_id, 'user_name': 'employee_new', 'password': 'secret', 'status': 'Active',
+        })
+        self.assertEqual(response.status_code, 201, response.get_json())
+        employee_id = response.get_json()['id']
+
+        response = self.client.get(f'/api/owner/employees/{employee_id}', headers=headers)
+        self.assertEqual(response.status_code, 200, response.get_json())
+        self.assertEqual(response.get_json()['user_name'], 'employee_new')
+
+
+if __name__ == '__main__':
+    unittest.main()
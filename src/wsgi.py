@@ -0,0 +1,9 @@
+"""
+WSGI entry point cho production server
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+from app import create_app
+
+app = create_app()